@@ -25,6 +25,7 @@ from .main import main
 
 # Data Handling API
 from ._working_directory import working_directory
+from ._normalize import register_normalizer
 from ._vendor.repeatingcontainer import RepeatingContainer
 
 #############################################
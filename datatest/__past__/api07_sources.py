@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
 from .load_csv import load_csv
+from .load_csv import attach_cache
 from .temptable import (
     load_data,
     new_table_name,
@@ -955,6 +956,7 @@ class CsvSource(SqliteBase):
 
         # Create temporary SQLite table object.
         connection = DEFAULT_CONNECTION
+        attach_cache(connection)
         cursor = connection.cursor()
         with savepoint(cursor):
             table = new_table_name(cursor)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import csv
 import io
+import mmap
+import os
 import sys
 import warnings
 
@@ -24,9 +26,14 @@ if sys.version_info[0] >= 3:
         # that the csv-helper functions have the same signature.
 
     def _from_csv_path(path, encoding, **kwds):
-        with open(path, 'rt', encoding=encoding, newline='') as f:
-            for row in csv.reader(f, **kwds):
-                yield row
+        if _is_newline_aligned(encoding) and os.path.isfile(path):
+            with open(path, 'rb') as f:
+                for row in csv.reader(_iter_mmap_lines(f, encoding), **kwds):
+                    yield row
+        else:
+            with open(path, 'rt', encoding=encoding, newline='') as f:
+                for row in csv.reader(f, **kwds):
+                    yield row
 
 else:
     import codecs
@@ -112,6 +119,50 @@ else:
                 yield row
 
 
+CSV_CHUNK_SIZE = 4 * 1024 * 1024  # Bytes to decode at a time.
+
+
+def _is_newline_aligned(encoding):
+    """Return True if text in the given *encoding* can be split into
+    lines at newline bytes (e.g., ASCII-compatible encodings like
+    UTF-8 and Latin-1) without decoding it first.
+    """
+    if not encoding:
+        return False
+    try:
+        return u'\r\n"'.encode(encoding) == b'\r\n"'
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _iter_mmap_chunks(f, encoding, chunk_size):
+    size = os.fstat(f.fileno()).st_size
+    if not size:
+        return  # <- EXIT! (Empty files can not be memory-mapped.)
+
+    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        start = 0
+        while start < size:
+            end = mapped.find(b'\n', min(start + chunk_size, size) - 1)
+            end = size if end == -1 else end + 1
+            text = mapped[start:end].decode(encoding)
+            yield io.StringIO(text, newline='')
+            start = end
+    finally:
+        mapped.close()
+
+
+def _iter_mmap_lines(f, encoding, chunk_size=None):
+    """Memory-map the regular binary file *f* and return an iterator
+    of its lines (with line endings left untranslated). The file is
+    decoded in large chunks that end on a newline byte so a decoded
+    chunk never splits a line or a multi-byte character.
+    """
+    chunks = _iter_mmap_chunks(f, encoding, chunk_size or CSV_CHUNK_SIZE)
+    return chain.from_iterable(chunks)
+
+
 ########################################################################
 # Get Reader.
 ########################################################################
@@ -1,19 +1,166 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import os
 import warnings
 from .._utils import exhaustible
 from .._utils import seekable
 from .._utils import file_types
+from .._utils import string_types
 from .get_reader import get_reader
 from .temptable import load_data
 from .temptable import savepoint
+from .temptable import table_exists
+from .temptable import new_table_name
+from .temptable import normalize_names
+from .temptable import create_table
+from .temptable import alter_table
+from .temptable import get_columns
+from .temptable import drop_table
 
 
 preferred_encoding = 'utf-8'
 fallback_encoding = ['latin-1']
 
+# Path of an optional, persistent database used to cache the contents
+# of CSV files between sessions. Caching is disabled when set to None.
+cache_path = None
+_CACHE_SCHEMA = 'datatest_cache'
+
+
+def attach_cache(connection):
+    """Attach the cache database at *cache_path* (if set) to the
+    given *connection*. Since SQLite can not attach a database inside
+    of a transaction, this should be called before any savepoints are
+    opened.
+    """
+    global cache_path
+
+    if not cache_path or getattr(connection, 'in_transaction', False):
+        return  # <- EXIT!
+
+    if _cache_is_attached(connection):
+        return  # <- EXIT!
+
+    connection.execute(
+        'ATTACH DATABASE ? AS {0}'.format(_CACHE_SCHEMA), (cache_path,))
+    connection.execute("""
+        CREATE TABLE IF NOT EXISTS {0}.csv_files (
+            tbl TEXT PRIMARY KEY,
+            path TEXT,
+            size INTEGER,
+            mtime INTEGER,
+            digest TEXT,
+            params TEXT
+        )
+    """.format(_CACHE_SCHEMA))
+
+
+def detach_cache(connection):
+    """Detach the cache database from the given *connection*."""
+    if _cache_is_attached(connection):
+        connection.execute('DETACH DATABASE {0}'.format(_CACHE_SCHEMA))
+
+
+def _cache_is_attached(connection):
+    databases = connection.execute('PRAGMA database_list').fetchall()
+    return any(row[1] == _CACHE_SCHEMA for row in databases)
+
+
+def _get_file_digest(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _copy_table(cursor, source, table, schema=None):
+    """Insert all records from the *source* table (in the given
+    *schema*) into *table*, creating or altering *table* as needed.
+    """
+    if schema:
+        cursor.execute('PRAGMA {0}.table_info({1})'.format(schema, source))
+        columns = [x[1] for x in cursor]
+        source = '{0}.{1}'.format(schema, source)
+    else:
+        columns = get_columns(cursor, source)
+
+    if table_exists(cursor, table):
+        alter_table(cursor, table, columns)
+    else:
+        create_table(cursor, table, columns)
+
+    column_list = ', '.join(normalize_names(columns))
+    statement = 'INSERT INTO {0} ({1}) SELECT {1} FROM {2}'
+    cursor.execute(statement.format(normalize_names(table), column_list, source))
+
+
+def _load_csv_cached(cursor, table, path, encoding, **kwds):
+    """Load *path* into *table* using the attached cache database.
+    Files are matched by their path, size, modification time, content
+    hash, and loading parameters. Unchanged files are copied from the
+    cache, other files are loaded as usual and then added to the cache.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    mtime = getattr(stat, 'st_mtime_ns', None) or int(stat.st_mtime * 1e9)
+    key = [stat.st_size, mtime, _get_file_digest(path),
+           repr((encoding, sorted(kwds.items())))]
+
+    cursor.execute(
+        'SELECT tbl, size, mtime, digest, params FROM {0}.csv_files '
+        'WHERE path=?'.format(_CACHE_SCHEMA),
+        (path,),
+    )
+    cached = cursor.fetchall()
+    for row in cached:
+        if list(row[1:]) == key:
+            with savepoint(cursor):
+                _copy_table(cursor, row[0], table, schema=_CACHE_SCHEMA)
+            return  # <- EXIT!
+
+    with savepoint(cursor):
+        staging_table = new_table_name(cursor)
+        _load_csv(cursor, staging_table, path, encoding, **kwds)
+        if not table_exists(cursor, staging_table):
+            return  # <- EXIT! (File contains no data.)
+
+        for row in cached:  # Remove outdated copies of file.
+            cursor.execute('DROP TABLE IF EXISTS {0}.{1}'.format(_CACHE_SCHEMA, row[0]))
+        cursor.execute(
+            'DELETE FROM {0}.csv_files WHERE path=?'.format(_CACHE_SCHEMA),
+            (path,),
+        )
+
+        cache_table = 'csv_{0}_{1}'.format(key[2][:16], staging_table)
+        cursor.execute('CREATE TABLE {0}.{1} AS SELECT * FROM {2}'.format(
+            _CACHE_SCHEMA, cache_table, staging_table))
+        cursor.execute(
+            'INSERT INTO {0}.csv_files VALUES (?, ?, ?, ?, ?, ?)'.format(_CACHE_SCHEMA),
+            [cache_table, path] + key,
+        )
+
+        _copy_table(cursor, staging_table, table)
+        drop_table(cursor, staging_table)
+
 
 def load_csv(cursor, table, csvfile, encoding=None, **kwds):
-    """Load *csvfile* and insert data into *table*."""
+    """Load *csvfile* and insert data into *table*.
+
+    If *csvfile* is a file path and the cache database has been
+    attached to the cursor's connection (see :func:`attach_cache`),
+    files that are unchanged since they were last loaded are copied
+    from the cache rather than parsed again.
+    """
+    if isinstance(csvfile, string_types) \
+            and os.path.isfile(csvfile) \
+            and _cache_is_attached(cursor.connection):
+        _load_csv_cached(cursor, table, csvfile, encoding, **kwds)
+    else:
+        _load_csv(cursor, table, csvfile, encoding, **kwds)
+
+
+def _load_csv(cursor, table, csvfile, encoding=None, **kwds):
     global preferred_encoding
     global fallback_encoding
 
@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
+import array
+import atexit
+try:
+    import builtins as _builtins
+except ImportError:
+    import __builtin__ as _builtins  # Python 2.x
 import csv
 import inspect
+import operator
+import os
+import tempfile
+import threading
 import warnings
 
 try:
@@ -13,6 +23,7 @@ from glob import glob
 from numbers import Number
 
 from ..._compatibility.builtins import *
+from ..._compatibility.collections import Counter
 from ..._compatibility.collections import namedtuple
 from ..._compatibility.collections.abc import (
     Collection,
@@ -44,6 +55,7 @@ from ..._utils import (
 )
 from ..get_reader import get_reader
 from ..load_csv import load_csv
+from ..load_csv import attach_cache
 from ..temptable import (
     load_data,
     new_table_name,
@@ -62,15 +74,109 @@ except NameError:
     # If not available, use as an alias for OSError.
     FileNotFoundError = OSError
 
-# For the following database connection, the synchronous flag is
-# set to "OFF" for faster insertions and commits. Since the database
-# is temporary, long-term integrity should not be a concern--in the
-# unlikely event of data corruption, it should be entirely acceptable
-# to simply rebuild the temporary tables.
-DEFAULT_CONNECTION = sqlite3.connect('')  # <- Using '' makes a temp file.
-DEFAULT_CONNECTION.execute('PRAGMA synchronous=OFF')
-DEFAULT_CONNECTION.isolation_level = None  # <- Run in 'autocommit' mode.
-_user_function_name_gen = ('FUNC{0}'.format(x) for x in itertools.count())
+class _PooledConnection(sqlite3.Connection):
+    """A connection to the database shared by a ConnectionPool."""
+    temporary_tables = False  # <- Tables must be visible to all threads.
+
+
+class ConnectionPool(object):
+    """A thread-safe stand-in for an SQLite connection. Each thread
+    gets its own connection to a single, shared temp-file database so
+    that tables loaded in one thread can be queried from any other.
+
+    Attributes and methods not defined here are looked up on the
+    current thread's connection. Functions and aggregates registered
+    with :meth:`create_function` and :meth:`create_aggregate` are
+    available to every connection in the pool.
+
+    Writes are serialized with *write_lock* (which is held by any
+    :class:`savepoint` opened on a pooled connection) while reads
+    can run concurrently.
+    """
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix='datatest-', suffix='.sqlite3')
+        os.close(fd)
+        self.write_lock = threading.RLock()
+        self._local = threading.local()
+        self._connections = []
+        self._registered = []  # <- List of (method_name, args) tuples.
+
+    def _connect(self):
+        # For these connections, the synchronous flag is set to "OFF"
+        # for faster insertions and commits and the database uses
+        # write-ahead logging so that readers do not block the writer
+        # (or each other). With a rollback journal (even one kept in
+        # memory), a pooled connection's reads would block writes from
+        # other threads. If WAL is not supported, the journal is kept
+        # in memory instead. Since the database is temporary, long-term
+        # integrity should not be a concern--in the unlikely event of
+        # data corruption, it should be entirely acceptable to simply
+        # rebuild the tables.
+        connection = sqlite3.connect(
+            self.path,
+            timeout=60.0,
+            factory=_PooledConnection,
+            check_same_thread=False,  # <- Results can be passed between threads.
+        )
+        connection.isolation_level = None  # <- Run in 'autocommit' mode.
+        connection.execute('PRAGMA synchronous=OFF')
+        journal_mode = connection.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+        if journal_mode.lower() != 'wal':
+            connection.execute('PRAGMA journal_mode=MEMORY')
+        connection.write_lock = self.write_lock
+        connection.registered_count = 0
+        self._connections.append(connection)
+        self._local.connection = connection
+        return connection
+
+    def connection(self):
+        """Return the connection used by the current thread."""
+        try:
+            connection = self._local.connection
+        except AttributeError:
+            connection = self._connect()
+
+        registered = self._registered
+        if connection.registered_count < len(registered):
+            for method_name, args in registered[connection.registered_count:]:
+                getattr(connection, method_name)(*args)
+            connection.registered_count = len(registered)
+        return connection
+
+    def cursor(self, *args, **kwds):
+        return self.connection().cursor(*args, **kwds)
+
+    def execute(self, *args, **kwds):
+        return self.connection().execute(*args, **kwds)
+
+    def create_function(self, *args):
+        self._registered.append(('create_function', args))
+        self.connection()  # <- Registers with current connection.
+
+    def create_aggregate(self, *args):
+        self._registered.append(('create_aggregate', args))
+        self.connection()  # <- Registers with current connection.
+
+    def close(self):
+        """Close all connections and remove the database files."""
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._local = threading.local()
+        for path in (self.path, self.path + '-wal', self.path + '-shm'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def __getattr__(self, name):
+        return getattr(self.connection(), name)
+
+
+DEFAULT_CONNECTION = ConnectionPool()
+atexit.register(DEFAULT_CONNECTION.close)
+_user_function_numbers = itertools.count()  # <- Safe to share between threads.
+_user_function_lock = threading.Lock()
 
 
 PY2 = sys.version_info[0] == 2
@@ -248,6 +354,56 @@ class Result(Iterator):
 
         return evaluation_type(self)
 
+    def to_array(self, typecode='d', ndarray=False):
+        """Evaluate the iterator and return its values as a columnar
+        :py:class:`array.array` of the given *typecode*. If *ndarray*
+        is True, a NumPy array with the equivalent dtype is returned
+        instead (which can be handled by datatest's vectorized
+        validation paths)::
+
+            result = select('amount')
+            amounts = result.to_array('d')  # <- Returns array('d', [...]).
+
+        Values are converted with :py:class:`float` for the 'f' and
+        'd' typecodes and with :py:class:`int` for integer typecodes,
+        so numeric text (as loaded from CSV files) is accepted. Values
+        are passed from the underlying iterator into the array without
+        building an intermediate list.
+
+        When evaluating a :py:class:`dict` or other mapping type, a
+        mapping of arrays is returned. Values that are not iterable
+        (for example, the results of :meth:`Query.sum`) are returned
+        unchanged.
+        """
+        evaluation_type = self.evaluation_type
+        if issubclass(evaluation_type, Mapping):
+            def func(obj):
+                if isinstance(obj, Result) or nonstringiter(obj):
+                    return _make_array(obj, typecode, ndarray)
+                return obj
+
+            return evaluation_type((k, func(v)) for k, v in self)
+
+        return _make_array(self.__wrapped__, typecode, ndarray)
+
+
+def _make_array(iterable, typecode, ndarray=False):
+    """Return an array.array (or a NumPy array, if *ndarray* is True)
+    containing the values of *iterable* converted for *typecode*.
+    """
+    while isinstance(iterable, Result):
+        iterable = iterable.__wrapped__
+
+    if typecode in ('f', 'd'):
+        iterable = map(float, iterable)
+    elif typecode in ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'L', 'q', 'Q'):
+        iterable = map(int, iterable)
+
+    if ndarray:
+        import numpy
+        return numpy.fromiter(iterable, dtype=typecode)
+    return array.array(typecode, iterable)
+
 
 def _get_evaluation_type(obj, default=list):
     """Return object's evaluation_type property. If the object does
@@ -533,6 +689,207 @@ def _sqlite_distinct(iterable):
     return dodistinct(iterable)
 
 
+def _get_sqlite_function(steps):
+    """Return the name of the SQLite aggregate function that matches
+    the first of the given execution *steps* or None if there is no
+    matching function.
+    """
+    if not steps or steps[0][0] != _apply_to_data:
+        return None
+    func_dict = {
+        _sqlite_sum: 'SUM',
+        _sqlite_count: 'COUNT',
+        _sqlite_avg: 'AVG',
+        _sqlite_min: 'MIN',
+        _sqlite_max: 'MAX',
+    }
+    return func_dict.get(steps[0][1][0], None)
+
+
+def _get_group_function(steps):
+    """Return a function of one argument (a list of values) that
+    matches the first of the given execution *steps* when the step
+    can be run as an SQLite aggregate or return None if it can not.
+    """
+    if not steps:
+        return None
+    function, args, _ = steps[0]
+    if function == _reduce_data:
+        return _GroupReducer(args[0], args[2])
+    if function == _apply_data and args[0] in _group_builtins:
+        return args[0]
+    return None
+
+
+# Built-in functions that can be applied to each group's list of
+# values. On older versions of Python, min() and max() are replaced
+# by compatibility wrappers so both versions are included.
+_group_builtins = (
+    sum, min, max, _builtins.sum, _builtins.min, _builtins.max,
+)
+
+
+def _get_distinct_columns(columns):
+    """Return normalized *columns* with the value container replaced
+    by a set (selecting DISTINCT values) or None if the values are
+    not taken from a single column.
+    """
+    if isinstance(columns, Mapping):
+        key, value = tuple(columns.items())[0]
+        if not isinstance(next(iter(value)), str):
+            return None
+        return {key: set(value)}
+
+    if not isinstance(next(iter(columns)), str):
+        return None
+    return set(columns)
+
+
+def _can_select_reduce(columns):
+    """Return True if the values of *columns* can be collected by an
+    SQLite aggregate (a set of values can only be selected DISTINCT
+    from a single column).
+    """
+    _, value = _parse_columns(columns)
+    if isinstance(value, Set):
+        return isinstance(next(iter(value)), str)
+    return True
+
+
+def _is_order_insensitive(columns, steps):
+    """Return True if the order of selected values does not change
+    the result of the given *columns* and following execution *steps*.
+    """
+    if isinstance(columns, Set):
+        return True
+    if _get_sqlite_function(steps):
+        return True
+    distinct_step = (_sqlite_distinct, (RESULT_TOKEN,), {})
+    return steps[:1] == (distinct_step,) and bool(_get_sqlite_function(steps[1:2]))
+
+
+def _is_sql_literal(value):
+    """Return True if *value* matches the same elements using Python
+    equality as it does in an SQLite "=" comparison.
+    """
+    if isinstance(value, bool):
+        return False  # <- True and False are truth-value predicates.
+    return isinstance(value, (str, int, float))
+
+
+def _get_filter_where(columns, predicate, order_matters=True):
+    """Return a dictionary of *where* keywords that selects the same
+    values as filtering the values of *columns* with *predicate*.
+    Returns None if the filter can not be pushed down into a WHERE
+    clause.
+
+    Filters are only pushed down for non-mapping selections (when
+    filtering a mapping, groups with no matching values are kept
+    as empty groups). Set predicates are only used when *order_matters*
+    is False because an index can change the order of an IN query.
+    """
+    if isinstance(columns, Mapping):
+        return None
+
+    inner = next(iter(columns))
+    if isinstance(inner, str):
+        fields = (inner,)
+        values = (predicate,)
+    elif (type(predicate) is tuple
+            and len(predicate) == len(inner)
+            and len(set(inner)) == len(inner)):
+        fields = inner
+        values = predicate
+    else:
+        return None
+
+    where = {}
+    for field, value in zip(fields, values):
+        if value is Ellipsis:
+            continue  # <- Wildcard matches all values.
+        if _is_sql_literal(value):
+            where[field] = value
+        elif (isinstance(value, Set)
+                and not order_matters
+                and value
+                and all(_is_sql_literal(x) for x in value)):
+            where[field] = value
+        else:
+            return None
+    return where or None
+
+
+class _GroupReducer(object):
+    """A callable that reduces a list of values with *function* (and
+    optional *initializer_factory*) the same way as Query.reduce().
+    Instances compare equal when their arguments are the same so they
+    can be used to look up registered SQLite aggregates.
+    """
+    def __init__(self, function, initializer_factory=None):
+        self.function = function
+        self.initializer_factory = initializer_factory
+
+    def __call__(self, values):
+        if self.initializer_factory is None:
+            return functools.reduce(self.function, values)
+        initializer = self.initializer_factory()
+        return functools.reduce(self.function, values, initializer)
+
+    def __eq__(self, other):
+        if not isinstance(other, _GroupReducer):
+            return NotImplemented
+        return (self.function == other.function
+                and self.initializer_factory == other.initializer_factory)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self):
+        return hash((self.function, self.initializer_factory))
+
+    def __repr__(self):
+        function_repr = getattr(self.function, '__name__', repr(self.function))
+        return '{0}({1})'.format(self.__class__.__name__, function_repr)
+
+
+def _make_group_aggregate(function, make_value=None):
+    """Return a class for use with SQLite's create_aggregate() that
+    collects the values of each group and applies *function* to the
+    list of values. If given, *make_value* is called with a tuple of
+    each row's arguments to build the value.
+
+    Since results can be any Python object, they are not returned to
+    SQLite directly. Instead, they are appended to the class's
+    thread-local *results* list (which must be assigned before
+    executing a query) and the aggregate returns the index of the
+    result. Exceptions are stored the same way so they can be re-raised
+    outside of SQLite.
+    """
+    class GroupAggregate(object):
+        local = threading.local()  # <- Holds the *results* list.
+
+        def __init__(self):
+            self.values = []
+            if make_value is None:
+                self.step = self.values.append  # <- Fast path for one column.
+
+        def step(self, *row):
+            self.values.append(make_value(row))
+
+        def finalize(self):
+            results = GroupAggregate.local.results
+            try:
+                results.append((True, function(self.values)))
+            except Exception as err:
+                results.append((False, err))
+            return len(results) - 1
+
+    return GroupAggregate
+
+
 ########################################################
 # Functions to validate and parse query 'select' syntax.
 ########################################################
@@ -867,47 +1224,89 @@ class Query(object):
 
     @staticmethod
     def _optimize(execution_plan):
+        """Return an optimized version of the given *execution_plan*
+        or None if no optimization can be made. The following rules
+        are applied in order:
+
+        1. Filter steps with literal or set predicates are pushed
+           down into the SQL WHERE clause.
+        2. A distinct step followed by an aggregate step is replaced
+           with an aggregate of DISTINCT values (e.g., a COUNT of
+           DISTINCT values).
+        3. A distinct step followed by a reduce step (or an apply step
+           using sum, min, or max) is run as a registered SQLite
+           aggregate of DISTINCT values.
+        4. An aggregate step is replaced with an SQL aggregate (values
+           in mappings are grouped with GROUP BY).
+        5. A reduce step (or an apply step using sum, min, or max) is
+           run as a registered SQLite aggregate.
+        6. A distinct step is replaced with SELECT DISTINCT.
+        """
         try:
             step_0 = execution_plan[0]
             step_1 = execution_plan[1]
-            step_2 = execution_plan[2]
-            remaining_steps = execution_plan[3:]
         except IndexError:
             return None  # <- EXIT!
 
         if step_0 != (getattr, (RESULT_TOKEN, '_select'), {}):
             return None  # <- EXIT!
 
-        if step_2[0] == _apply_to_data:
-            func_dict = {
-                _sqlite_sum: 'SUM',
-                _sqlite_count: 'COUNT',
-                _sqlite_avg: 'AVG',
-                _sqlite_min: 'MIN',
-                _sqlite_max: 'MAX',
-            }
-            py_function = step_2[1][0]
-            sqlite_function = func_dict.get(py_function, None)
-            if sqlite_function:
-                func_1, args_1, kwds_1 = step_1
-                args_1 = (sqlite_function,) + args_1  # <- Add SQL function
-                optimized_steps = (                   #    as 1st arg.
-                    (getattr, (RESULT_TOKEN, '_select_aggregate'), {}),
-                    (func_1, args_1, kwds_1),
-                )
-            else:
-                optimized_steps = ()
-        elif step_2 == (_sqlite_distinct, (RESULT_TOKEN,), {}):
-            optimized_steps = (
-                (getattr, (RESULT_TOKEN, '_select_distinct'), {}),
-                step_1,
-            )
+        func_1, args_1, kwds_1 = step_1
+        columns, = args_1
+        where = dict(kwds_1)
+        remaining_steps = execution_plan[2:]
+
+        # Rule 1: Push-down filters.
+        while remaining_steps and remaining_steps[0][0] == _filter_data:
+            order_matters = not _is_order_insensitive(columns, remaining_steps[1:])
+            predicate = remaining_steps[0][1][0]
+            filter_where = _get_filter_where(columns, predicate, order_matters)
+            if not filter_where or any(k in where for k in filter_where):
+                break
+            where.update(filter_where)
+            remaining_steps = remaining_steps[1:]
+
+        distinct_step = (_sqlite_distinct, (RESULT_TOKEN,), {})
+        is_distinct = remaining_steps[:1] == (distinct_step,)
+        distinct_columns = _get_distinct_columns(columns) if is_distinct else None
+
+        if distinct_columns and _get_sqlite_function(remaining_steps[1:2]):
+            # Rule 2: Aggregate of distinct values.
+            method = '_select_aggregate'
+            args = (_get_sqlite_function(remaining_steps[1:2]), distinct_columns)
+            remaining_steps = remaining_steps[2:]
+        elif distinct_columns and _get_group_function(remaining_steps[1:2]):
+            # Rule 3: Reduce or apply to distinct values.
+            method = '_select_reduce'
+            args = (_get_group_function(remaining_steps[1:2]), distinct_columns)
+            remaining_steps = remaining_steps[2:]
+        elif _get_sqlite_function(remaining_steps[:1]):
+            # Rule 4: Aggregate.
+            method = '_select_aggregate'
+            args = (_get_sqlite_function(remaining_steps[:1]), columns)
+            remaining_steps = remaining_steps[1:]
+        elif (_get_group_function(remaining_steps[:1])
+                and _can_select_reduce(columns)):
+            # Rule 5: Reduce or apply.
+            method = '_select_reduce'
+            args = (_get_group_function(remaining_steps[:1]), columns)
+            remaining_steps = remaining_steps[1:]
+        elif is_distinct:
+            # Rule 6: Distinct.
+            method = '_select_distinct'
+            args = (columns,)
+            remaining_steps = remaining_steps[1:]
+        elif where != kwds_1:
+            method = '_select'  # <- Only filters were pushed down.
+            args = (columns,)
         else:
-            optimized_steps = ()
+            return None  # <- EXIT!
 
-        if optimized_steps:
-            return optimized_steps + remaining_steps
-        return None
+        optimized_steps = (
+            (getattr, (RESULT_TOKEN, method), {}),
+            (func_1, args, where),
+        )
+        return optimized_steps + tuple(remaining_steps)
 
     def execute(self, source=None, optimize=True):
         """A Query can be executed to return a single value or an
@@ -952,6 +1351,15 @@ class Query(object):
             return result.fetch()
         return result
 
+    def to_array(self, typecode='d', ndarray=False):
+        """Executes query and returns the result as a columnar array
+        (see :meth:`Result.to_array`).
+        """
+        result = self.execute()
+        if isinstance(result, Result):
+            return result.to_array(typecode, ndarray)
+        return result
+
     def _explain(self, optimize=True, file=sys.stdout):
         """A convenience method primarily intended to help when
         debugging and developing execution plan optimizations.
@@ -1118,12 +1526,22 @@ class Select(object):
        :figwidth: 75%
        :alt: Data can be loaded from multiple files.
     """
+    auto_index = None
+    """When set to an integer, an index is created automatically once
+    the same combination of filter and grouping columns has been used
+    by that many queries (if the query plan shows the data would
+    otherwise be scanned). See :meth:`suggest_indexes` for details.
+    """
+
     def __init__(self, objs=None, *args, **kwds):
         """Initialize self."""
         self._connection = DEFAULT_CONNECTION
         self._user_function_dict = dict()  # User-defined SQLite functions.
+        self._user_aggregate_dict = dict()  # User-defined SQLite aggregates.
         self._table = None  # Table name.
         self._obj_strings = []  # Strings for repr().
+        self._index_usage = Counter()  # Column combinations used by queries.
+        self._index_checked = set()  # Combinations checked by auto_index.
         if objs:
             try:
                 self.load_data(objs, *args, **kwds)
@@ -1162,6 +1580,7 @@ class Select(object):
         else:
             obj_list = objs
 
+        attach_cache(self._connection)
         cursor = self._connection.cursor()
         with savepoint(cursor):
             table = self._table or new_table_name(cursor)
@@ -1336,8 +1755,12 @@ class Select(object):
         try:
             return self._user_function_dict[func_key]
         except KeyError:
-            self._create_user_function(func, func_key)
-            return self._user_function_dict[func_key]
+            pass
+
+        with _user_function_lock:
+            if func_key not in self._user_function_dict:
+                self._create_user_function(func, func_key)
+        return self._user_function_dict[func_key]
 
     def _create_user_function(self, func, func_key=None):
         """Register *func* with the SQLite connection using an
@@ -1359,15 +1782,45 @@ class Select(object):
             def func(x):
                 return _func(x)
 
-        func_name = next(_user_function_name_gen)
+        func_name = 'FUNC{0}'.format(next(_user_function_numbers))
         self._connection.create_function(func_name, 1, func)  # <- Register!
         self._user_function_dict[func_key] = func_name
 
+    def _get_user_aggregate(self, function, inner_type, argcount):
+        """Return a 2-tuple containing the name and class of a SQLite
+        aggregate that applies *function* to groups of values. The
+        aggregate is created and registered if it does not exist.
+        """
+        try:
+            func_key = hash((function, inner_type, argcount))
+        except TypeError:
+            func_key = (id(function), inner_type, argcount)
+
+        try:
+            return self._user_aggregate_dict[func_key]
+        except KeyError:
+            pass
+
+        if issubclass(inner_type, str):
+            make_value = None
+        elif issubclass(inner_type, tuple) and hasattr(inner_type, '_fields'):
+            make_value = lambda row: inner_type(*row)  # If namedtuple.
+        else:
+            make_value = inner_type
+
+        with _user_function_lock:
+            if func_key not in self._user_aggregate_dict:
+                aggregate_class = _make_group_aggregate(function, make_value)
+                aggregate_name = 'FUNC{0}'.format(next(_user_function_numbers))
+                self._connection.create_aggregate(aggregate_name, argcount, aggregate_class)
+                self._user_aggregate_dict[func_key] = (aggregate_name, aggregate_class)
+        return self._user_aggregate_dict[func_key]
+
     def _format_result_group(self, columns, cursor):
         outer_type = type(columns)
         inner_type = type(next(iter(columns)))
         if issubclass(inner_type, str):
-            result = (row[0] for row in cursor)
+            result = map(operator.itemgetter(0), cursor)
         elif issubclass(inner_type, tuple) and hasattr(inner_type, '_fields'):
             result = (inner_type(*x) for x in cursor)  # If namedtuple.
         else:
@@ -1450,6 +1903,7 @@ class Select(object):
             order_by = 'ORDER BY {0}'.format(', '.join(key_columns))
         else:
             order_by = None
+        self._record_index_usage(key, where)
         cursor = self._execute_query(select_clause, order_by, **where)
         return self._format_results(columns, cursor)
 
@@ -1463,6 +1917,7 @@ class Select(object):
             order_by = 'ORDER BY {0}'.format(', '.join(key_columns))
         else:
             order_by = None
+        self._record_index_usage(key, where)
         cursor = self._execute_query(select_clause, order_by, **where)
         return self._format_results(columns, cursor)
 
@@ -1481,6 +1936,7 @@ class Select(object):
             group_by = 'GROUP BY {0}'.format(', '.join(key_columns))
         else:
             group_by = None
+        self._record_index_usage(key, where)
         cursor = self._execute_query(select_clause, group_by, **where)
         results =  self._format_results(columns, cursor)
 
@@ -1489,6 +1945,63 @@ class Select(object):
             return Result(results, evaluation_type=dict)
         return next(results)
 
+    def _select_reduce(self, function, columns, **where):
+        """Apply *function* to the list of values of each group using
+        an SQLite aggregate so that only the results of each group
+        are passed back from the database.
+        """
+        key, value = _parse_columns(columns)
+        key_columns, value_columns = self._parse_key_value(key, value)
+
+        inner_type = type(next(iter(value)))
+        aggregate_name, aggregate_class = \
+            self._get_user_aggregate(function, inner_type, len(value_columns))
+
+        aggregate_args = ', '.join(value_columns)
+        if isinstance(value, Set):
+            aggregate_args = 'DISTINCT {0}'.format(aggregate_args)
+        aggregate = '{0}({1})'.format(aggregate_name, aggregate_args)
+
+        select_clause = ', '.join(key_columns + (aggregate,))
+        if key:
+            group_by = 'GROUP BY {0}'.format(', '.join(key_columns))
+        else:
+            group_by = None
+
+        self._record_index_usage(key, where)
+        local = aggregate_class.local
+        previous_results = getattr(local, 'results', None)
+        local.results = []  # <- Restored when done (supports nesting).
+        try:
+            cursor = self._execute_query(select_clause, group_by, **where)
+            rows = cursor.fetchall()
+            results = local.results
+        finally:
+            local.results = previous_results
+
+        def get_result(index):
+            if index is None:
+                return function([])  # <- EXIT! (SQLite skips empty aggregates.)
+            succeeded, result = results[index]
+            if not succeeded:
+                raise result
+            return result
+
+        if not isinstance(columns, Mapping):
+            return get_result(rows[0][-1])  # <- EXIT!
+
+        key_type = type(key)
+        if issubclass(key_type, str):
+            keyfunc = lambda row: row[0]
+        elif issubclass(key_type, tuple) and hasattr(key_type, '_fields'):
+            keyfunc = lambda row: key_type(*row[:-1])  # If namedtuple.
+        else:
+            keyfunc = lambda row: key_type(row[:-1])
+
+        dictitems = DictItems((keyfunc(row), get_result(row[-1])) for row in rows)
+        with suppress_deprecation():
+            return Result(dictitems, evaluation_type=type(columns))
+
     def create_index(self, *columns):
         """Create an index for specified columns---can speed up
         testing in many cases.
@@ -1532,6 +2045,94 @@ class Select(object):
         cursor = self._connection.cursor()
         cursor.execute(statement)
 
+    @staticmethod
+    def _is_indexable(value):
+        """Return True if a *where* value is implemented with an
+        equality or membership test (which can use an index).
+        """
+        if isinstance(value, Set):
+            return True
+        if callable(value) and not isinstance(value, type):
+            return False
+        return not isinstance(get_matcher(value), (MatcherObject, MatcherTuple))
+
+    def _record_index_usage(self, key, where):
+        """Record the columns used to filter and group a query. When
+        *auto_index* is set and a combination has been used enough
+        times, create an index for it.
+        """
+        where_columns = tuple(sorted(
+            k for k, v in where.items() if self._is_indexable(v)))
+        if not key:
+            key_columns = ()
+        elif isinstance(key, str):
+            key_columns = (key,)
+        else:
+            key_columns = tuple(key)
+        group_columns = tuple(k for k in key_columns if k not in where)
+
+        usage = (where_columns, group_columns)
+        if not (where_columns or group_columns):
+            return  # <- EXIT!
+        self._index_usage[usage] += 1
+
+        auto_index = self.auto_index
+        if (auto_index
+                and self._index_usage[usage] >= auto_index
+                and usage not in self._index_checked):
+            self._index_checked.add(usage)
+            if self._needs_index(where_columns, group_columns):
+                self.create_index(*(where_columns + group_columns))
+
+    def _needs_index(self, where_columns, group_columns):
+        """Return True if EXPLAIN QUERY PLAN shows that a query
+        filtering on *where_columns* and grouping by *group_columns*
+        would scan the table or build a temporary b-tree.
+        """
+        statement = 'EXPLAIN QUERY PLAN SELECT * FROM {0}'.format(self._table)
+        if where_columns:
+            where_clause = ' AND '.join(
+                self._escape_field_name(x) + '=?' for x in where_columns)
+            statement = '{0} WHERE {1}'.format(statement, where_clause)
+        if group_columns:
+            order_by = ', '.join(self._escape_field_name(x) for x in group_columns)
+            statement = '{0} ORDER BY {1}'.format(statement, order_by)
+
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute(statement, [None] * len(where_columns))
+        except sqlite3.OperationalError:
+            return False  # <- EXIT! (Columns do not exist.)
+        details = ' '.join(str(row[-1]) for row in cursor).upper()
+
+        if 'TEMP B-TREE' in details:
+            return True
+        return 'SCAN' in details and 'INDEX' not in details
+
+    def suggest_indexes(self, min_uses=2):
+        """Return a list of column combinations that would benefit
+        from an index. Combinations are recorded from the filter
+        (*where*) and grouping columns of previous queries and are
+        included when they have been used at least *min_uses* times
+        and the query plan shows the table is being scanned. The most
+        frequently used combinations are listed first::
+
+            select = datatest.Select('myfile.csv')
+            ...
+            for columns in select.suggest_indexes():
+                print(columns)  # <- Or, use select.create_index(*columns)
+
+        Queries filter on columns before grouping, so combinations
+        that share leading columns can often use the same index.
+        """
+        suggestions = []
+        for (where_columns, group_columns), uses in self._index_usage.most_common():
+            if uses < min_uses:
+                break
+            if self._needs_index(where_columns, group_columns):
+                suggestions.append(where_columns + group_columns)
+        return suggestions
+
     # NOTE: Do NOT add to_csv() method to Select. It's simple
     # enough to use Query.to_csv() as below:
     #
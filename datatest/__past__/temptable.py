@@ -4,6 +4,7 @@ from .._compatibility.collections.abc import Iterable
 from .._compatibility.collections.abc import Mapping
 from .._compatibility.itertools import chain
 from .._compatibility.itertools import count
+from .._compatibility.itertools import islice
 
 
 try:
@@ -27,13 +28,13 @@ def table_exists(cursor, table):
     return bool(cursor.fetchall())
 
 
-_table_names = ('tbl{0}'.format(x) for x in count())
+_table_numbers = count()  # <- Unlike generators, safe to share between threads.
 def new_table_name(cursor):
-    global _table_names
+    global _table_numbers
 
-    new_name = next(_table_names)
+    new_name = 'tbl{0}'.format(next(_table_numbers))
     while table_exists(cursor, new_name):
-        new_name = next(_table_names)
+        new_name = 'tbl{0}'.format(next(_table_numbers))
 
     return new_name
 
@@ -61,7 +62,13 @@ def normalize_default(value):
 
 
 def create_table(cursor, table, columns, default=''):
-    """Creates a temporary table using *table* and *columns* names."""
+    """Creates a temporary table using *table* and *columns* names.
+
+    If the cursor's connection has a *temporary_tables* attribute set
+    to False, a regular table is created instead. This is used by
+    connections that share a database between threads (temporary
+    tables are only visible to the connection that created them).
+    """
     columns = normalize_names(columns)
     if columns.count('""') > 1:
         custom_message = ('duplicate column name: contains multiple '
@@ -77,8 +84,11 @@ def create_table(cursor, table, columns, default=''):
     column_defs = ['{0} DEFAULT {1}'.format(x, default) for x in columns]
     column_defs = ', '.join(column_defs)
 
-    statement = 'CREATE TEMPORARY TABLE {0} ({1})'.format(table, column_defs)
-    cursor.execute(statement)
+    if getattr(cursor.connection, 'temporary_tables', True):
+        statement = 'CREATE TEMPORARY TABLE {0} ({1})'
+    else:
+        statement = 'CREATE TABLE {0} ({1})'
+    cursor.execute(statement.format(table, column_defs))
 
 
 def get_columns(cursor, table):
@@ -90,16 +100,62 @@ def get_columns(cursor, table):
     return columns
 
 
+# The number of records bound to each multi-row INSERT statement.
+# SQLite versions before 3.32.0 limit statements to 999 parameters
+# so the number of rows is reduced for tables with many columns.
+INSERT_BATCH_SIZE = 100
+_MAX_PARAMETERS = 999
+
+
+def _executemany_batched(cursor, table, columns, records):
+    """Insert *records* using multi-row INSERT statements of up to
+    INSERT_BATCH_SIZE records each. Records that are not part of a
+    full batch (or that belong to a batch with an incorrect number
+    of values) are inserted one row at a time so that errors are
+    reported the same as a single-row executemany() call.
+    """
+    width = len(columns)
+    row_params = '({0})'.format(', '.join(['?'] * width))
+    prefix = 'INSERT INTO {0} ({1}) VALUES '.format(table, ', '.join(columns))
+    single_sql = prefix + row_params
+
+    batch_size = min(INSERT_BATCH_SIZE, _MAX_PARAMETERS // (width or 1))
+    if batch_size < 2:
+        cursor.executemany(single_sql, records)
+        return  # <- EXIT!
+
+    batch_sql = prefix + ', '.join([row_params] * batch_size)
+    records = iter(records)
+    pending = []  # Records to insert with the single-row statement.
+
+    def full_batches():
+        while True:
+            batch = list(islice(records, batch_size))
+            try:
+                is_full = list(map(len, batch)).count(width) == batch_size
+            except TypeError:
+                is_full = False
+
+            if not is_full:
+                pending[:] = batch
+                return
+            yield list(chain.from_iterable(batch))
+
+    while True:
+        cursor.executemany(batch_sql, full_batches())
+        if not pending:
+            break
+        cursor.executemany(single_sql, pending)
+        if len(pending) < batch_size:
+            break  # <- Records are exhausted.
+        del pending[:]
+
+
 def insert_records(cursor, table, columns, records):
     table = normalize_names(table)
     columns = normalize_names(columns)
-    sql = 'INSERT INTO {0} ({1}) VALUES ({2})'.format(
-        table,
-        ', '.join(columns),
-        ', '.join(['?'] * len(columns)),
-    )
     try:
-        cursor.executemany(sql, records)
+        _executemany_batched(cursor, table, columns, records)
     except sqlite3.ProgrammingError as error:
         if 'incorrect number of bindings' in str(error).lower():
             msg = (
@@ -133,11 +189,16 @@ def drop_table(cursor, table):
     cursor.execute('DROP TABLE IF EXISTS {0}'.format(table))
 
 
-_savepoint_names = ('svpnt{0}'.format(x) for x in count())
+_savepoint_numbers = count()
 class savepoint(object):
-    """Sqlite SAVEPOINT context manager."""
+    """Sqlite SAVEPOINT context manager.
+
+    If the cursor's connection has a *write_lock* attribute, the lock
+    is held while the savepoint is open so that threads sharing a
+    database do not interleave their transactions.
+    """
     def __init__(self, cursor):
-        global _savepoint_names
+        global _savepoint_numbers
 
         if cursor.connection.isolation_level is not None:
             msg = ('The cursor\'s connection must be running in '
@@ -146,17 +207,31 @@ class savepoint(object):
                    'assigning "isolation_level=None".')
             raise ValueError(msg)
 
-        self.name = next(_savepoint_names)
+        self.name = 'svpnt{0}'.format(next(_savepoint_numbers))
         self.cursor = cursor
+        self.lock = getattr(cursor.connection, 'write_lock', None)
 
     def __enter__(self):
-        self.cursor.execute('SAVEPOINT {0}'.format(self.name))
+        if self.lock is not None:
+            self.lock.acquire()
+        try:
+            self.cursor.execute('SAVEPOINT {0}'.format(self.name))
+        except Exception:
+            if self.lock is not None:
+                self.lock.release()
+            raise
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if exc_type is None:
-            self.cursor.execute('RELEASE {0}'.format(self.name))
-        else:
+        if exc_type is not None:
             self.cursor.execute('ROLLBACK TO {0}'.format(self.name))
+        # Release the savepoint in either case. After a ROLLBACK TO,
+        # the savepoint is still open and would otherwise leave the
+        # connection inside of a transaction.
+        try:
+            self.cursor.execute('RELEASE {0}'.format(self.name))
+        finally:
+            if self.lock is not None:
+                self.lock.release()
 
 
 def load_data(cursor, table, *args, **kwds):
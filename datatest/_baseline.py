@@ -0,0 +1,202 @@
+"""Baseline files of known differences.
+
+A baseline is an SQLite database that records the differences of a
+ValidationError so they can be accepted in later runs without loading
+them into memory. Each difference is stored as a fingerprint of its
+key and its NaN-normalized args (along with a count of how many times
+it occurred) and matched using indexed lookups.
+
+Fingerprints are computed from a canonical repr() so that values which
+compare as equal are recorded the same way: integral numbers of any
+type (1, 1.0, numpy.float64(1.0)) are written as ints, and the elements
+of sets and mappings are sorted so that their hash-seed dependent
+iteration order does not matter.
+"""
+
+import errno
+import hashlib
+import os
+import sys
+from numbers import Integral
+from numbers import Real
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None  # Missing from Jython and Micropython.
+from ._compatibility.collections import defaultdict
+from ._compatibility.collections.abc import Mapping
+from ._compatibility.collections.abc import Set
+from ._utils import IterItems
+from .differences import BaseDifference
+from .differences import _nan_to_token
+
+
+BASELINE_VERSION = 2  # <- Stored in the file's "user_version" pragma.
+
+
+def _require_sqlite3():
+    if sqlite3 is None:
+        msg = (
+            'Baseline files require SQLite but the standard library '
+            '"sqlite3" package is missing from the current Python '
+            'installation:\n\nPython {0}'
+        ).format(sys.version)
+        raise Exception(msg)
+
+
+def _canonical_repr(obj):
+    """Return a repr() string for *obj* in which equal numbers are
+    written the same way and set and mapping elements are sorted.
+    """
+    if isinstance(obj, Integral):
+        return str(int(obj))
+
+    if isinstance(obj, Real):
+        value = float(obj)
+        if value.is_integer():
+            return str(int(value))
+        return repr(value)
+
+    if isinstance(obj, tuple):
+        items = [_canonical_repr(x) for x in obj]
+        if len(items) == 1:
+            return '({0},)'.format(items[0])
+        return '({0})'.format(', '.join(items))
+
+    if isinstance(obj, list):
+        return '[{0}]'.format(', '.join(_canonical_repr(x) for x in obj))
+
+    if isinstance(obj, Set):
+        items = sorted(_canonical_repr(x) for x in obj)
+        return 'set([{0}])'.format(', '.join(items))
+
+    if isinstance(obj, Mapping):
+        items = sorted('{0}: {1}'.format(_canonical_repr(k), _canonical_repr(v))
+                       for k, v in IterItems(obj))
+        return '{{{0}}}'.format(', '.join(items))
+
+    return repr(obj)
+
+
+def _fingerprint(obj):
+    """Return a 60-bit integer fingerprint of *obj* using its
+    canonical repr().
+    """
+    text = _canonical_repr(obj)
+    if not isinstance(text, bytes):
+        text = text.encode('utf-8')
+    return int(hashlib.sha1(text).hexdigest()[:15], 16)
+
+
+def key_fingerprint(key):
+    """Return the fingerprint of a difference key (None is used for
+    differences that are not associated with a key).
+    """
+    return _fingerprint(key)
+
+
+def difference_fingerprint(diff):
+    """Return the fingerprint of a difference. Differences with the
+    same class name and args (after NaN values are normalized) will
+    have the same fingerprint.
+    """
+    args = tuple(_nan_to_token(x) for x in diff.args)
+    return _fingerprint((diff.__class__.__name__, args))
+
+
+def _iter_items(differences):
+    """Return an iterator of (key, difference) items."""
+    if isinstance(differences, Mapping):
+        for key, value in IterItems(differences):
+            if isinstance(value, BaseDifference):
+                yield key, value
+            else:
+                for diff in value:
+                    yield key, diff
+    else:
+        for diff in differences:
+            yield None, diff
+
+
+def write_baseline(path, differences):
+    """Write *differences* (a mapping or non-mapping collection) to a
+    baseline file at *path*. If the file exists, it is replaced.
+    """
+    _require_sqlite3()
+
+    counts = defaultdict(int)
+    reprs = {}
+    for key, diff in _iter_items(differences):
+        fingerprints = (key_fingerprint(key), difference_fingerprint(diff))
+        counts[fingerprints] += 1
+        if fingerprints not in reprs:
+            reprs[fingerprints] = (repr(key), repr(diff))
+
+    temp_path = '{0}.tmp'.format(path)
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    connection = sqlite3.connect(temp_path)
+    try:
+        connection.execute("""
+            CREATE TABLE baseline (
+                key_fp INTEGER NOT NULL,
+                diff_fp INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                key TEXT,
+                difference TEXT,
+                PRIMARY KEY (key_fp, diff_fp)
+            ) WITHOUT ROWID
+        """)
+        rows = ((k, d, n) + reprs[(k, d)] for (k, d), n in counts.items())
+        connection.executemany(
+            'INSERT INTO baseline VALUES (?, ?, ?, ?, ?)', rows)
+        connection.execute('PRAGMA user_version={0}'.format(BASELINE_VERSION))
+        connection.commit()
+    finally:
+        connection.close()
+
+    if os.path.exists(path):
+        os.remove(path)  # <- For Python 2 on Windows (no os.replace()).
+    os.rename(temp_path, path)
+
+
+class BaselineFile(object):
+    """A read-only baseline file. Counts are looked up one difference
+    at a time so the baseline is never loaded into memory.
+    """
+    def __init__(self, path):
+        _require_sqlite3()
+        if not os.path.isfile(path):
+            raise IOError(errno.ENOENT, 'baseline file not found', path)
+        self.path = path
+        self._connection = None
+
+    def open(self):
+        if self._connection is None:
+            path = '{0}'.format(self.path)  # <- Python 3.6 requires a str.
+            connection = sqlite3.connect(path, check_same_thread=False)
+            version = connection.execute('PRAGMA user_version').fetchone()[0]
+            if version != BASELINE_VERSION:
+                connection.close()
+                msg = 'unsupported baseline version in {0!r}: {1}'
+                raise ValueError(msg.format(self.path, version))
+            self._connection = connection
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def count(self, key_fp, diff_fp):
+        """Return the number of times the difference with fingerprint
+        *diff_fp* was recorded for the key with fingerprint *key_fp*.
+        """
+        self.open()
+        cursor = self._connection.execute(
+            'SELECT count FROM baseline WHERE key_fp=? AND diff_fp=?',
+            (key_fp, diff_fp),
+        )
+        row = cursor.fetchone()
+        return row[0] if row else 0
@@ -0,0 +1,68 @@
+"""Similarity matching for fuzzy requirements and acceptances."""
+
+import difflib
+
+
+class FuzzyMatcher(object):
+    """A callable object of two arguments that returns True when
+    the values match with a similarity greater than or equal to
+    *cutoff*. If values can not be compared, False is returned.
+
+    By default, similarity is determined using the ratio() method
+    of the difflib.SequenceMatcher class. Before the relatively
+    expensive ratio() is computed, the real_quick_ratio() and
+    quick_ratio() upper bounds are checked so that dissimilar values
+    can be rejected early.
+
+    If *similarity* is given, it should be a function of two values
+    that returns a measure from 0.0 (completely different) to 1.0
+    (exactly the same). It is used in place of the default measure.
+
+    Results are cached by value pair so repeated comparisons are
+    only evaluated once. When the cache grows past *maxsize*
+    entries, it is cleared.
+    """
+    def __init__(self, cutoff, similarity=None, maxsize=65536):
+        self.cutoff = cutoff
+        self.similarity = similarity
+        self.maxsize = maxsize
+        self._cache = {}
+
+    def _difflib_match(self, a, b):
+        cutoff = self.cutoff
+
+        # Check real_quick_ratio() upper bound without a matcher.
+        len_a = len(a)
+        len_b = len(b)
+        length = len_a + len_b
+        if length and (2.0 * min(len_a, len_b) / length) < cutoff:
+            return False
+
+        matcher = difflib.SequenceMatcher(a=a, b=b)
+        if matcher.quick_ratio() < cutoff:
+            return False
+        return matcher.ratio() >= cutoff
+
+    def _match(self, a, b):
+        try:
+            if self.similarity is not None:
+                return self.similarity(a, b) >= self.cutoff
+            return self._difflib_match(a, b)
+        except TypeError:
+            return False
+
+    def __call__(self, a, b):
+        cache = self._cache
+        key = (a, b)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._match(a, b)  # <- EXIT! (Unhashable values.)
+
+        result = self._match(a, b)
+        if len(cache) >= self.maxsize:
+            cache.clear()
+        cache[key] = result
+        return result
@@ -1,14 +1,19 @@
 """Normalize objects for validation."""
 
 import sys
+import weakref
+from inspect import getmro
+from operator import itemgetter
 from ._compatibility.collections.abc import Collection
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Iterator
 from ._compatibility.collections.abc import Mapping
 
+from ._compatibility.itertools import chain
 from ._utils import exhaustible
 from ._utils import iterpeek
 from ._utils import IterItems
+from ._utils import string_types
 
 
 class TypedIterator(Iterator):
@@ -17,7 +22,10 @@ class TypedIterator(Iterator):
         self.evaltype = evaltype
 
     def __iter__(self):
-        return self
+        # Return the underlying iterator so loops advance it directly
+        # (without calling __next__() for every element). Since both
+        # share the same state, the TypedIterator is still exhausted.
+        return self._iterator
 
     def __next__(self):
         return next(self._iterator)
@@ -32,92 +40,265 @@ class TypedIterator(Iterator):
 NoneType = type(None)
 
 
-def _normalize_lazy(obj):
-    """Return an iterator for lazy evaluation."""
-    if isinstance(obj, TypedIterator):
-        if issubclass(obj.evaltype, Mapping):
-            obj = IterItems(obj)
-        return obj  # <- EXIT!
+# Number of array rows converted with each call to ndarray.tolist().
+ARRAY_CHUNK_SIZE = 8192
+
+
+def _tolist_is_safe(dtype):
+    """Return True if ndarray.tolist() returns the same objects that
+    element-by-element iteration would. This is only the case for
+    object dtypes---other dtypes would have their NumPy scalars (which
+    can be checked against NumPy types like ``np.integer``) replaced
+    by native Python values.
+    """
+    if dtype.names:
+        return all(_tolist_is_safe(dtype.fields[name][0]) for name in dtype.names)
+    return dtype.subdtype is None and dtype.kind == 'O'
+
+
+def _iter_array_chunks(array, convert=None):
+    """Generate lists of values from *array* in chunks of
+    ARRAY_CHUNK_SIZE rows. If given, *convert* is applied to each
+    list of values.
+    """
+    size = ARRAY_CHUNK_SIZE
+    for start in range(0, len(array), size):
+        values = array[start:start + size].tolist()
+        if convert:
+            values = convert(values)
+        yield values
+
+
+def _iter_array(array, convert=None):
+    """Return an iterator of values from *array*."""
+    return chain.from_iterable(_iter_array_chunks(array, convert))
+
+
+def _to_tuples(rows):
+    return [tuple(row) for row in rows]
+
+
+def _unwrap_first(rows):
+    return list(map(itemgetter(0), rows))
+
+
+def _normalize_typediterator(obj):
+    if issubclass(obj.evaltype, Mapping):
+        obj = IterItems(obj)
+    return obj
+
+
+def _normalize_squint_query(obj):
+    obj = obj.execute()
+    if issubclass(getattr(obj, 'evaltype', NoneType), Mapping):
+        obj = IterItems(obj)
+    return obj
+
+
+def _normalize_squint_result(obj):
+    if issubclass(obj.evaltype, Mapping):
+        obj = IterItems(obj)
+    return obj
+
+
+def _normalize_dataframe(obj):
+    pandas = sys.modules['pandas']
+
+    if not obj.index.is_unique:
+        msg = '{0} index contains duplicates, must be unique'
+        raise ValueError(msg.format(obj.__class__.__name__))
+
+    if isinstance(obj.index, pandas.RangeIndex):
+        # DataFrame with RangeIndex is treated as an iterator.
+        if len(obj.columns) == 1:
+            obj = (x[0] for x in obj.values)
+        else:
+            obj = (tuple(x) for x in obj.values)
+        return TypedIterator(obj, evaltype=list)
+
+    # DataFrame with another index type is treated as a mapping.
+    if len(obj.columns) == 1:
+        gen = ((x[0], x[1]) for x in obj.itertuples())
+    else:
+        gen = ((x[0], tuple(x[1:])) for x in obj.itertuples())
+    return IterItems(gen)
+
+
+def _normalize_series(obj):
+    pandas = sys.modules['pandas']
+
+    if not obj.index.is_unique:
+        msg = '{0} index contains duplicates, must be unique'
+        raise ValueError(msg.format(obj.__class__.__name__))
+
+    if isinstance(obj.index, pandas.RangeIndex):
+        # Series with RangeIndex is treated as an iterator.
+        return TypedIterator(obj.values, evaltype=list)
+
+    # Series with another index type is treated as a mapping.
+    return IterItems(obj.iteritems())
 
-    # Separate Squint module.
-    squint = sys.modules.get('squint', None)
-    if squint:
-        if isinstance(obj, squint.Query):
-            obj = obj.execute()
-            if issubclass(getattr(obj, 'evaltype', NoneType), Mapping):
-                obj = IterItems(obj)
-            return obj  # <- EXIT!
-
-        if isinstance(obj, squint.Result):
-            if issubclass(obj.evaltype, Mapping):
-                obj = IterItems(obj)
-            return obj  # <- EXIT!
-
-    pandas = sys.modules.get('pandas', None)
-    if pandas:
-        if isinstance(obj, pandas.DataFrame):
-            if not obj.index.is_unique:
-                msg = '{0} index contains duplicates, must be unique'
-                raise ValueError(msg.format(obj.__class__.__name__))
-
-            if isinstance(obj.index, pandas.RangeIndex):
-                # DataFrame with RangeIndex is treated as an iterator.
-                if len(obj.columns) == 1:
-                    obj = (x[0] for x in obj.values)
-                else:
-                    obj = (tuple(x) for x in obj.values)
-                return TypedIterator(obj, evaltype=list)  # <- EXIT!
-            else:
-                # DataFrame with another index type is treated as a mapping.
-                if len(obj.columns) == 1:
-                    gen = ((x[0], x[1]) for x in obj.itertuples())
-                else:
-                    gen = ((x[0], tuple(x[1:])) for x in obj.itertuples())
-                return IterItems(gen)  # <- EXIT!
-        elif isinstance(obj, pandas.Series):
-            if not obj.index.is_unique:
-                msg = '{0} index contains duplicates, must be unique'
-                raise ValueError(msg.format(obj.__class__.__name__))
-
-            if isinstance(obj.index, pandas.RangeIndex):
-                # Series with RangeIndex is treated as an iterator.
-                return TypedIterator(obj.values, evaltype=list)  # <- EXIT!
-            else:
-                # Series with another index type is treated as a mapping.
-                return IterItems(obj.iteritems())  # <- EXIT!
 
-    numpy = sys.modules.get('numpy', None)
-    if numpy and isinstance(obj, numpy.ndarray):
-        # Two-dimentional array, recarray, or structured array.
-        if obj.ndim == 2 or (obj.ndim == 1 and len(obj.dtype) > 1):
+def _normalize_ndarray(obj):
+    # When possible (object arrays), values are retrieved in chunks
+    # using tolist() rather than one element at a time.
+    # Subclasses (like masked arrays, which convert masked elements
+    # to None) are always handled one element at a time.
+    numpy = sys.modules['numpy']
+    use_tolist = (type(obj) is numpy.ndarray
+                  and obj.ndim in (1, 2)
+                  and _tolist_is_safe(obj.dtype))
+
+    # Two-dimentional array, recarray, or structured array.
+    if obj.ndim == 2 or (obj.ndim == 1 and len(obj.dtype) > 1):
+        if use_tolist:
+            if obj.ndim == 2:
+                obj = _iter_array(obj, _to_tuples)
+            else:
+                obj = _iter_array(obj)  # <- Records become tuples.
+        else:
             obj = (tuple(x) for x in obj)
-            return TypedIterator(obj, evaltype=list)  # <- EXIT!
+        return TypedIterator(obj, evaltype=list)  # <- EXIT!
 
-        # One-dimentional array, recarray, or structured array.
-        if obj.ndim == 1:
-            if len(obj.dtype) == 1:        # Unpack single-valued recarray
-                obj = (x[0] for x in obj)  # or structured array.
+    # One-dimentional array, recarray, or structured array.
+    if obj.ndim == 1:
+        if len(obj.dtype) == 1:        # Unpack single-valued recarray
+            if use_tolist:             # or structured array.
+                obj = _iter_array(obj, _unwrap_first)
             else:
-                obj = iter(obj)
-            return TypedIterator(obj, evaltype=list)  # <- EXIT!
-
-    # Check for cursor-like object (if obj has DBAPI2 cursor attributes).
-    if all(hasattr(obj, n) for n in ('fetchone', 'execute',
-                                     'rowcount', 'description')):
-        if not isinstance(obj, Iterable):
-            def cursor_to_gen(cursor):       # While most cursor objects are
-                while True:                  # iterable, it is not required
-                    row = cursor.fetchone()  # by the DBAPI2 specification.
-                    if row is None:
-                        break
-                    yield row
-            obj = cursor_to_gen(obj)
-
-        first, obj = iterpeek(obj)
-        if first and len(first) == 1:
-            obj = iter(x[0] for x in obj)  # Unwrap single-value records.
-        return obj  # <- EXIT!
+                obj = (x[0] for x in obj)
+        elif use_tolist:
+            obj = _iter_array(obj)
+        else:
+            obj = iter(obj)
+        return TypedIterator(obj, evaltype=list)  # <- EXIT!
+
+    return obj
+
+
+_CURSOR_ATTRIBUTES = ('fetchone', 'execute', 'rowcount', 'description')
+
+
+def _normalize_cursor(obj):
+    if not isinstance(obj, Iterable):
+        def cursor_to_gen(cursor):       # While most cursor objects are
+            while True:                  # iterable, it is not required
+                row = cursor.fetchone()  # by the DBAPI2 specification.
+                if row is None:
+                    break
+                yield row
+        obj = cursor_to_gen(obj)
+
+    first, obj = iterpeek(obj)
+    if first and len(first) == 1:
+        obj = iter(x[0] for x in obj)  # Unwrap single-value records.
+    return obj
+
+
+def _normalize_if_cursor(obj):
+    """Normalize *obj* if it has DBAPI2 cursor attributes. This is
+    used for types that can change their attributes dynamically.
+    """
+    if all(hasattr(obj, n) for n in _CURSOR_ATTRIBUTES):
+        return _normalize_cursor(obj)
+    return obj
+
+
+# Registry of normalizer functions by type. Types from optional
+# packages are registered by name (as 'module.Type') and are only
+# looked up once their modules have been imported.
+_normalizers = {TypedIterator: _normalize_typediterator}
+_normalizers_by_name = {
+    'squint.Query': _normalize_squint_query,
+    'squint.Result': _normalize_squint_result,
+    'pandas.DataFrame': _normalize_dataframe,
+    'pandas.Series': _normalize_series,
+    'numpy.ndarray': _normalize_ndarray,
+}
+_dispatch_cache = weakref.WeakKeyDictionary()
+
+
+def register_normalizer(cls, function):
+    """Register a *function* to normalize objects of type *cls* (and
+    its subclasses) for validation. The *function* should accept an
+    object and return an iterable of values or a mapping:
 
+    .. code-block:: python
+
+        import datatest as dt
+
+        def normalize_reader(reader):
+            return reader.iter_rows()
+
+        dt.register_normalizer(MyReader, normalize_reader)
+
+    To register a type from a package that may not be imported, *cls*
+    can be given as a string of the module and type name (e.g.,
+    ``'polars.DataFrame'``). The type is looked up once the module
+    has been imported.
+    """
+    if isinstance(cls, string_types):
+        _normalizers_by_name[cls] = function
+    elif isinstance(cls, type):
+        _normalizers[cls] = function
+    else:
+        msg = "expected type or 'module.Type' string, got {0!r}"
+        raise TypeError(msg.format(cls))
+    _dispatch_cache.clear()
+
+
+def _resolve_normalizers_by_name():
+    """Move normalizers of named types from imported modules into
+    the registry of normalizers by type.
+    """
+    for name in list(_normalizers_by_name):
+        module_name, _, attr_path = name.rpartition('.')
+        module = sys.modules.get(module_name, None)
+        if module is None:
+            continue
+        cls = getattr(module, attr_path, None)
+        if isinstance(cls, type):
+            function = _normalizers_by_name.pop(name, None)
+            if function:
+                _normalizers[cls] = function
+
+
+def _get_normalizer(obj):
+    """Return the normalizer function for *obj* or None if there is
+    no normalizer. Functions are found using the method resolution
+    order of the object's class and are cached by class.
+    """
+    cls = obj.__class__
+    try:
+        return _dispatch_cache[cls]
+    except KeyError:
+        pass
+
+    if _normalizers_by_name:
+        _resolve_normalizers_by_name()
+
+    normalizer = None
+    for base in getmro(cls):
+        normalizer = _normalizers.get(base)
+        if normalizer:
+            break
+
+    if normalizer is None:
+        # Check for cursor-like object (if obj has DBAPI2 cursor attributes).
+        if hasattr(cls, '__getattr__'):
+            normalizer = _normalize_if_cursor
+        elif all(hasattr(obj, n) for n in _CURSOR_ATTRIBUTES):
+            normalizer = _normalize_cursor
+
+    _dispatch_cache[cls] = normalizer
+    return normalizer
+
+
+def _normalize_lazy(obj):
+    """Return an iterator for lazy evaluation."""
+    normalizer = _get_normalizer(obj)
+    if normalizer:
+        return normalizer(obj)
     return obj
 
 
@@ -62,14 +62,16 @@ class ValidationAccessor(object):
             err.__cause__ = None
             raise err
 
-    def fuzzy(self, requirement, cutoff=0.6, msg=None):
+    def fuzzy(self, requirement, cutoff=0.6, msg=None, similarity=None):
         """Check that strings are similar to requirement strings.
         Strings are considered similar if they measure equal to or
         greater than cutoff (default 0.6) as determined by the
-        difflib.SequenceMatcher class (from the Standard Library).
+        difflib.SequenceMatcher class (from the Standard Library)
+        or by the given *similarity* function.
         """
         try:
-            return validate.fuzzy(self._data, requirement, cutoff=cutoff, msg=msg)
+            return validate.fuzzy(self._data, requirement, cutoff=cutoff,
+                                  msg=msg, similarity=similarity)
         except ValidationError as err:
             __tracebackhide__ = True
             err.__traceback__ = None
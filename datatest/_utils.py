@@ -215,7 +215,7 @@ class IterItems(abc.ABC):
         self.__wrapped__ = iter(items)
 
     def __iter__(self):
-        return self
+        return self.__wrapped__  # <- Loops advance wrapped iterator directly.
 
     def __next__(self):
         return next(self.__wrapped__)
@@ -0,0 +1,203 @@
+"""Vectorized fast paths for validating NumPy and Pandas objects.
+
+The functions in this module never change validation results. They
+use array operations to discard elements that are certain to pass
+so that the regular (element-by-element) requirement handling only
+has to process the remaining candidates. When objects can not be
+handled by a vectorized path, the functions return None and the
+caller should continue with its usual behavior.
+"""
+
+import sys
+
+
+def _get_array_values(obj):
+    """Return a tuple containing the underlying array and the index
+    (or None) of the given NumPy or Pandas object. If the object is
+    not supported, return None.
+    """
+    numpy = sys.modules.get('numpy', None)
+    if not numpy:
+        return None  # <- EXIT!
+
+    if isinstance(obj, numpy.ndarray):
+        if obj.ndim not in (1, 2) or obj.dtype.names:
+            return None  # <- EXIT! (Structured arrays are not supported.)
+        return obj, None  # <- EXIT!
+
+    pandas = sys.modules.get('pandas', None)
+    if pandas and isinstance(obj, (pandas.Series, pandas.DataFrame)):
+        if not obj.index.is_unique:
+            return None  # <- EXIT! (Normalization will raise an error.)
+        values = obj.values
+        if not isinstance(values, numpy.ndarray):
+            return None  # <- EXIT! (Pandas extension array.)
+        return values, obj.index
+
+    return None
+
+
+def _is_sequence_like(obj):
+    """Return True if *obj* is normalized as a sequence (rather than
+    as a mapping).
+    """
+    pandas = sys.modules.get('pandas', None)
+    if pandas and isinstance(obj, (pandas.Series, pandas.DataFrame)):
+        return isinstance(obj.index, pandas.RangeIndex)
+    return True
+
+
+def _take(obj, mask):
+    """Return the elements of *obj* selected by boolean *mask* and
+    preserve the way *obj* is treated during normalization.
+    """
+    pandas = sys.modules.get('pandas', None)
+    if pandas and isinstance(obj, (pandas.Series, pandas.DataFrame)):
+        if not _is_sequence_like(obj):
+            return obj[mask]  # <- EXIT! (Index labels are kept as keys.)
+
+        # Selecting rows would replace the RangeIndex so the values
+        # are returned as an array (to keep the sequence behavior).
+        values = obj.to_numpy()
+        if isinstance(obj, pandas.DataFrame) and values.shape[1] == 1:
+            return values[mask, 0]  # <- EXIT! (Unwrap single-column rows.)
+        return values[mask]  # <- EXIT!
+
+    return obj[mask]
+
+
+def approx_candidates(data, requirement, places=None, delta=None):
+    """Return a 2-tuple of *data* and *requirement* with all elements
+    that are known to be approximately equal removed. Return None if
+    the given objects can not be compared using a vectorized path.
+
+    Objects are supported when both are NumPy arrays of the same shape
+    or when both are Pandas objects of the same type with identical
+    indexes (and columns). Values must be integer or floating point
+    types. The selection is conservative: borderline elements are
+    kept so that they are checked with the exact rounding semantics
+    of :class:`RequiredApprox`.
+    """
+    numpy = sys.modules.get('numpy', None)
+    if not numpy or type(data) is not type(requirement):
+        return None  # <- EXIT!
+
+    data_parts = _get_array_values(data)
+    requirement_parts = _get_array_values(requirement)
+    if data_parts is None or requirement_parts is None:
+        return None  # <- EXIT!
+
+    actual, data_index = data_parts
+    expected, requirement_index = requirement_parts
+    if actual.shape != expected.shape:
+        return None  # <- EXIT!
+
+    if data_index is not None:
+        if not data_index.equals(requirement_index):
+            return None  # <- EXIT!
+        if hasattr(data, 'columns') and not data.columns.equals(requirement.columns):
+            return None  # <- EXIT!
+
+    for values in (actual, expected):
+        if values.dtype.kind not in 'iuf' or values.dtype.itemsize < 4:
+            return None  # <- EXIT!
+
+    try:
+        with numpy.errstate(all='ignore'):
+            if actual.dtype.kind in 'iu' and expected.dtype.kind in 'iu':
+                # Integer differences are only approximately equal
+                # (to any number of places) when they are zero.
+                candidates = actual != expected
+            else:
+                distance = numpy.abs(actual - expected)
+                if delta is not None:
+                    candidates = ~(distance < delta)
+                else:
+                    if places is None:
+                        places = 7
+                    # Keep a small margin below the rounding threshold so
+                    # values near the boundary are checked element-wise.
+                    threshold = 0.5 * 10.0 ** -places * (1 - 1e-6)
+                    candidates = ~(distance < threshold)
+    except TypeError:
+        return None  # <- EXIT!
+
+    if getattr(candidates, 'dtype', None) != numpy.bool_:
+        return None  # <- EXIT!
+
+    if candidates.ndim == 2:
+        candidates = candidates.any(axis=1)
+
+    return _take(data, candidates), _take(requirement, candidates)
+
+
+def regex_candidates(data, regex):
+    """Return *data* with all strings that match the compiled *regex*
+    removed. Return None if *data* is not a Pandas Series of strings.
+
+    Matches are found with the vectorized ``Series.str.contains()``
+    method. Non-string values are always kept so they are handled
+    by :class:`RequiredRegex` as usual.
+    """
+    pandas = sys.modules.get('pandas', None)
+    if not pandas or not isinstance(data, pandas.Series):
+        return None  # <- EXIT!
+
+    if not isinstance(regex.pattern, str) or not data.index.is_unique:
+        return None  # <- EXIT!
+
+    try:
+        matches = data.str.contains(regex.pattern, flags=regex.flags,
+                                    regex=True, na=False)
+    except (AttributeError, TypeError):
+        return None  # <- EXIT! (Series does not contain strings.)
+
+    numpy = sys.modules['numpy']  # <- Always loaded with pandas.
+    candidates = ~numpy.asarray(matches, dtype=bool)
+    return _take(data, candidates)
+
+
+def unique_candidates(data):
+    """Return *data* with all elements that are known to be unique
+    removed. Return None if *data* is not supported.
+
+    Only elements whose values occur more than once are kept (in
+    their original order) so that :class:`RequiredUnique` still
+    reports every repeat after the first. Duplicates are found with
+    ``duplicated(keep=False)`` for Pandas objects and ``numpy.unique()``
+    for one-dimensional NumPy arrays. Values must be numeric, boolean,
+    or string types.
+    """
+    numpy = sys.modules.get('numpy', None)
+    if not numpy:
+        return None  # <- EXIT!
+
+    if isinstance(data, numpy.ndarray):
+        if data.ndim != 1 or data.dtype.kind not in 'biufSU':
+            return None  # <- EXIT!
+        _, inverse, counts = numpy.unique(
+            data, return_inverse=True, return_counts=True)
+        candidates = counts[inverse.reshape(-1)] > 1
+        return data[candidates]
+
+    pandas = sys.modules.get('pandas', None)
+    if not pandas or not isinstance(data, (pandas.Series, pandas.DataFrame)):
+        return None  # <- EXIT!
+
+    if not _is_sequence_like(data):
+        return None  # <- EXIT! (Index labels are normalized as keys.)
+
+    if isinstance(data, pandas.Series):
+        columns = [data]
+    else:
+        columns = [data.iloc[:, i] for i in range(data.shape[1])]
+
+    types = pandas.api.types
+    for column in columns:
+        if not (types.is_numeric_dtype(column)
+                or types.is_bool_dtype(column)
+                or types.is_string_dtype(column)):
+            return None  # <- EXIT!
+
+    candidates = numpy.asarray(data.duplicated(keep=False), dtype=bool)
+    return _take(data, candidates)
@@ -4,8 +4,10 @@ from __future__ import absolute_import
 import re
 import sys
 from cmath import isnan
+from operator import eq
 from .._compatibility.builtins import *
 from .._compatibility import abc
+from .._compatibility.functools import partial
 from .._utils import regex_types
 from .._utils import isidentifier
 
@@ -115,10 +117,10 @@ def _get_matcher_parts(obj):
                 alt_obj = obj
         else:
             alt_obj = obj
-        pred_handler = lambda x: _check_type(alt_obj, x)
+        pred_handler = partial(_check_type, alt_obj)
         repr_string = getattr(obj, '__name__', repr(obj))
     elif callable(obj):
-        pred_handler = lambda x: _check_callable(obj, x)
+        pred_handler = partial(_check_callable, obj)
         repr_string = getattr(obj, '__name__', repr(obj))
     elif obj is Ellipsis:
         pred_handler = _check_wildcard  # <- Matches everything.
@@ -133,10 +135,10 @@ def _get_matcher_parts(obj):
         pred_handler = _check_nan
         repr_string = 'NaN'
     elif isinstance(obj, regex_types):
-        pred_handler = lambda x: _check_regex(obj, x)
+        pred_handler = partial(_check_regex, obj)
         repr_string = 're.compile({0!r})'.format(obj.pattern)
     elif isinstance(obj, set):
-        pred_handler = lambda x: _check_set(obj, x)
+        pred_handler = partial(_check_set, obj)
         repr_string = repr(obj)
     else:
         return None
@@ -175,6 +177,172 @@ def get_matcher(obj):
     return _get_matcher_or_original(obj)
 
 
+# Literal types whose equality comparisons are cheap and never call
+# user-defined code when the literal is on the left-hand side.
+_literal_types = (str, bytes, int, float, complex, type(None))
+
+
+# Expression templates (and cost ranks) for each kind of tuple field.
+# Ranks are used to order the checks from cheapest to most expensive:
+# 0 for built-in literals, 1 for types, 2 for other built-in handlers,
+# and 3 for user-defined callables and objects.
+_field_templates = {
+    'literal': (0, '({0} is {1} or {1} == {0})'),
+    'object': (3, '({0} is {1} or {1} == {0})'),
+    'type': (1, '({0} is {1} or isinstance({0}, {1}))'),
+    'callable': (3, '({0} is {1} or {1}({0}))'),
+    'handler': (2, '{1}({0})'),
+}
+
+
+def _get_field_kind(expected):
+    """Return a 2-tuple containing the kind of check needed for the
+    *expected* tuple field and the object used by the check. If the
+    field needs no check (a wildcard), the kind is None.
+    """
+    if not isinstance(expected, MatcherObject):
+        if type(expected) in _literal_types:
+            return 'literal', expected
+        return 'object', expected
+
+    func = expected._func
+    if func is _check_wildcard:
+        return None, None
+
+    if isinstance(func, partial) and func.func is _check_type:
+        return 'type', func.args[0]
+
+    if isinstance(func, partial) and func.func is _check_callable:
+        return 'callable', func.args[0]
+
+    return 'handler', func
+
+
+def _build_tuple_factory(kinds):
+    """Return a 2-tuple containing a factory function and a list of
+    folded literal index groups for tuple matchers whose fields have
+    the given *kinds*. The factory is called with the matcher, a
+    tuple of values for each literal group, and the objects for each
+    checked field (in field order) and returns the compiled function.
+    """
+    size = len(kinds)
+
+    # Split the checks into segments at each user-defined check. Only
+    # checks within a segment are reordered so user-defined code runs
+    # in the same left-to-right order as a normal tuple comparison.
+    segments = [[]]
+    for index, kind in enumerate(kinds):
+        if not kind:
+            continue
+        rank, template = _field_templates[kind]
+        expr = template.format('v{0}'.format(index), 'c{0}'.format(index))
+        if rank == 3:
+            segments.append([(rank, index, expr)])
+            segments.append([])
+        else:
+            segments[-1].append((rank, index, expr))
+
+    expressions = []
+    literal_groups = []
+    for checks in segments:
+        checks.sort(key=lambda check: check[:2])
+
+        # Fold built-in literals into a single tuple comparison.
+        literals = [index for rank, index, _ in checks if rank == 0]
+        if len(literals) > 1:
+            variables = ', '.join('v{0}'.format(i) for i in literals)
+            expressions.append('l{0} == ({1},)'.format(len(literal_groups), variables))
+            literal_groups.append(literals)
+        else:
+            expressions.extend(expr for rank, _, expr in checks if rank == 0)
+        expressions.extend(expr for rank, _, expr in checks if rank != 0)
+
+    if size == 1:
+        unpack = 'v0, = other'
+    else:
+        unpack = ', '.join('v{0}'.format(i) for i in range(size)) + ' = other'
+
+    params = ['matcher']
+    params.extend('l{0}'.format(i) for i in range(len(literal_groups)))
+    params.extend('c{0}'.format(i) for i, kind in enumerate(kinds) if kind)
+    source = (
+        'def make_match_tuple({0}):\n'
+        '    def match_tuple(other):\n'
+        '        if not isinstance(other, tuple) or len(other) != {1}:\n'
+        '            return matcher == other\n'
+        '        {2}\n'
+        '        return True if ({3}) else False\n'
+        '    return match_tuple\n'
+    ).format(', '.join(params), size, unpack, ' and '.join(expressions) or 'True')
+
+    namespace = {}
+    exec(source, namespace)
+    return namespace['make_match_tuple'], literal_groups
+
+
+# Factory functions for compiled tuple matchers, keyed by the kinds
+# of their fields. Matchers with the same shape (e.g., ``('a', int)``
+# and ``('b', int)``) share a factory so exec() is only called once.
+_tuple_factories = {}
+_MAX_TUPLE_FACTORIES = 256
+
+
+def _compile_tuple(matcher):
+    """Return a function that checks tuples the same way comparing
+    them with the MatcherTuple *matcher* would. The function is built
+    from generated source code so the checks for all fields run in a
+    single, flat expression.
+
+    Built-in checks are reordered by cost so that cheap checks can
+    reject a tuple before expensive ones are run, and built-in literal
+    fields are folded into a single tuple comparison. Checks are never
+    moved across user-defined callables or objects, so user code runs
+    in the same order (and for the same tuples) as it would when the
+    tuple is compared directly. Tuples of a different length are
+    compared directly, too.
+    """
+    kinds = []
+    objects = []
+    for expected in matcher:
+        kind, obj = _get_field_kind(expected)
+        kinds.append(kind)
+        if kind:
+            objects.append(obj)
+    kinds = tuple(kinds)
+
+    try:
+        factory, literal_groups = _tuple_factories[kinds]
+    except KeyError:
+        factory, literal_groups = _build_tuple_factory(kinds)
+        if len(_tuple_factories) >= _MAX_TUPLE_FACTORIES:
+            _tuple_factories.clear()
+        _tuple_factories[kinds] = factory, literal_groups
+
+    args = [matcher]
+    args.extend(tuple(matcher[i] for i in group) for group in literal_groups)
+    args.extend(objects)
+    return factory(*args)
+
+
+# Number of calls before a Predicate compiles its tuple matcher.
+_COMPILE_AFTER_CALLS = 8
+
+
+def compile_matcher(matcher):
+    """Return a function of one argument that gives the same result
+    as comparing *matcher* with the argument using the "==" operator.
+
+    The returned function calls the matcher's handler directly (or
+    checks tuple fields in a flat loop) so that each call avoids the
+    rich comparison dispatch of MatcherObject and MatcherTuple.
+    """
+    if isinstance(matcher, MatcherObject):
+        return matcher._func
+    if isinstance(matcher, MatcherTuple):
+        return _compile_tuple(matcher)
+    return partial(eq, matcher)
+
+
 class Predicate(object):
     """A Predicate is used like a function of one argument that
     returns ``True`` when applied to a matching value and ``False``
@@ -298,12 +466,19 @@ class Predicate(object):
         if isinstance(obj, Predicate):
             self.obj = obj.obj
             self.matcher = obj.matcher
+            self._func = obj._func
+            self._calls = obj._calls
             self._inverted = obj._inverted
             if hasattr(obj, '__name__'):
                 self.__name__ = obj.__name__
         else:
             self.obj = obj
             self.matcher = get_matcher(obj)
+            if isinstance(self.matcher, MatcherTuple):
+                self._func = None  # <- Compiled after it has been called a few times.
+            else:
+                self._func = compile_matcher(self.matcher)
+            self._calls = 0
             self._inverted = False
 
         if name is not None:
@@ -312,9 +487,25 @@ class Predicate(object):
                 raise ValueError(message.format(name))
             self.__name__ = name
 
+    def _get_tuple_function(self):
+        """Return a function to check values against a tuple matcher.
+        Compiling a tuple matcher costs more than a few comparisons,
+        so it is compiled only after the predicate has been called
+        _COMPILE_AFTER_CALLS times (many predicates are used once).
+        """
+        self._calls += 1
+        if self._calls < _COMPILE_AFTER_CALLS:
+            return partial(eq, self.matcher)
+        self._func = compile_matcher(self.matcher)
+        return self._func
+
     def __call__(self, other):
+        func = self._func
+        if func is None:
+            func = self._get_tuple_function()
+
         try:
-            is_match = self.matcher == other
+            is_match = func(other)
         except TypeError:
             is_match = False
 
@@ -326,6 +517,8 @@ class Predicate(object):
         new_pred = self.__class__.__new__(self.__class__)
         new_pred.obj = self.obj
         new_pred.matcher = self.matcher
+        new_pred._func = self._func
+        new_pred._calls = self._calls
         new_pred._inverted = self._inverted
         if hasattr(self, '__name__'):
             new_pred.__name__ = self.__name__
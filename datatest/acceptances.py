@@ -12,9 +12,9 @@ __all__ = [
     'AcceptedPercent',
     'AcceptedCount',
     'AcceptedFuzzy',
+    'AcceptedBaseline',
 ]
 
-import difflib
 import inspect
 from numbers import Number
 from ._compatibility.builtins import *
@@ -24,6 +24,10 @@ from ._compatibility.collections.abc import Mapping
 from ._compatibility import contextlib
 from ._compatibility import itertools
 
+from ._baseline import BaselineFile
+from ._baseline import key_fingerprint
+from ._baseline import difference_fingerprint
+from ._fuzzy import FuzzyMatcher
 from ._utils import BaseElement
 from ._utils import exhaustible
 from ._utils import nonstringiter
@@ -34,6 +38,7 @@ from .differences import (
     Missing,
     Extra,
     Invalid,
+    _nan_to_token,
 )
 
 
@@ -190,24 +195,27 @@ class BaseAcceptance(abc.ABC):
         if exc_type and not issubclass(exc_type, ValidationError):
             raise exc_value
 
-        differences = getattr(exc_value, 'differences', [])
-        is_not_mapping = not isinstance(differences, Mapping)
+        pending = getattr(exc_value, '_make_differences', None)
+        if isinstance(pending, _AcceptedItems):
+            # The error was raised by an enclosed acceptance and its
+            # differences have not been built yet. Its remaining items
+            # are used directly (rather than serializing differences
+            # again) so that nested acceptances are applied in a
+            # single pass and differences are only built once.
+            stream = iter(pending.items)
+            is_not_mapping = pending.is_not_mapping
+        else:
+            differences = getattr(exc_value, 'differences', [])
+            is_not_mapping = not isinstance(differences, Mapping)
+            stream = self._serialized_items(differences)
 
-        stream = self._serialized_items(differences)
-        stream = self._filterfalse(stream)
-        differences = self._deserialized_items(stream)
+        remaining = list(self._filterfalse(stream))
 
-        if not differences:
+        if not remaining:
             return True  # <- EXIT!
 
         __tracebackhide__ = True  # Set pytest flag to hide traceback.
 
-        if is_not_mapping:
-            assert len(differences) == 1
-            differences = differences.popitem()[1]
-            if isinstance(differences, BaseDifference):
-                differences = [differences]
-
         # Extend description with acceptance message.
         if self.msg:
             if exc_value.description:
@@ -217,8 +225,10 @@ class BaseAcceptance(abc.ABC):
         else:
             message = exc_value.description
 
-        # Build new ValidationError with remaining differences.
-        exc = ValidationError(differences, message)
+        # Build new ValidationError with remaining differences (the
+        # differences container is built when it is first accessed).
+        make_differences = _AcceptedItems(remaining, is_not_mapping)
+        exc = ValidationError._from_factory(make_differences, message)
 
         # Re-raised error inherits truncation behavior of original.
         exc._should_truncate = exc_value._should_truncate
@@ -230,19 +240,52 @@ class BaseAcceptance(abc.ABC):
                               #    effect as "raise ... from None").
 
 
+class _AcceptedItems(object):
+    """A callable that builds the differences of a ValidationError
+    from a list of serialized (key, difference) *items* that remain
+    after applying an acceptance.
+    """
+    def __init__(self, items, is_not_mapping):
+        self.items = items
+        self.is_not_mapping = is_not_mapping
+
+    def __call__(self):
+        differences = BaseAcceptance._deserialized_items(self.items)
+        if self.is_not_mapping:
+            assert len(differences) == 1
+            differences = differences.popitem()[1]
+            if isinstance(differences, BaseDifference):
+                differences = [differences]
+        return differences
+
+
 class CombinedAcceptance(BaseAcceptance):
     """Base class for combining acceptances using Boolean composition."""
     def __init__(self, left, right, msg=None):
         self.left = left
         self.right = right
         self.msg = msg
+        self._ordered = None
 
     @property
     def scope(self):
         """Return a combined set scope strings."""
         return self.left.scope | self.right.scope
 
+    def _get_ordered(self):
+        """Return a 2-tuple of the left and right acceptances in the
+        order they should be called.
+        """
+        first, second = self.left, self.right
+
+        # Acceptances with a larger precedence number must go on the
+        # right-hand side to ensure proper short-circuit behavior.
+        if self._get_precedence(first) > self._get_precedence(second):
+            first, second = second, first
+        return first, second
+
     def start_collection(self):
+        self._ordered = self._get_ordered()  # <- Computed once per collection.
         self.left.start_collection()
         self.right.start_collection()
 
@@ -267,12 +310,7 @@ class IntersectedAcceptance(CombinedAcceptance):
         return '({0!r} & {1!r})'.format(self.left, self.right)
 
     def call_predicate(self, item):
-        first, second = self.left, self.right
-
-        # Acceptances with a larger precedence number must go on the
-        # right-hand side to ensure proper short-circuit behavior.
-        if self._get_precedence(first) > self._get_precedence(second):
-            first, second = second, first
+        first, second = self._ordered or self._get_ordered()
 
         # The acceptance protocol is stateful so it's important to use
         # short-circuit evaluation to avoid calling the second acceptance
@@ -289,12 +327,7 @@ class UnionedAcceptance(CombinedAcceptance):
         return '({0!r} | {1!r})'.format(self.left, self.right)
 
     def call_predicate(self, item):
-        first, second = self.left, self.right
-
-        # Acceptances with a larger precedence number must go on the
-        # right-hand side to ensure proper short-circuit behavior.
-        if self._get_precedence(first) > self._get_precedence(second):
-            first, second = second, first
+        first, second = self._ordered or self._get_ordered()
 
         # The acceptance protocol is stateful so it's important to use
         # short-circuit evaluation to avoid calling the second acceptance
@@ -303,6 +336,79 @@ class UnionedAcceptance(CombinedAcceptance):
         return first.call_predicate(item) or second.call_predicate(item)
 
 
+class _AllowanceCounter(object):
+    """A multiset of accepted differences that can match and consume
+    differences in constant time.
+
+    Differences are counted by their class and NaN-normalized args so
+    that matches follow the same rules as BaseDifference.__eq__().
+    Differences with unhashable args (or that define their own
+    __eq__() method) are kept in a list and matched using a linear
+    search.
+
+    Consumed differences are tracked separately from the accepted
+    counts so that :meth:`reset` can restore the full allowance
+    without copying it.
+    """
+    def __init__(self, differences):
+        counts = defaultdict(int)
+        unhashable = []
+        make_key = self._make_key
+        for diff in differences:
+            key = make_key(diff)
+            if key is None:
+                unhashable.append(diff)
+            else:
+                counts[key] += 1
+
+        self._counts = dict(counts)
+        self._unhashable = unhashable
+        self.reset()
+
+    @staticmethod
+    def _make_key(diff):
+        """Return a hashable key for *diff* or None if it can only be
+        matched by equality.
+        """
+        if diff.__class__.__eq__ is not BaseDifference.__eq__:
+            return None
+        key = (diff.__class__, tuple(_nan_to_token(x) for x in diff.args))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def reset(self):
+        """Restore all consumed differences."""
+        self._consumed = defaultdict(int)
+        self._remaining_unhashable = list(self._unhashable)
+
+    def __contains__(self, diff):
+        key = self._make_key(diff)
+        if key is None:
+            return diff in self._remaining_unhashable
+        return key in self._counts
+
+    def consume(self, diff):
+        """Remove one match for *diff* and return True. If there are
+        no remaining matches, return False.
+        """
+        key = self._make_key(diff)
+        if key is None:
+            try:
+                self._remaining_unhashable.remove(diff)
+            except ValueError:
+                return False
+            return True
+
+        consumed = self._consumed
+        if consumed[key] < self._counts.get(key, 0):
+            consumed[key] += 1
+            return True
+        return False
+
+
 class AcceptedDifferences(BaseAcceptance):
     """Accepts differences that match *obj* without triggering a test
     failure. The given *obj* can be a difference class, a difference
@@ -348,6 +454,7 @@ class AcceptedDifferences(BaseAcceptance):
         self._current_scope = None
         self._current_allowance = None
         self._current_check = None
+        self._allowances = {}  # <- Allowance counters by group key.
 
     @staticmethod
     def _normalize_differences(obj):
@@ -391,37 +498,50 @@ class AcceptedDifferences(BaseAcceptance):
 
         return frozenset([scope])
 
+    def start_collection(self):
+        """Called first before any group is checked."""
+        self._allowances = {}  # <- Counters are rebuilt for each collection.
+
+    def _get_allowance(self, key, obj):
+        """Return the _AllowanceCounter for *obj* (building it on first
+        use). For mappings, a separate counter is kept for each *key*.
+        """
+        try:
+            return self._allowances[key]
+        except KeyError:
+            pass
+
+        if nonstringiter(obj):
+            allowance = _AllowanceCounter(obj)
+        else:
+            allowance = _AllowanceCounter([obj])
+        self._allowances[key] = allowance
+        return allowance
+
     def start_group(self, key):
         """Called before processing each group."""
-        # Get current allowance object.
         obj = self._obj
         if isinstance(obj, Mapping):
-            current_allowance = obj.get(key, [])
-        elif nonstringiter(obj):
-            if self._scope == 'whole':
-                current_allowance = obj  # Use a single persistent object.
-            else:
-                current_allowance = list(obj)  # Make a copy for each group.
+            obj = obj.get(key, [])
+            allowance_key = key  # <- Consumed matches persist for key.
+            reset_allowance = False
         else:
-            current_allowance = obj
+            allowance_key = None  # <- Uses a single counter for all groups.
+            reset_allowance = self._scope != 'whole'
 
         # Get current scope and check function.
-        if isinstance(current_allowance, type):
+        if isinstance(obj, type):
             default_scope = 'element'
-            current_allowance = [current_allowance]
             # Will check for matching differences using isinstance().
-            current_check = \
-                lambda x: current_allowance and isinstance(x, current_allowance[0])
+            current_allowance = [obj]
+            current_check = lambda x: isinstance(x, obj)
         else:
-            if nonstringiter(current_allowance):
-                default_scope = 'group'
-                if not hasattr(current_allowance, 'remove'):
-                    current_allowance = list(current_allowance)
-            else:
-                default_scope = 'element'
-                current_allowance = [current_allowance]
-            # Will check for matching differences using `in` operator.
-            current_check = lambda x: x in current_allowance
+            default_scope = 'group' if nonstringiter(obj) else 'element'
+            current_allowance = self._get_allowance(allowance_key, obj)
+            if reset_allowance:
+                current_allowance.reset()  # <- Restore full allowance.
+            # Will check for matching differences using the counter.
+            current_check = current_allowance.__contains__
 
         # Set "scope", "allowance", and "check" function for current group.
         self._current_scope = self._scope or default_scope
@@ -432,9 +552,15 @@ class AcceptedDifferences(BaseAcceptance):
         """Call once for each element."""
         _, diff = item
 
+        if self._current_scope == 'element':
+            return bool(self._current_check(diff))
+
+        allowance = self._current_allowance
+        if isinstance(allowance, _AllowanceCounter):
+            return allowance.consume(diff)
+
         if self._current_check(diff):
-            if self._current_scope != 'element':
-                self._current_allowance.remove(diff)
+            allowance.remove(diff)
             return True
         return False
 
@@ -674,10 +800,13 @@ class AcceptedFuzzy(BaseAcceptance):
 
     Similarity measures are determined using the ratio() method of
     the :py:class:`difflib.SequenceMatcher` class. The values range
-    from 0.0 (completely different) to 1.0 (exactly the same):
+    from 0.0 (completely different) to 1.0 (exactly the same). If
+    *similarity* is given, it is used in place of the default measure.
     """
-    def __init__(self, cutoff=0.6, msg=None):
+    def __init__(self, cutoff=0.6, msg=None, similarity=None):
         self.cutoff = cutoff
+        self.similarity = similarity
+        self._fuzzy_match = FuzzyMatcher(cutoff, similarity)
         super(AcceptedFuzzy, self).__init__(msg)
 
     @property
@@ -688,7 +817,13 @@ class AcceptedFuzzy(BaseAcceptance):
     def __repr__(self):
         cls_name = self.__class__.__name__
         msg_part = ', msg={0!r}'.format(self.msg) if self.msg else ''
-        return '{0}(cutoff={1!r}{2})'.format(cls_name, self.cutoff, msg_part)
+        if self.similarity is not None:
+            similarity = getattr(self.similarity, '__name__', repr(self.similarity))
+            similarity_part = ', similarity={0}'.format(similarity)
+        else:
+            similarity_part = ''
+        return '{0}(cutoff={1!r}{2}{3})'.format(
+            cls_name, self.cutoff, msg_part, similarity_part)
 
     def call_predicate(self, item):
         diff = item[1]
@@ -699,13 +834,7 @@ class AcceptedFuzzy(BaseAcceptance):
         except AttributeError:
             return False  # <- EXIT!
 
-        try:
-            matcher = difflib.SequenceMatcher(a=a, b=b)
-            similarity = matcher.ratio()
-        except TypeError:
-            return False  # <- EXIT!
-
-        return similarity >= self.cutoff
+        return self._fuzzy_match(a, b)
 
 
 class AcceptedCount(BaseAcceptance):
@@ -754,6 +883,67 @@ class AcceptedCount(BaseAcceptance):
         return self._count <= self._limit
 
 
+class AcceptedBaseline(BaseAcceptance):
+    """Accepts differences that were recorded in the baseline file at
+    *path* (see :meth:`ValidationError.write_baseline`). Differences
+    are matched by key and by their class name and NaN-normalized
+    args (compared using their repr()).
+
+    The *scope* can be ``'element'``, ``'group'`` (the default), or
+    ``'whole'``. These follow the same rules as a mapping used with
+    :class:`AcceptedDifferences`: with a group-wise or whole-error
+    scope, each recorded difference accepts one matching difference.
+    """
+    def __init__(self, path, msg=None, scope=None):
+        if scope not in (None, 'element', 'group', 'whole'):
+            message = "scope may be 'element', 'group', or 'whole', got {0}"
+            raise ValueError(message.format(scope))
+
+        super(AcceptedBaseline, self).__init__(msg)
+        self.path = path
+        self._scope = scope
+        self._baseline = BaselineFile(path)
+        self._consumed = None  # Properties to hold working values
+        self._key_fp = None    # during acceptance checking.
+
+    @property
+    def scope(self):
+        """Return scope as a frozenset."""
+        return frozenset([self._scope or 'group'])
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        msg_part = ', msg={0!r}'.format(self.msg) if self.msg else ''
+        scope_part = ', scope={0!r}'.format(self._scope) if self._scope else ''
+        return '{0}({1!r}{2}{3})'.format(cls_name, self.path, msg_part, scope_part)
+
+    def start_collection(self):
+        self._baseline.open()
+        self._consumed = defaultdict(int)
+
+    def start_group(self, key):
+        self._key_fp = key_fingerprint(key)
+        if self._scope != 'whole':
+            self._consumed = defaultdict(int)
+
+    def call_predicate(self, item):
+        diff_fp = difference_fingerprint(item[1])
+        count = self._baseline.count(self._key_fp, diff_fp)
+        if self._scope == 'element':
+            return count > 0
+
+        consumed = self._consumed
+        fingerprints = (self._key_fp, diff_fp)
+        if consumed[fingerprints] < count:
+            consumed[fingerprints] += 1
+            return True
+        return False
+
+    def end_collection(self):
+        self._baseline.close()
+        self._consumed = None
+
+
 ##########################################
 # Factory object for pytest-style testing.
 ##########################################
@@ -974,7 +1164,7 @@ class AcceptedFactoryType(object):
         """
         return AcceptedPercent(lower, upper, msg)
 
-    def fuzzy(self, cutoff=0.6, msg=None):
+    def fuzzy(self, cutoff=0.6, msg=None, similarity=None):
         """Returns a context manager that accepts invalid strings
         that match their expected value with a similarity greater
         than or equal to *cutoff* (default 0.6). Similarity measures
@@ -982,6 +1172,9 @@ class AcceptedFactoryType(object):
         <difflib.SequenceMatcher.ratio>` from the Standard Library's
         :py:mod:`difflib` module. The values range from ``1.0``
         (exactly the same) to ``0.0`` (completely different).
+        An alternative measure can be given as a *similarity*
+        function of two strings that returns a value in the same
+        range.
 
         The following example accepts string differences that match
         with a ratio of ``0.6`` or greater:
@@ -1008,7 +1201,7 @@ class AcceptedFactoryType(object):
                 'B': Invalid('bbx', expected='bbb'),
             }
         """
-        return AcceptedFuzzy(cutoff=cutoff, msg=msg)
+        return AcceptedFuzzy(cutoff=cutoff, msg=msg, similarity=similarity)
 
     def count(self, number, msg=None, scope=None):
         """Returns a context manager that accepts up to a given
@@ -1043,6 +1236,44 @@ class AcceptedFactoryType(object):
         """
         return AcceptedCount(number, msg=msg, scope=scope)
 
+    def baseline(self, path, msg=None, scope=None):
+        """Returns a context manager that accepts the differences
+        recorded in the baseline file at *path*. Baselines are written
+        with :meth:`ValidationError.write_baseline` and are used to
+        keep track of known issues that are too numerous to accept
+        with a list in the test itself. Differences are matched using
+        indexed lookups so the baseline is never loaded into memory.
+
+        The following example accepts known differences that were
+        recorded in an earlier run:
+
+        .. code-block:: python
+            :emphasize-lines: 11
+
+            from datatest import validate, accepted, ValidationError
+
+            data = {'A': 'x', 'B': 'y', 'C': 'z'}
+
+            try:
+                validate(data, 'x')
+            except ValidationError as err:
+                err.write_baseline('known_issues.sqlite3')
+
+            with accepted.baseline('known_issues.sqlite3'):
+                validate(data, 'x')
+
+        By default, each recorded difference accepts one matching
+        difference per group. If *scope* is ``'element'``, all
+        differences with a recorded match are accepted.
+
+        Differences are matched by a fingerprint of their repr().
+        Equal numbers of different types (like ``1`` and ``1.0``)
+        and sets or mappings in any order will match, but objects
+        whose repr() changes from run to run (e.g., reprs that
+        include a memory address) will not.
+        """
+        return AcceptedBaseline(path, msg=msg, scope=scope)
+
     def __repr__(self):
         default_repr = super(AcceptedFactoryType, self).__repr__()
         name_start = default_repr.index(self.__class__.__name__)
@@ -67,11 +67,12 @@ class DataTestCase(TestCase):
         self._apply_validation(validate.approx, data, requirement,
                                places=places, msg=msg, delta=delta)
 
-    def assertValidFuzzy(self, data, requirement, cutoff=0.6, msg=None):
+    def assertValidFuzzy(self, data, requirement, cutoff=0.6, msg=None,
+                         similarity=None):
         """Wrapper for :meth:`validate.fuzzy`."""
         __tracebackhide__ = _pytest_tracebackhide
         self._apply_validation(validate.fuzzy, data, requirement,
-                               cutoff=cutoff, msg=msg)
+                               cutoff=cutoff, msg=msg, similarity=similarity)
 
     def assertValidInterval(self, data, min=None, max=None, msg=None):
         """Wrapper for :meth:`validate.interval`."""
@@ -143,9 +144,9 @@ class DataTestCase(TestCase):
         """
         return AcceptedPercent(lower, upper, msg)
 
-    def acceptedFuzzy(self, cutoff=0.6, msg=None):
+    def acceptedFuzzy(self, cutoff=0.6, msg=None, similarity=None):
         """Wrapper for :meth:`accepted.fuzzy`."""
-        return AcceptedFuzzy(cutoff=cutoff, msg=msg)
+        return AcceptedFuzzy(cutoff=cutoff, msg=msg, similarity=similarity)
 
     def acceptedCount(self, number, msg=None, scope=None):
         """Wrapper for :meth:`accepted.count`."""
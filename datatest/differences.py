@@ -8,11 +8,13 @@ __all__ = [
     'Deviation',
 ]
 
+from array import array
 from cmath import isnan
 from datetime import timedelta
 from ._compatibility.builtins import *
 from ._compatibility import abc
 from ._compatibility.contextlib import suppress
+from ._compatibility.itertools import groupby
 
 from ._utils import _make_token
 from ._utils import pretty_timedelta_repr
@@ -91,6 +93,14 @@ class BaseDifference(abc.ABC):
             hashfail.__cause__ = getattr(err, '__cause__', None)  # getattr for 2.x support
             raise hashfail
 
+    def __reduce_ex__(self, protocol):
+        # Built-in differences are pickled compactly using their args.
+        # Other subclasses may have constructors that don't accept
+        # their args so they use the default behavior.
+        if type(self) in (Missing, Extra, Invalid, Deviation):
+            return (self.__class__, self.args)
+        return super(BaseDifference, self).__reduce_ex__(protocol)
+
     def __repr__(self):
         cls_name = self.__class__.__name__
         args_repr = ', '.join(
@@ -350,3 +360,156 @@ def _make_difference(actual, expected, show_expected=True):
         if show_expected:
             return Invalid(actual, expected)
         return Invalid(actual)
+
+
+# Types whose subtraction methods only support numbers or other
+# instances of the same type. Subtracting an object that has no
+# __rsub__() method from one of these always raises a TypeError.
+_NO_SUBTRACTION_TYPES = frozenset([
+    str, type(u''), bytes, int, float, complex, bool, type(None),
+    tuple, list, dict, set, frozenset,
+])
+
+# Numeric types that can not be subtracted from non-numeric builtins.
+_NUMERIC_TYPES = frozenset([int, float, complex])
+_NON_NUMERIC_TYPES = frozenset([str, type(u''), bytes, type(None)])
+
+
+def _get_difference_factory(expected, show_expected=True):
+    """Return a function of one argument, *actual*, that returns the
+    same difference as ``_make_difference(actual, expected,
+    show_expected)``.
+
+    The function is selected once for the given *expected* value
+    using its type. When the type of *actual* shows that the result
+    must be a Deviation or an Invalid difference, it is created
+    directly rather than attempting the subtraction and catching
+    the exception.
+    """
+    if expected is NOVALUE:
+        return lambda actual: _make_difference(actual, expected, show_expected)
+
+    if show_expected:
+        make_invalid = lambda actual: Invalid(actual, expected)
+    else:
+        make_invalid = Invalid
+
+    if isinstance(expected, bool):
+        def factory(actual):
+            if actual is NOVALUE:
+                return Missing(expected)
+            return make_invalid(actual)
+        return factory
+
+    expected_type = type(expected)
+    if expected_type in _NUMERIC_TYPES:
+        invalid_types = _NON_NUMERIC_TYPES
+    elif not hasattr(expected_type, '__rsub__'):
+        invalid_types = _NO_SUBTRACTION_TYPES
+    else:
+        invalid_types = None
+
+    if not invalid_types:
+        return lambda actual: _make_difference(actual, expected, show_expected)
+
+    if invalid_types is _NON_NUMERIC_TYPES:
+        def factory(actual):
+            actual_type = type(actual)
+            if actual_type in _NUMERIC_TYPES:
+                try:
+                    return Deviation(actual - expected, expected)
+                except ValueError:  # <- Deviation is too small to represent.
+                    return make_invalid(actual)
+            if actual_type in invalid_types:
+                return make_invalid(actual)
+            return _make_difference(actual, expected, show_expected)
+        return factory
+
+    def factory(actual):
+        if type(actual) in invalid_types:
+            return make_invalid(actual)
+        return _make_difference(actual, expected, show_expected)
+    return factory
+
+
+def _pack_column(values):
+    """Return a list of *values* as an array of machine values when
+    all values are floats or integers, else return the list as-is.
+    """
+    if all(type(x) is float for x in values):
+        return array('d', values)
+
+    if all(type(x) is int for x in values):
+        try:
+            return array('q', values)
+        except (OverflowError, ValueError):  # <- ValueError if 'q'
+            pass                             #    is not supported.
+    return values
+
+
+def _new_single_arg(cls, value):
+    diff = object.__new__(cls)
+    diff._args = (value,)
+    return diff
+
+
+def _new_invalid(cls, invalid, expected=NOVALUE):
+    diff = object.__new__(cls)
+    diff._invalid = invalid
+    diff._expected = expected
+    return diff
+
+
+def _new_deviation(cls, deviation, expected):
+    diff = object.__new__(cls)
+    diff._deviation = deviation
+    diff._expected = expected
+    return diff
+
+
+# Functions to rebuild already-verified differences without
+# re-running the checks in their __init__() methods.
+_rebuild_functions = {
+    Missing: _new_single_arg,
+    Extra: _new_single_arg,
+    Invalid: _new_invalid,
+    Deviation: _new_deviation,
+}
+
+
+def _pack_differences(differences):
+    """Return a compact, picklable representation of an iterable of
+    difference objects (use _unpack_differences() to restore them).
+
+    Consecutive differences of the same built-in type and number of
+    arguments are stored together as a run of argument columns. Columns of
+    floats or integers are stored as arrays of machine values so they
+    are pickled as raw bytes rather than as individual objects.
+    """
+    runs = []
+    keyfunc = lambda diff: (diff.__class__, len(diff.args))
+    for (cls, _), group in groupby(differences, key=keyfunc):
+        group = list(group)
+        if cls not in _rebuild_functions:
+            # Other subclasses may not accept their args as constructor
+            # arguments so they are stored as regular objects.
+            runs.append((None, len(group), (group,)))
+            continue
+        columns = tuple(_pack_column(list(c)) for c in zip(*(d.args for d in group)))
+        runs.append((cls, len(group), columns))
+    return tuple(runs)
+
+
+def _unpack_differences(packed):
+    """Return a list of difference objects from the output of
+    _pack_differences().
+    """
+    differences = []
+    for cls, count, columns in packed:
+        if cls is None:
+            differences.extend(columns[0])
+            continue
+
+        rebuild = _rebuild_functions[cls]
+        differences.extend(rebuild(cls, *args) for args in zip(*columns))
+    return differences
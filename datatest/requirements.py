@@ -24,13 +24,17 @@ from .differences import (
     Invalid,
     Missing,
     _make_difference,
+    _get_difference_factory,
     NOVALUE,
 )
+from ._fuzzy import FuzzyMatcher
 from ._normalize import normalize
 from ._utils import BaseElement
 from ._utils import IterItems
+from ._utils import exhaustible
 from ._utils import iterpeek
 from ._utils import nonstringiter
+from ._utils import regex_types
 from ._utils import string_types
 from ._vendor.predicate import Predicate
 
@@ -221,6 +225,18 @@ class ItemsRequirement(BaseRequirement):
 
 _INCONSISTENT = object()  # Marker for inconsistent descriptions.
 
+
+def _unwrap_differences(differences, description):
+    """Return a 2-tuple containing a single difference (or a list of
+    two or more differences) and a description. If *differences* is
+    empty, None is returned instead.
+    """
+    if not differences:
+        return None
+    if len(differences) == 1:
+        return differences[0], description  # Unwrap if single difference.
+    return differences, description
+
 class GroupRequirement(BaseRequirement):
     """A class to check that groups of data fulfill a specific need
     or expectation.
@@ -229,20 +245,51 @@ class GroupRequirement(BaseRequirement):
     def check_group(self, group):
         raise NotImplementedError()
 
+    def check_element(self, element):
+        """Check a single *element* and return a 2-tuple containing
+        a difference (or a list of differences) and a description.
+        If *element* satisfies the requirement, None is returned.
+
+        By default, *element* is wrapped in a list and checked as a
+        group. Subclasses can override this method when a single
+        element can be checked more directly.
+        """
+        diff, desc = self.check_group([element])
+        return _unwrap_differences(list(diff), desc)
+
+    def _check_group_overridden(self, cls):
+        """Return True if a subclass overrides *cls*'s check_group()
+        method. Direct check_element() implementations must defer to
+        the default group-wrapping behavior when this is the case.
+        Results are cached on the instance since this is called for
+        every element.
+        """
+        try:
+            return self._group_overridden[cls]
+        except AttributeError:
+            self._group_overridden = {}
+        except KeyError:
+            pass
+
+        method = type(self).check_group
+        original = cls.check_group
+        overridden = getattr(method, '__func__', method) is not \
+            getattr(original, '__func__', original)
+        self._group_overridden[cls] = overridden
+        return overridden
+
     def check_items(self, items, autowrap=True):
         differences = []
         description = ''
         check_group = self.check_group
+        check_element = self.check_element
 
         for key, value in items:
             if isinstance(value, BaseElement) and autowrap:
-                value = [value]  # Wrap element to treat it as a group.
-                diff, desc = check_group(value)
-                diff = list(diff)
-                if len(diff) == 1:
-                    diff = diff[0]  # Unwrap if single difference.
-                if not diff:
+                result = check_element(value)
+                if not result:
                     continue
+                diff, desc = result
             else:
                 diff, desc = check_group(value)
                 first_element, diff = iterpeek(diff, None)
@@ -299,19 +346,33 @@ class RequiredPredicate(GroupRequirement):
 
     def _get_differences(self, group):
         pred = self._pred
-        obj = self._obj
-        show_expected = self.show_expected
+        make_difference = _get_difference_factory(self._obj, self.show_expected)
         for element in group:
             result = pred(element)
             if not result:
-                yield _make_difference(element, obj, show_expected)
+                yield make_difference(element)
             elif isinstance(result, BaseDifference):
                 yield result
 
+    def _get_description(self):
+        return _build_description(self._obj)
+
     def check_group(self, group):
         differences = self._get_differences(group)
-        description = _build_description(self._obj)
-        return differences, description
+        return differences, self._get_description()
+
+    def check_element(self, element):
+        if self._check_group_overridden(RequiredPredicate):
+            return super(RequiredPredicate, self).check_element(element)
+
+        result = self._pred(element)
+        if not result:
+            diff = _get_difference_factory(self._obj, self.show_expected)(element)
+        elif isinstance(result, BaseDifference):
+            diff = result
+        else:
+            return None
+        return diff, self._get_description()
 
     def check_items(self, items):
         if self.__class__ is not RequiredPredicate:
@@ -319,7 +380,7 @@ class RequiredPredicate(GroupRequirement):
 
         pred = self._pred
         obj = self._obj
-        show_expected = self.show_expected
+        make_difference = _get_difference_factory(obj, self.show_expected)
         check_group = self.check_group
 
         differences = []
@@ -327,7 +388,7 @@ class RequiredPredicate(GroupRequirement):
             if isinstance(value, BaseElement):
                 result = pred(value)
                 if not result:
-                    diff = _make_difference(value, obj, show_expected)
+                    diff = make_difference(value)
                 elif isinstance(result, BaseDifference):
                     diff = result
                 else:
@@ -349,6 +410,15 @@ class RequiredRegex(RequiredPredicate):
         self.flags = flags
         super(RequiredRegex, self).__init__(obj, show_expected=show_expected)
 
+        # When *obj* is a single pattern, elements are searched directly
+        # (rather than through the predicate) to reduce call overhead.
+        if isinstance(obj, string_types):
+            self._regex = re.compile(obj, flags)
+        elif isinstance(obj, regex_types):
+            self._regex = obj
+        else:
+            self._regex = None
+
     def predicate_factory(self, obj):
         """Return Predicate object where string components have been
         replaced with compiled regular expression objects.
@@ -364,6 +434,38 @@ class RequiredRegex(RequiredPredicate):
             return Predicate(tuple(regex_or_orig(x) for x in obj))
         return Predicate(regex_or_orig(obj))
 
+    def _search_differences(self, group):
+        regex = self._regex
+        search = regex.search
+        make_difference = _get_difference_factory(self._obj, self.show_expected)
+        for element in group:
+            try:
+                if search(element) is not None:
+                    continue
+            except TypeError:
+                if element is regex:
+                    continue
+            yield make_difference(element)
+
+    def _get_differences(self, group):
+        if self._regex is None:
+            return super(RequiredRegex, self)._get_differences(group)
+        return self._search_differences(group)
+
+    def check_element(self, element):
+        regex = self._regex
+        if regex is None or self._check_group_overridden(RequiredPredicate):
+            return super(RequiredRegex, self).check_element(element)
+
+        try:
+            if regex.search(element) is not None:
+                return None
+        except TypeError:
+            if element is regex:
+                return None
+        diff = _get_difference_factory(self._obj, self.show_expected)(element)
+        return diff, self._get_description()
+
 
 class RequiredApprox(RequiredPredicate):
     """Require that numeric values are approximately equal.
@@ -418,10 +520,6 @@ class RequiredApprox(RequiredPredicate):
             return 'not equal within delta of {0}'.format(self.delta)
         return 'not equal within {0} decimal places'.format(self.places)
 
-    def check_group(self, group):
-        differences, _ = super(RequiredApprox, self).check_group(group)
-        return differences, self._get_description()
-
 
 class RequiredFuzzy(RequiredPredicate):
     """Require that strings match with a similarity greater than
@@ -429,38 +527,35 @@ class RequiredFuzzy(RequiredPredicate):
 
     Similarity measures are determined using the ratio() method
     of the difflib.SequenceMatcher class. The values range from
-    1.0 (exactly the same) to 0.0 (completely different).
+    1.0 (exactly the same) to 0.0 (completely different). If
+    *similarity* is given, it should be a function of two strings
+    that returns a measure in the same range---it is used in place
+    of the default measure.
     """
-    def __init__(self, obj, cutoff=0.6, show_expected=False):
+    def __init__(self, obj, cutoff=0.6, show_expected=False, similarity=None):
         self.cutoff = cutoff
+        self.similarity = similarity
         super(RequiredFuzzy, self).__init__(obj, show_expected=show_expected)
 
     def predicate_factory(self, obj):
         """Return Predicate object where string components have been
         replaced with fuzzy_match() function.
         """
-        cutoff = self.cutoff
-        def fuzzy_match(cutoff, a, b):
-            try:
-                matcher = difflib.SequenceMatcher(a=a, b=b)
-                return matcher.ratio() >= cutoff
-            except TypeError:
-                return False
+        fuzzy_match = FuzzyMatcher(self.cutoff, self.similarity)
 
         def fuzzy_or_orig(a):
             if isinstance(a, string_types):
-                return partial(fuzzy_match, cutoff, a)
+                return partial(fuzzy_match, a)
             return a
 
         if isinstance(obj, tuple):
             return Predicate(tuple(fuzzy_or_orig(x) for x in obj))
         return Predicate(fuzzy_or_orig(obj))
 
-    def check_group(self, group):
-        differences, description = super(RequiredFuzzy, self).check_group(group)
+    def _get_description(self):
+        description = super(RequiredFuzzy, self)._get_description()
         fuzzy_info = '{0}, fuzzy matching at ratio {1} or greater'
-        description = fuzzy_info.format(description, self.cutoff)
-        return differences, description
+        return fuzzy_info.format(description, self.cutoff)
 
 
 class RequiredInterval(RequiredPredicate):
@@ -520,9 +615,8 @@ class RequiredInterval(RequiredPredicate):
         self._description = description
         super(RequiredInterval, self).__init__(interval, show_expected=show_expected)
 
-    def check_group(self, group):
-        differences, _ = super(RequiredInterval, self).check_group(group)
-        return differences, self._description
+    def _get_description(self):
+        return self._description
 
 
 class RequiredSet(GroupRequirement):
@@ -551,6 +645,19 @@ class RequiredSet(GroupRequirement):
         )
         return differences, 'does not satisfy set membership'
 
+    def check_element(self, element):
+        if self._check_group_overridden(RequiredSet):
+            return super(RequiredSet, self).check_element(element)
+
+        requirement = self._set
+        if element in requirement:
+            matches = set([element])
+            differences = [Missing(x) for x in requirement if x not in matches]
+        else:
+            differences = [Missing(x) for x in requirement]
+            differences.append(Extra(element))
+        return _unwrap_differences(differences, 'does not satisfy set membership')
+
 
 _subset_superset_warning = """subset and superset warning:
 
@@ -598,6 +705,15 @@ class RequiredSuperset(GroupRequirement):
         description = 'must contain all elements of given requirement'
         return differences, description
 
+    def check_element(self, element):
+        if self._check_group_overridden(RequiredSuperset):
+            return super(RequiredSuperset, self).check_element(element)
+
+        matches = set([element])
+        differences = [Missing(x) for x in self._set if x not in matches]
+        description = 'must contain all elements of given requirement'
+        return _unwrap_differences(differences, description)
+
 
 class RequiredSubset(GroupRequirement):
     """A requirement to test that data is a subset of *requirement*."""
@@ -620,6 +736,14 @@ class RequiredSubset(GroupRequirement):
         description = 'may only contain elements of given requirement'
         return differences, description
 
+    def check_element(self, element):
+        if self._check_group_overridden(RequiredSubset):
+            return super(RequiredSubset, self).check_element(element)
+
+        if element in self._set:
+            return None
+        return Extra(element), 'may only contain elements of given requirement'
+
 
 class RequiredUnique(GroupRequirement):
     """A requirement to test that elements are unique."""
@@ -641,6 +765,11 @@ class RequiredUnique(GroupRequirement):
         differences = self._generate_differences(group)
         return differences, 'elements should be unique'
 
+    def check_element(self, element):
+        if self._check_group_overridden(RequiredUnique):
+            return super(RequiredUnique, self).check_element(element)
+        return None  # <- A single element is always unique.
+
     def check_data(self, data):
         data = normalize(data, lazy_evaluation=True)
 
@@ -723,35 +852,80 @@ class RequiredSequence(GroupRequirement):
         if not factory:
             factory = RequiredPredicate
         self._grouprequirement_factory = factory
+        self._matchers = None
 
-    def _generate_differences(self, group):
+    def _get_matcher(self, expected):
+        """Return a function of one argument, *actual*, that returns
+        a difference if *actual* does not satisfy the *expected* object
+        or None if it does.
+        """
         factory = self._grouprequirement_factory
+        if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
+                                          #    to use `is` here, do NOT
+                                          #    check using isinstance().
+            pred = Predicate(expected)
+            make_difference = _get_difference_factory(expected)
 
-        zipped = zip_longest(group, self.iterable, fillvalue=NOVALUE)
-        for actual, expected in zipped:
-            if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
-                                              #    to use `is` here, do NOT
-                                              #    check using isinstance().
-                pred = Predicate(expected)
+            def matcher(actual):
                 result = pred(actual)
                 if not result:
-                    yield _make_difference(actual, expected, show_expected=True)
+                    return make_difference(actual)
                 elif isinstance(result, BaseDifference):
-                    yield result
-            else:
-                # Get requirement.
-                requirement = factory(expected)
-                if isinstance(requirement, RequiredPredicate):
-                    requirement.show_expected = True
+                    return result
+                return None
+            return matcher
 
-                # Check element as group and yield unwrapped result.
-                diff, desc = requirement.check_group([actual])
+        # Get requirement.
+        requirement = factory(expected)
+        if isinstance(requirement, RequiredPredicate):
+            requirement.show_expected = True
+
+        def matcher(actual):
+            result = requirement.check_element(actual)
+            if not result:
+                return None
+            diff, _ = result
+            if not isinstance(diff, BaseDifference):
                 diff = list(diff)
-                if diff:
-                    if len(diff) > 1:
-                        msg = 'expected 0 or 1 differences, got {0}: {1!r}'
-                        raise ValueError(msg.format(len(diff), diff))
-                    yield diff[0]
+                msg = 'expected 0 or 1 differences, got {0}: {1!r}'
+                raise ValueError(msg.format(len(diff), diff))
+            return diff
+        return matcher
+
+    def _get_matchers(self):
+        """Return an iterable of matchers for each position in the
+        required iterable. When the iterable is a sequence, matchers
+        are created once and reused as long as the sequence still
+        holds the same objects (it may have been changed in place).
+        """
+        iterable = self.iterable
+        if not isinstance(iterable, Sequence):
+            return (self._get_matcher(x) for x in iterable)
+
+        snapshot = tuple(iterable)
+        cached = self._matchers
+        if cached is not None:
+            cached_snapshot, matchers = cached
+            if len(cached_snapshot) == len(snapshot) and \
+                    all(x is y for x, y in zip(cached_snapshot, snapshot)):
+                return matchers
+
+        matchers = [self._get_matcher(x) for x in snapshot]
+        self._matchers = (snapshot, matchers)
+        return matchers
+
+    def _generate_differences(self, group):
+        extra_matcher = None
+        zipped = zip_longest(group, self._get_matchers(), fillvalue=NOVALUE)
+        for actual, matcher in zipped:
+            if matcher is NOVALUE:
+                if extra_matcher is None:
+                    extra_matcher = self._get_matcher(NOVALUE)
+                matcher = extra_matcher
+
+            diff = matcher(actual)
+            if diff is not None:
+                yield diff
 
     def check_group(self, group):
         differences = self._generate_differences(group)
@@ -769,6 +943,7 @@ class RequiredMapping(ItemsRequirement):
             mapping = dict(mapping)
         self.mapping = mapping
         self._grouprequirement_factory = factory
+        self._value_checkers = None
 
     def abstract_factory(self, obj):
         """Return a group requirement type appropriate for the given
@@ -798,80 +973,231 @@ class RequiredMapping(ItemsRequirement):
 
         return _INCONSISTENT
 
-    def check_items(self, items):
-        required_mapping = self.mapping
-        differences = []
-        description = ''
-
-        # Check values using requirement of corresponding key.
-        keys_seen = set()
-        for item in items:
-            try:
-                key, value = item
-            except ValueError:
-                msg = ('item {0!r} is not a valid key/value pair; {1} '
-                       'expects a mapping or iterable of key/value pairs')
-                raise ValueError(msg.format(item, self.__class__.__name__))
+    def _get_value_checker(self, expected):
+        """Return a function of one argument, *value*, that checks
+        *value* against the *expected* object and returns the same
+        result as _check_value(). Predicates and requirements are
+        created once (when first needed) and reused for every call.
+        """
+        factory = self.abstract_factory(expected)
 
-            keys_seen.add(key)
+        if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
+                                          #    to use `is` here, do NOT
+                                          #    check using isinstance().
+            pred = Predicate(expected)
+        requirements = {}  # <- Cache of requirements by show_expected.
 
-            expected = required_mapping.get(key, NOVALUE)
-            factory = self.abstract_factory(expected)
+        def get_requirement(show_expected):
+            requirement = requirements.get(show_expected)
+            if requirement is None:
+                requirement = factory(expected) if factory else expected
+                if show_expected and isinstance(requirement, RequiredPredicate):
+                    requirement.show_expected = True
+                requirements[show_expected] = requirement
+            return requirement
 
+        def check_value(value):
             if isinstance(value, BaseElement):
-                if factory is RequiredPredicate:  # <- IMPORTANT: It is correct
-                                                  #    to use `is` here, do NOT
-                                                  #    check using isinstance().
+                if factory is RequiredPredicate:
                     # Skip requirement and use Predicate directly.
                     # Note: Performance benchmarking shows that this
                     # optimization can finish in 72% of the time it
                     # takes for the unoptimized case.
-                    pred = Predicate(expected)
                     result = pred(value)
                     if not result:
-                        diff = _make_difference(value, expected, show_expected=True)
-                        differences.append((key, diff))
-                        desc = _build_description(expected)
-                        description = self._update_description(description, desc)
+                        diff = _get_difference_factory(expected)(value)
+                        return diff, _build_description(expected)
                     elif isinstance(result, BaseDifference):
-                        differences.append((key, result))
-                        desc = _build_description(expected)
-                        description = self._update_description(description, desc)
-                else:
-                    # Get requirement.
-                    requirement = factory(expected) if factory else expected
-                    if isinstance(requirement, RequiredPredicate):
-                        requirement.show_expected = True
-
-                    # Check element as group and unwrap single element result.
-                    diff, desc = requirement.check_group([value])
-                    diff = list(diff)
-                    if len(diff) == 1:
-                        diff = diff[0]  # Unwrap if single difference.
-                    if diff:
-                        differences.append((key, diff))
-                        description = self._update_description(description, desc)
+                        return result, _build_description(expected)
+                    return None
+
+                return get_requirement(True).check_element(value)
+
+            # Normal group handling (`value` is already a group).
+            diff, desc = get_requirement(False).check_group(value)
+            first_item, diff = iterpeek(diff, None)
+            if first_item:
+                return diff, desc
+            return None
+
+        return check_value
+
+    def _check_value(self, value, expected):
+        """Check *value* against the *expected* object and return a
+        2-tuple containing a difference (or a non-empty iterable of
+        differences) and a description. If *value* satisfies the
+        requirement, None is returned instead.
+        """
+        if isinstance(value, BaseElement) \
+                and self.abstract_factory(expected) is RequiredPredicate:
+            # Use Predicate directly without creating a value checker.
+            result = Predicate(expected)(value)
+            if not result:
+                diff = _get_difference_factory(expected)(value)
+                return diff, _build_description(expected)
+            elif isinstance(result, BaseDifference):
+                return result, _build_description(expected)
+            return None
+
+        return self._get_value_checker(expected)(value)
+
+    def _prepare_value_checkers(self):
+        """Create and keep the value checkers for every key in the
+        required mapping so they are reused by later calls to
+        check_items(). The prepared requirement should not be modified
+        and can be shared between threads.
+        """
+        self._value_checkers = dict(
+            (key, self._get_value_checker(expected))
+            for key, expected in IterItems(self.mapping)
+        )
+
+    def _check_missing(self, expected):
+        """Return a 2-tuple containing a difference (or an iterable of
+        differences) and a description for an *expected* object whose
+        key is missing from the data under test.
+        """
+        factory = self.abstract_factory(expected)
+        requirement = factory(expected) if factory else expected
+
+        diff, desc = requirement.check_group([])  # Try empty container.
+        first_item, diff = iterpeek(diff, None)
+        if not first_item:
+            diff = _make_difference(NOVALUE, expected)
+        return diff, desc
+
+    def _split_item(self, item):
+        """Return *item* as a key/value pair or raise a ValueError."""
+        try:
+            key, value = item
+        except ValueError:
+            msg = ('item {0!r} is not a valid key/value pair; {1} '
+                   'expects a mapping or iterable of key/value pairs')
+            raise ValueError(msg.format(item, self.__class__.__name__))
+        return key, value
+
+    def check_items(self, items):
+        required_mapping = self.mapping
+        value_checkers = self._value_checkers
+        update_description = self._update_description
+        differences = []
+        description = ''
+
+        # Check values using requirement of corresponding key.
+        keys_seen = set()
+        for item in items:
+            key, value = self._split_item(item)
+            keys_seen.add(key)
+
+            if value_checkers is not None and key in value_checkers:
+                result = value_checkers[key](value)
             else:
-                # Normal group handling (`value` is already a group).
-                requirement = factory(expected) if factory else expected
-                diff, desc = requirement.check_group(value)
-                first_item, diff = iterpeek(diff, None)
-                if first_item:
-                    differences.append((key, diff))
-                    description = self._update_description(description, desc)
+                expected = required_mapping.get(key, NOVALUE)
+                result = self._check_value(value, expected)
+            if result:
+                diff, desc = result
+                differences.append((key, diff))
+                description = update_description(description, desc)
 
         # Check for expected keys that are missing from items.
         for key, expected in IterItems(required_mapping):
             if key not in keys_seen:
-                factory = self.abstract_factory(expected)
-                requirement = factory(expected) if factory else expected
+                diff, desc = self._check_missing(expected)
+                differences.append((key, diff))
+                description = update_description(description, desc)
+
+        if description is _INCONSISTENT or not description:
+            description = 'does not satisfy mapping requirements'
+        return differences, description
+
+
+class RequiredSortedMapping(RequiredMapping):
+    """A requirement to test a stream of key/value items against a
+    stream of required key/value items where both streams are sorted
+    by key (e.g., rows from an ``ORDER BY`` query or a sorted file).
+    If *factory* is given, it is used the same way as it is used by
+    :class:`RequiredMapping`.
+
+    Both streams are walked in lockstep (a sort-merge) so that no
+    set of seen keys needs to be kept in memory. The required items
+    are not loaded into memory either---if *items* is an exhaustible
+    iterator, the requirement can only be checked once (checking it
+    again raises a ValueError). When either stream contains keys that
+    are out of order or duplicated, a ValueError is raised::
+
+        from datatest import validate
+        from datatest.requirements import RequiredSortedMapping
+
+        required = [('A', 1), ('B', 2), ('C', 3)]  # <- Sorted by key.
+        data = [('A', 1), ('B', 2), ('C', 3)]      # <- Sorted by key.
+
+        validate(data, RequiredSortedMapping(required))
+    """
+    def __init__(self, items, factory=None):
+        if isinstance(items, Mapping):
+            items = sorted(IterItems(items), key=lambda item: item[0])
+        elif not isinstance(items, Iterable):
+            msg = 'expected iterable or mapping, got {0!r}'
+            raise TypeError(msg.format(items.__class__.__name__))
+        super(RequiredSortedMapping, self).__init__({}, factory)
+        self.mapping = items  # <- Not converted into a dict.
+        self._exhaustible = exhaustible(items)
+        self._consumed = False
+
+    def _iter_sorted_items(self, items, name):
+        """Generate key/value pairs from *items* and raise a ValueError
+        if keys are not unique and in ascending order.
+        """
+        previous_key = NOVALUE
+        for item in items:
+            key, value = self._split_item(item)
+            if previous_key is not NOVALUE and not previous_key < key:
+                msg = ('{0} keys must be unique and sorted in ascending '
+                       'order, got {1!r} after {2!r}')
+                raise ValueError(msg.format(name, key, previous_key))
+            previous_key = key
+            yield key, value
+
+    def check_items(self, items):
+        if self._exhaustible:
+            if self._consumed:
+                msg = ('required items were given as an exhaustible '
+                       'iterator and can only be checked once')
+                raise ValueError(msg)
+            self._consumed = True
+
+        update_description = self._update_description
+        differences = []
+        description = ''
+
+        required = self._iter_sorted_items(self.mapping, 'required')
+        required_item = next(required, None)
+
+        for key, value in self._iter_sorted_items(items, 'data'):
+            # Required keys that sort before the current key are missing.
+            while required_item and required_item[0] < key:
+                diff, desc = self._check_missing(required_item[1])
+                differences.append((required_item[0], diff))
+                description = update_description(description, desc)
+                required_item = next(required, None)
+
+            if required_item and required_item[0] == key:
+                result = self._check_value(value, required_item[1])
+                required_item = next(required, None)
+            else:
+                result = self._check_value(value, NOVALUE)
 
-                diff, desc = requirement.check_group([])  # Try empty container.
-                first_item, diff = iterpeek(diff, None)
-                if not first_item:
-                    diff = _make_difference(NOVALUE, expected)
+            if result:
+                diff, desc = result
                 differences.append((key, diff))
-                description = self._update_description(description, desc)
+                description = update_description(description, desc)
+
+        # Remaining required keys are missing from items.
+        while required_item:
+            diff, desc = self._check_missing(required_item[1])
+            differences.append((required_item[0], diff))
+            description = update_description(description, desc)
+            required_item = next(required, None)
 
         if description is _INCONSISTENT or not description:
             description = 'does not satisfy mapping requirements'
@@ -6,6 +6,7 @@ __all__ = [
     'ValidationError',
 ]
 
+import re
 import sys
 from ._compatibility.collections.abc import Iterable
 from ._compatibility.collections.abc import Mapping
@@ -13,13 +14,20 @@ from ._compatibility.collections.abc import Set
 from ._compatibility.functools import partial
 
 from .differences import BaseDifference
+from .differences import NOVALUE
+from .differences import _pack_differences
+from .differences import _unpack_differences
+from ._baseline import write_baseline
 from ._normalize import normalize
 from . import requirements
+from . import _vectorized
 from ._utils import BaseElement
 from ._utils import IterItems
 from ._utils import exhaustible
 from ._utils import iterpeek
 from ._utils import nonstringiter
+from ._utils import regex_types
+from ._utils import string_types
 from ._utils import _safesort_key
 
 
@@ -67,16 +75,35 @@ class ValidationError(AssertionError):
 
         # Initialize properties.
         self._differences = differences
+        self._make_differences = None
         self._description = description
         self._should_truncate = None
         self._truncation_notice = None
         self._sorted_str = True
 
+    @classmethod
+    def _from_factory(cls, make_differences, description=None):
+        """Return a new error whose differences are built by calling
+        *make_differences* when they are first accessed. The function
+        must return a non-empty collection of differences.
+        """
+        new_error = cls.__new__(cls)
+        new_error._differences = None
+        new_error._make_differences = make_differences
+        new_error._description = description
+        new_error._should_truncate = None
+        new_error._truncation_notice = None
+        new_error._sorted_str = True
+        return new_error
+
     @property
     def differences(self):
         """A collection of "difference" objects to describe elements
         in the data under test that do not satisfy the requirement.
         """
+        if self._make_differences is not None:
+            self._differences = self._make_differences()
+            self._make_differences = None
         return self._differences
 
     @property
@@ -87,15 +114,103 @@ class ValidationError(AssertionError):
     @property
     def args(self):
         """The tuple of arguments given to the exception constructor."""
-        return (self._differences, self._description)
+        return (self.differences, self._description)
+
+    def merge(self, *others):
+        """Return a new :exc:`ValidationError` that combines the
+        differences of this error with the differences of *others*
+        (e.g., partial results from separate processes or threads).
+
+        Lists of differences are concatenated. Mappings of differences
+        are combined by key---when a key appears in more than one
+        error, its differences are gathered into a single list. The
+        description is kept if all errors share the same description.
+        """
+        errors = (self,) + others
+        for err in others:
+            if not isinstance(err, ValidationError):
+                msg = 'expected ValidationError, got {0}'
+                raise TypeError(msg.format(err.__class__.__name__))
+
+        mapping_count = sum(isinstance(e.differences, Mapping) for e in errors)
+        if mapping_count == len(errors):
+            differences = {}
+            gathered = set()  # Keys whose values are new, merged lists.
+            for err in errors:
+                for key, value in IterItems(err.differences):
+                    if key not in differences:
+                        differences[key] = value
+                        continue
+
+                    if key not in gathered:
+                        existing = differences[key]
+                        if isinstance(existing, BaseDifference):
+                            differences[key] = [existing]
+                        else:
+                            differences[key] = list(existing)
+                        gathered.add(key)
+
+                    if isinstance(value, BaseDifference):
+                        differences[key].append(value)
+                    else:
+                        differences[key].extend(value)
+        elif mapping_count == 0:
+            differences = []
+            for err in errors:
+                differences.extend(err.differences)
+        else:
+            msg = 'cannot merge mappings of differences with non-mappings'
+            raise ValueError(msg)
+
+        descriptions = set(e._description for e in errors)
+        description = descriptions.pop() if len(descriptions) == 1 else None
+
+        merged = self.__class__(differences, description)
+        merged._sorted_str = all(e._sorted_str for e in errors)
+        return merged
+
+    def write_baseline(self, path):
+        """Write the differences of this error to a baseline file at
+        *path* (replacing any existing file). The differences can be
+        accepted in later runs with :meth:`accepted.baseline`.
+        """
+        write_baseline(path, self.differences)
+
+    def __reduce__(self):
+        """Support pickling with a compact representation of the
+        differences (see _pack_differences() for details).
+        """
+        differences = self.differences
+        if isinstance(differences, Mapping):
+            keys = []
+            sizes = []  # <- Size of -1 marks a single difference.
+            flattened = []
+            for key, value in IterItems(differences):
+                keys.append(key)
+                if isinstance(value, BaseDifference):
+                    sizes.append(-1)
+                    flattened.append(value)
+                else:
+                    value = list(value)
+                    sizes.append(len(value))
+                    flattened.extend(value)
+            packed = _pack_differences(flattened)
+        else:
+            keys = sizes = None
+            packed = _pack_differences(differences)
+
+        args = (self.__class__, packed, keys, sizes,
+                self._description, self._sorted_str)
+        return (_unpickle_validation_error, args)
 
     def __str__(self):
         # Prepare a format-differences callable.
-        if isinstance(self._differences, dict):
+        differences = self.differences
+        if isinstance(differences, dict):
             begin, end = '{', '}'
-            all_keys = sorted(self._differences.keys(), key=_safesort_key)
+            all_keys = sorted(differences.keys(), key=_safesort_key)
             def sorted_value(key):
-                value = self._differences[key]
+                value = differences[key]
                 if nonstringiter(value):
                     sort_args = lambda diff: _safesort_key(diff.args)
                     if self._sorted_str:
@@ -108,9 +223,9 @@ class ValidationError(AssertionError):
             begin, end = '[', ']'
             sort_args = lambda diff: _safesort_key(diff.args)
             if self._sorted_str:
-                iterator = iter(sorted(self._differences, key=sort_args))
+                iterator = iter(sorted(differences, key=sort_args))
             else:
-                iterator = iter(self._differences)
+                iterator = iter(differences)
             format_diff = lambda x: '    {0!r},'.format(x)
 
         # Format differences as a list of strings and get line count.
@@ -161,6 +276,26 @@ class ValidationError(AssertionError):
         return '{0}({1!r})'.format(cls_name, self.differences)
 
 
+def _unpickle_validation_error(cls, packed, keys, sizes, description, sorted_str):
+    """Rebuild a ValidationError from the values returned by its
+    __reduce__() method. If *keys* is None, the differences are
+    rebuilt as a list, else they are rebuilt as a dictionary.
+    """
+    differences = _unpack_differences(packed)
+    if keys is not None:
+        values = iter(differences)
+        differences = {}
+        for key, size in zip(keys, sizes):
+            if size == -1:
+                differences[key] = next(values)
+            else:
+                differences[key] = [next(values) for _ in range(size)]
+
+    err = cls(differences, description)
+    err._sorted_str = sorted_str
+    return err
+
+
 if sys.version_info[:2] >= (3, 7):
     # The _render_traceback_() method is only added to ValidationError
     # when using Python 3.7 or newer. It uses features that are new in
@@ -241,6 +376,63 @@ def _pytest_tracebackhide(excinfo):
     return excinfo.errisinstance(ValidationError)
 
 
+def _get_validation_error(requirement_object, data, msg=None):
+    """Apply *requirement_object* to *data* and return a ValidationError
+    if *data* does not satisfy the requirement, else return None.
+    """
+    result = requirement_object(data)  # <- Apply requirement.
+    if not result:
+        return None
+
+    differences, description = result
+    message = msg or description or 'does not satisfy requirement'
+    err = ValidationError(differences, message)
+
+    sequence_or_order_types = (requirements.RequiredSequence,
+                               requirements.RequiredOrder)
+    if isinstance(requirement_object, sequence_or_order_types):
+        err._sorted_str = False
+    return err
+
+
+class CompiledValidator(object):
+    """A validator with a prepared requirement object that can be
+    applied to many different *data* objects (see
+    :meth:`validate.compile`). A compiled validator is not changed
+    when it is called and can be shared between threads.
+    """
+    def __init__(self, requirement, msg=None, data_filter=None):
+        self.requirement = requirement
+        self.msg = msg
+        self._data_filter = data_filter
+
+    def _filter(self, data):
+        if self._data_filter:
+            candidates = self._data_filter(data)
+            if candidates is not None:
+                return candidates
+        return data
+
+    def __call__(self, data):
+        """Raise a :exc:`ValidationError` if *data* does not satisfy
+        the compiled requirement or pass without error if data is valid.
+        """
+        __tracebackhide__ = _pytest_tracebackhide
+        err = _get_validation_error(self.requirement, self._filter(data), self.msg)
+        if err:
+            raise err
+
+    def is_valid(self, data):
+        """Return True if *data* satisfies the compiled requirement
+        else return False.
+        """
+        return not self.requirement(self._filter(data))
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        return '<{0} {1!r}>'.format(cls_name, self.requirement)
+
+
 class ValidateType(object):
     """Raise a :exc:`ValidationError` if *data* does not satisfy
     *requirement* or pass without error if data is valid.
@@ -354,17 +546,8 @@ class ValidateType(object):
         __tracebackhide__ = _pytest_tracebackhide
 
         requirement_object = requirements.get_requirement(requirement)
-        result = requirement_object(data)  # <- Apply requirement.
-
-        if result:
-            differences, description = result
-            message = msg or description or 'does not satisfy requirement'
-            err = ValidationError(differences, message)
-
-            sequence_or_order_types = (requirements.RequiredSequence,
-                                       requirements.RequiredOrder)
-            if isinstance(requirement_object, sequence_or_order_types):
-                err._sorted_str = False
+        err = _get_validation_error(requirement_object, data, msg)
+        if err:
             raise err
 
     @staticmethod
@@ -387,15 +570,36 @@ class ValidateType(object):
             return requirements.RequiredMapping(requirement, wrapped_factory)
         return wrapped_factory(requirement)
 
+    def _build_predicate(self, requirement):
+        factory = requirements.RequiredPredicate
+        return self._get_predicate_requirement(requirement, factory)
+
     def predicate(self, data, requirement, msg=None):
         """Use *requirement* to construct a :class:`Predicate` and
         check elements in *data* for matches (see :ref:`predicate
         validation <predicate-validation>` for more details).
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = requirements.RequiredPredicate
-        requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+        self(data, self._build_predicate(requirement), msg=msg)
+
+    @staticmethod
+    def _get_regex_filter(requirement, flags=0):
+        """Return a function that uses vectorized string matching to
+        remove elements that are known to match (when data is a Series
+        and requirement is a pattern) or None if *requirement* is not
+        a single pattern.
+        """
+        if isinstance(requirement, string_types):
+            regex = re.compile(requirement, flags)
+        elif isinstance(requirement, regex_types):
+            regex = requirement
+        else:
+            return None
+        return partial(_vectorized.regex_candidates, regex=regex)
+
+    def _build_regex(self, requirement, flags=0):
+        factory = partial(requirements.RequiredRegex, flags=flags)
+        return self._get_predicate_requirement(requirement, factory)
 
     def regex(self, data, requirement, flags=0, msg=None):
         r"""Require that string values match a given regular
@@ -423,9 +627,18 @@ class ValidateType(object):
             validate(data, re.compile(r'^\d{5}$'))
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = partial(requirements.RequiredRegex, flags=flags)
-        requirement = self._get_predicate_requirement(requirement, factory)
-        self(data, requirement, msg=msg)
+
+        regex_filter = self._get_regex_filter(requirement, flags)
+        if regex_filter:
+            candidates = regex_filter(data)
+            if candidates is not None:
+                data = candidates
+
+        self(data, self._build_regex(requirement, flags), msg=msg)
+
+    def _build_approx(self, requirement, places=None, delta=None):
+        factory = partial(requirements.RequiredApprox, places=places, delta=delta)
+        return self._get_predicate_requirement(requirement, factory)
 
     def approx(self, data, requirement, places=None, msg=None, delta=None):
         """Require that numeric values are approximately equal. The
@@ -454,11 +667,22 @@ class ValidateType(object):
         would be more fitting.
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = partial(requirements.RequiredApprox, places=places, delta=delta)
-        requirement = self._get_predicate_requirement(requirement, factory)
+
+        # Use vectorized operations to skip elements that are known to
+        # be approximately equal (when data and requirement are arrays).
+        candidates = _vectorized.approx_candidates(data, requirement, places, delta)
+        if candidates is not None:
+            data, requirement = candidates
+
+        requirement = self._build_approx(requirement, places, delta)
         self(data, requirement, msg=msg)
 
-    def fuzzy(self, data, requirement, cutoff=0.6, msg=None):
+    def _build_fuzzy(self, requirement, cutoff=0.6, similarity=None):
+        factory = partial(requirements.RequiredFuzzy, cutoff=cutoff,
+                          similarity=similarity)
+        return self._get_predicate_requirement(requirement, factory)
+
+    def fuzzy(self, data, requirement, cutoff=0.6, msg=None, similarity=None):
         """Require that strings match with a similarity greater than
         or equal to *cutoff* (default ``0.6``).
 
@@ -467,6 +691,9 @@ class ValidateType(object):
         <difflib.SequenceMatcher.ratio>` from the Standard Library's
         :py:mod:`difflib` module. The values range from ``1.0``
         (exactly the same) to ``0.0`` (completely different).
+        An alternative measure can be given as a *similarity*
+        function of two strings that returns a value in the same
+        range.
 
         .. code-block:: python
             :emphasize-lines: 15
@@ -488,10 +715,13 @@ class ValidateType(object):
             validate.fuzzy(data, requirement, cutoff=0.8)
         """
         __tracebackhide__ = _pytest_tracebackhide
-        factory = partial(requirements.RequiredFuzzy, cutoff=cutoff)
-        requirement = self._get_predicate_requirement(requirement, factory)
+        requirement = self._build_fuzzy(requirement, cutoff, similarity)
         self(data, requirement, msg=msg)
 
+    @staticmethod
+    def _build_interval(min=None, max=None):
+        return requirements.RequiredInterval(min, max)
+
     def interval(self, data, min=None, max=None, msg=None):
         """Require that values are within the defined interval:
 
@@ -529,8 +759,15 @@ class ValidateType(object):
             validate.interval(data, max=20)
         """
         __tracebackhide__ = _pytest_tracebackhide
-        requirement = requirements.RequiredInterval(min, max)
-        self(data, requirement, msg=msg)
+        self(data, self._build_interval(min, max), msg=msg)
+
+    @staticmethod
+    def _build_set(requirement):
+        requirement = normalize(requirement, lazy_evaluation=False, default_type=set)
+        if isinstance(requirement, (Mapping, IterItems)):
+            factory = requirements.RequiredSet
+            return requirements.RequiredMapping(requirement, factory)
+        return requirements.RequiredSet(requirement)
 
     def set(self, data, requirement, msg=None):
         """Check that the set of elements in *data* matches the set
@@ -538,16 +775,7 @@ class ValidateType(object):
         <set-validation>` using a *requirement* of any iterable type).
         """
         __tracebackhide__ = _pytest_tracebackhide
-
-        requirement = normalize(requirement, lazy_evaluation=False, default_type=set)
-
-        if isinstance(requirement, (Mapping, IterItems)):
-            factory = requirements.RequiredSet
-            requirement = requirements.RequiredMapping(requirement, factory)
-        else:
-            requirement = requirements.RequiredSet(requirement)
-
-        self(data, requirement, msg=msg)
+        self(data, self._build_set(requirement), msg=msg)
 
     def subset(self, data, requirement, msg=None):
         """Check that the set of elements in *data* is a subset of the
@@ -647,6 +875,10 @@ class ValidateType(object):
 
         self(data, requirement, msg=msg)
 
+    @staticmethod
+    def _build_unique():
+        return requirements.RequiredUnique()
+
     def unique(self, data, msg=None):
         """Require that elements in *data* are unique:
 
@@ -660,7 +892,22 @@ class ValidateType(object):
             validate.unique(data)
         """
         __tracebackhide__ = _pytest_tracebackhide
-        self(data, requirements.RequiredUnique(), msg=msg)
+
+        # Use vectorized duplicate detection to skip elements that are
+        # known to be unique (when data is an array, Series or DataFrame).
+        candidates = _vectorized.unique_candidates(data)
+        if candidates is not None:
+            data = candidates
+
+        self(data, self._build_unique(), msg=msg)
+
+    @staticmethod
+    def _build_order(requirement):
+        requirement = normalize(requirement, lazy_evaluation=False, default_type=list)
+        if isinstance(requirement, (Mapping, IterItems)):
+            factory = requirements.RequiredOrder
+            return requirements.RequiredMapping(requirement, factory)
+        return requirements.RequiredOrder(requirement)
 
     def order(self, data, requirement, msg=None):
         r"""Check that elements in *data* match the relative order of
@@ -722,16 +969,79 @@ class ValidateType(object):
         their index positions are different.
         """
         __tracebackhide__ = _pytest_tracebackhide
+        self(data, self._build_order(requirement), msg=msg)
 
-        requirement = normalize(requirement, lazy_evaluation=False, default_type=list)
+    _compile_kinds = ('predicate', 'regex', 'approx', 'fuzzy', 'interval',
+                      'set', 'subset', 'superset', 'unique', 'order')
 
-        if isinstance(requirement, (Mapping, IterItems)):
-            factory = requirements.RequiredOrder
-            requirement = requirements.RequiredMapping(requirement, factory)
+    def compile(self, requirement=NOVALUE, kind=None, msg=None, **kwds):
+        r"""Return a compiled validator for *requirement* that can be
+        called with many different *data* objects. The requirement
+        is prepared once---sets are built, predicates are created,
+        and patterns are compiled---rather than for each call:
+
+        .. code-block:: python
+            :emphasize-lines: 3
+
+            from datatest import validate
+
+            check_zipcode = validate.compile(r'^\d{5}$', kind='regex')
+
+            check_zipcode(['46532', '43206', '60632'])
+
+            if not check_zipcode.is_valid(['4653']):
+                ...
+
+        The compiled validator raises a :exc:`ValidationError` when
+        called with invalid data and its :meth:`is_valid` method
+        returns True or False. When *kind* is given, it should be the
+        name of a validation method (``'predicate'``, ``'regex'``,
+        ``'approx'``, ``'fuzzy'``, ``'interval'``, ``'set'``,
+        ``'subset'``, ``'superset'``, ``'unique'``, or ``'order'``)
+        and additional keyword arguments are passed to that method's
+        requirement (e.g., ``flags`` for ``'regex'`` or ``min`` and
+        ``max`` for ``'interval'``). Compiled validators can be shared
+        between threads.
+        """
+        args = () if requirement is NOVALUE else (requirement,)
+        if kind in (None, 'subset', 'superset') and (kwds or not args):
+            err_msg = ('compile() requires a requirement and no keyword '
+                       'arguments when kind is {0!r}')
+            raise TypeError(err_msg.format(kind))
+
+        if kind is None:
+            requirement_object = requirements.get_requirement(requirement)
+        elif kind in ('subset', 'superset'):
+            if kind == 'subset':
+                factory = requirements.RequiredSubset
+            else:
+                factory = requirements.RequiredSuperset
+            # Built here rather than in a helper method so that the
+            # deprecation warning (stacklevel=3) points at the caller.
+            requirement_object = normalize(requirement, lazy_evaluation=False, default_type=set)
+            if isinstance(requirement_object, (Mapping, IterItems)):
+                requirement_object = requirements.RequiredMapping(requirement_object, factory)
+            else:
+                requirement_object = factory(requirement_object)
+        elif kind in self._compile_kinds:
+            builder = getattr(self, '_build_{0}'.format(kind))
+            requirement_object = builder(*args, **kwds)
         else:
-            requirement = requirements.RequiredOrder(requirement)
+            err_msg = 'kind must be None or one of {0!r}, got {1!r}'
+            raise ValueError(err_msg.format(self._compile_kinds, kind))
 
-        self(data, requirement, msg=msg)
+        if (isinstance(requirement_object, requirements.RequiredMapping)
+                and not isinstance(requirement_object, requirements.RequiredSortedMapping)):
+            requirement_object._prepare_value_checkers()
+
+        if kind == 'regex':
+            data_filter = self._get_regex_filter(requirement, kwds.get('flags', 0))
+        elif kind == 'unique':
+            data_filter = _vectorized.unique_candidates
+        else:
+            data_filter = None
+
+        return CompiledValidator(requirement_object, msg, data_filter)
 
 
 validate = ValidateType()  # Use as instance.
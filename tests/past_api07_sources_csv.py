@@ -12,6 +12,8 @@ from .mixins import CountTests
 from .mixins import OtherTests
 
 from datatest.__past__.api07_sources import CsvSource
+from datatest.__past__.squint.query import DEFAULT_CONNECTION
+from datatest.__past__ import load_csv as load_csv_module
 
 
 class TestCsvSource(OtherTests, unittest.TestCase):
@@ -130,6 +132,57 @@ class TestCsvSource_ActualFileHandling(MkdtempTestCase):
                 CsvSource(fh, encoding='utf-8')  # Raise exception.
 
 
+class TestCsvSource_Cache(MkdtempTestCase):
+    def setUp(self):
+        MkdtempTestCase.setUp(self)
+        load_csv_module.cache_path = os.path.abspath('cache.sqlite')
+
+    def tearDown(self):
+        load_csv_module.detach_cache(DEFAULT_CONNECTION)
+        load_csv_module.cache_path = None
+        MkdtempTestCase.tearDown(self)
+
+    def _write_file(self, contents):
+        with open('myfile.csv', 'wb') as fh:
+            fh.write(contents)
+            return os.path.abspath(fh.name)
+
+    def test_unchanged_file(self):
+        path = self._write_file(b'label1,value\n'
+                                b'a,18\n'
+                                b'b,13\n')
+        source = CsvSource(path)
+        self.assertEqual(list(source), [{'label1': 'a', 'value': '18'},
+                                        {'label1': 'b', 'value': '13'}])
+
+        # Change the cached copy so it can be distinguished from the file.
+        cursor = DEFAULT_CONNECTION.cursor()
+        cursor.execute('SELECT tbl FROM datatest_cache.csv_files')
+        cache_table, = cursor.fetchone()
+        cursor.execute(
+            "UPDATE datatest_cache.{0} SET value='99'".format(cache_table))
+
+        source = CsvSource(path)
+        self.assertEqual(list(source), [{'label1': 'a', 'value': '99'},
+                                        {'label1': 'b', 'value': '99'}])
+
+    def test_changed_file(self):
+        path = self._write_file(b'label1,value\n'
+                                b'a,18\n')
+        CsvSource(path)
+
+        path = self._write_file(b'label1,value\n'
+                                b'a,18\n'
+                                b'b,13\n')
+        source = CsvSource(path)
+        self.assertEqual(list(source), [{'label1': 'a', 'value': '18'},
+                                        {'label1': 'b', 'value': '13'}])
+
+        cursor = DEFAULT_CONNECTION.cursor()
+        cursor.execute('SELECT COUNT(*) FROM datatest_cache.csv_files')
+        self.assertEqual(cursor.fetchone(), (1,), 'outdated copy should be removed')
+
+
 class TestCsvSource_fmtparams(unittest.TestCase):
     @staticmethod
     def _get_filelike(string, encoding=None):
@@ -1,14 +1,47 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import
+import array
+import csv
+import io
+import operator
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
 import textwrap
+import threading
 from . import _unittest as unittest
 
 import datatest
 from datatest.__past__ import api08  # <- MONKEY PATCH!!!
+from datatest.__past__.squint.query import DEFAULT_CONNECTION
+from datatest.__past__.squint.query import (
+    _filter_data,
+    _apply_to_data,
+    _sqlite_count,
+    _sqlite_distinct,
+    _reduce_data,
+    _apply_data,
+    _GroupReducer,
+    RESULT_TOKEN,
+    Result,
+)
+
+from datatest.__past__ import temptable
+from datatest.__past__.get_reader import get_reader
+from datatest.__past__.get_reader import _is_newline_aligned
+from datatest.__past__.get_reader import _iter_mmap_lines
 
 from datatest.differences import NOVALUE
+from datatest._compatibility import builtins as compat_builtins
 from datatest.validation import _require_sequence
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestColumns(unittest.TestCase):
     def test_columns(self):
@@ -102,6 +135,467 @@ class TestDataSourceConstructors(unittest.TestCase):
         self.assertEqual(set(table_contents), set(expected))
 
 
+class TestSelectIndexAdvisor(unittest.TestCase):
+    def setUp(self):
+        self.select = datatest.Select([
+            ['state', 'town', 'amount'],
+            ['A', 'x', '1'],
+            ['A', 'y', '2'],
+            ['B', 'x', '3'],
+        ])
+
+    def get_indexes(self):
+        cursor = self.select._connection.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name=?",
+            (self.select._table,),
+        )
+        return [row[0] for row in cursor]
+
+    def test_suggest_indexes(self):
+        select = self.select
+        select._select({'town': ['amount']}, state='A')
+        self.assertEqual(select.suggest_indexes(), [], 'only used once')
+
+        select._select({'town': ['amount']}, state='A')
+        self.assertEqual(select.suggest_indexes(), [('state', 'town')])
+
+        select.create_index('state', 'town')
+        self.assertEqual(select.suggest_indexes(), [], 'index already exists')
+
+    def test_non_indexable_predicates(self):
+        select = self.select
+        select._select(['amount'], state=lambda x: x == 'A')
+        select._select(['amount'], state=lambda x: x == 'A')
+        self.assertEqual(select.suggest_indexes(), [])
+
+        select._select(['amount'], state=set(['A', 'B']))
+        select._select(['amount'], state=set(['A', 'B']))
+        self.assertEqual(select.suggest_indexes(), [('state',)])
+
+    def test_auto_index(self):
+        select = self.select
+        select.auto_index = 2
+
+        select._select_aggregate('SUM', {'town': ['amount']}, state='A')
+        self.assertEqual(self.get_indexes(), [])
+
+        select._select_aggregate('SUM', {'town': ['amount']}, state='B')
+        index_name = 'idx_{0}_state_town'.format(select._table)
+        self.assertEqual(self.get_indexes(), [index_name])
+
+
+class TestSelectThreading(unittest.TestCase):
+    def run_threads(self, target, count=8):
+        results = [None] * count
+        errors = []
+
+        def run(i):
+            try:
+                results[i] = target(i)
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+        return results
+
+    def test_separate_connections(self):
+        connections = self.run_threads(
+            lambda i: DEFAULT_CONNECTION.connection(), count=2)
+        self.assertIsNot(connections[0], connections[1])
+
+    def test_load_in_threads(self):
+        def load(i):
+            select = datatest.Select([['A', 'B'], ['x', str(i)], ['y', str(i)]])
+            return select('B').fetch()
+
+        results = self.run_threads(load)
+        self.assertEqual(results, [[str(i), str(i)] for i in range(8)])
+
+    def test_query_from_threads(self):
+        select = datatest.Select([
+            ['A', 'B'],
+            ['x', '1'],
+            ['x', '2'],
+            ['y', '3'],
+        ])
+
+        def query(i):
+            is_x = lambda value: value == 'x'  # <- Registers new function.
+            filtered = select({'A': 'B'}, A=is_x).fetch()
+            reduced = select({'A': 'B'}).map(int).sum().fetch()
+            return filtered, reduced
+
+        results = self.run_threads(query)
+        expected = ({'x': ['1', '2']}, {'x': 3, 'y': 3})
+        self.assertEqual(results, [expected] * 8)
+
+
+class TestQueryOptimizer(unittest.TestCase):
+    def test_optimize_filter(self):
+        """
+        Unoptimized:
+            Select._select(['col1'], col2='xyz').filter('abc')
+
+        Optimized:
+            Select._select(['col1'], col1='abc', col2='xyz')
+        """
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {'col2': 'xyz'}),
+            (_filter_data, ('abc', RESULT_TOKEN,), {}),
+        )
+        optimized = datatest.Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {'col1': 'abc', 'col2': 'xyz'}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_filter_tuple(self):
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ([('col1', 'col2')],), {}),
+            (_filter_data, (('abc', Ellipsis), RESULT_TOKEN,), {}),
+        )
+        optimized = datatest.Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ([('col1', 'col2')],), {'col1': 'abc'}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_filter_and_aggregate(self):
+        """Set predicates are pushed down when the order of values
+        does not affect the result.
+        """
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {}),
+            (_filter_data, (set(['a', 'b']), RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_count, RESULT_TOKEN,), {}),
+        )
+        optimized = datatest.Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select_aggregate'), {}),
+            (RESULT_TOKEN, ('COUNT', ['col1'],), {'col1': set(['a', 'b'])}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_filter_not_pushed_down(self):
+        callable_predicate = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {}),
+            (_filter_data, (lambda x: x == 'abc', RESULT_TOKEN,), {}),
+        )
+        self.assertIsNone(datatest.Query._optimize(callable_predicate))
+
+        mapping_columns = (  # <- Would remove keys of empty groups.
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ({'col1': ['col2']},), {}),
+            (_filter_data, ('abc', RESULT_TOKEN,), {}),
+        )
+        self.assertIsNone(datatest.Query._optimize(mapping_columns))
+
+        ordered_set = (  # <- An index could change the order of values.
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {}),
+            (_filter_data, (set(['a', 'b']), RESULT_TOKEN,), {}),
+        )
+        self.assertIsNone(datatest.Query._optimize(ordered_set))
+
+        truth_value = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, (['col1'],), {}),
+            (_filter_data, (True, RESULT_TOKEN,), {}),
+        )
+        self.assertIsNone(datatest.Query._optimize(truth_value))
+
+    def test_optimize_distinct_count(self):
+        """
+        Unoptimized:
+            Select._select({'col1': ['values']}).distinct().count()
+
+        Optimized:
+            Select._select_aggregate('COUNT', {'col1': {'values'}})
+        """
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ({'col1': ['values']},), {}),
+            (_sqlite_distinct, (RESULT_TOKEN,), {}),
+            (_apply_to_data, (_sqlite_count, RESULT_TOKEN,), {}),
+        )
+        optimized = datatest.Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select_aggregate'), {}),
+            (RESULT_TOKEN, ('COUNT', {'col1': set(['values'])},), {}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_reduce(self):
+        """
+        Unoptimized:
+            Select._select({'col1': ['values']}).reduce(add)
+
+        Optimized:
+            Select._select_reduce(_GroupReducer(add), {'col1': ['values']})
+        """
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ({'col1': ['values']},), {}),
+            (_reduce_data, (operator.add, RESULT_TOKEN, None), {}),
+        )
+        optimized = datatest.Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select_reduce'), {}),
+            (RESULT_TOKEN, (_GroupReducer(operator.add), {'col1': ['values']},), {}),
+        )
+        self.assertEqual(optimized, expected)
+
+    def test_optimize_apply(self):
+        unoptimized = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ({'col1': ['values']},), {}),
+            (_apply_data, (max, RESULT_TOKEN,), {}),
+        )
+        optimized = datatest.Query._optimize(unoptimized)
+
+        expected = (
+            (getattr, (RESULT_TOKEN, '_select_reduce'), {}),
+            (RESULT_TOKEN, (max, {'col1': ['values']},), {}),
+        )
+        self.assertEqual(optimized, expected)
+
+        # Built-in functions and their compatibility wrappers (which
+        # differ from the built-ins on older versions of Python).
+        for function in (min, sum, compat_builtins.min, compat_builtins.max):
+            unoptimized = (
+                (getattr, (RESULT_TOKEN, '_select'), {}),
+                (RESULT_TOKEN, ({'col1': ['values']},), {}),
+                (_apply_data, (function, RESULT_TOKEN,), {}),
+            )
+            optimized = datatest.Query._optimize(unoptimized)
+            self.assertEqual(optimized[0], (getattr, (RESULT_TOKEN, '_select_reduce'), {}))
+
+        unknown_function = (
+            (getattr, (RESULT_TOKEN, '_select'), {}),
+            (RESULT_TOKEN, ({'col1': ['values']},), {}),
+            (_apply_data, (len, RESULT_TOKEN,), {}),
+        )
+        self.assertIsNone(datatest.Query._optimize(unknown_function))
+
+    def test_optimized_results(self):
+        source = datatest.Select([
+            ('col1', 'col2'),
+            ('a', 'x'),
+            ('b', 'y'),
+            ('a', 'x'),
+            ('c', 'y'),
+        ])
+        queries = [
+            datatest.Query(['col1']).filter('a'),
+            datatest.Query(['col1']).filter(set(['a', 'c'])).count(),
+            datatest.Query([('col1', 'col2')]).filter(('a', Ellipsis)),
+            datatest.Query(['col2']).distinct().count(),
+            datatest.Query({'col2': 'col1'}).distinct().count(),
+            datatest.Query({'col2': 'col1'}).reduce(operator.add),
+            datatest.Query({'col2': 'col1'}).distinct().reduce(operator.add, str),
+            datatest.Query([('col1', 'col2')]).reduce(operator.add),
+            datatest.Query({'col1': 'col2'}).apply(max),
+        ]
+        for query in queries:
+            unoptimized = query.execute(source, optimize=False)
+            optimized = query.execute(source, optimize=True)
+            if isinstance(unoptimized, datatest.Result):
+                unoptimized = unoptimized.fetch()
+                optimized = optimized.fetch()
+            self.assertEqual(optimized, unoptimized)
+
+    def test_optimized_reduce_errors(self):
+        source = datatest.Select([('col1', 'col2'), ('a', 'x'), ('a', 'y')])
+        query = datatest.Query({'col1': 'col2'}).reduce(operator.sub)
+        with self.assertRaises(TypeError):
+            query.execute(source).fetch()
+
+        empty_source = datatest.Select([('col1', 'col2')])
+        query = datatest.Query(['col1']).apply(max)
+        with self.assertRaises(ValueError):
+            query.execute(empty_source)
+
+    def test_explain(self):
+        query = datatest.Query(['col1']).filter('abc').count()
+        expected = """
+            Data Source:
+              <none given> (assuming Select object)
+            Execution Plan (optimized):
+              getattr, (<RESULT>, '_select_aggregate'), {}
+              <RESULT>, ('COUNT', ['col1']), {col1='abc'}
+        """
+        expected = textwrap.dedent(expected).strip()
+        self.assertEqual(query._explain(file=None), expected)
+
+
+class TestToArray(unittest.TestCase):
+    def test_result(self):
+        result = Result(['1', '2.5', 3], list)
+        self.assertEqual(result.to_array(), array.array('d', [1.0, 2.5, 3.0]))
+
+        result = Result(iter(['1', '2']), list)
+        self.assertEqual(result.to_array('l'), array.array('l', [1, 2]))
+
+        result = Result({'a': Result(['1', '2'], list), 'b': 3}, dict)
+        expected = {'a': array.array('d', [1.0, 2.0]), 'b': 3}
+        self.assertEqual(result.to_array(), expected)
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_result_ndarray(self):
+        result = Result(['1', '2.5'], list)
+        values = result.to_array(ndarray=True)
+        self.assertIsInstance(values, numpy.ndarray)
+        self.assertEqual(values.dtype, numpy.dtype('d'))
+        self.assertEqual(values.tolist(), [1.0, 2.5])
+
+    def test_query(self):
+        select = datatest.Select([('A', 'B'), ('x', '1'), ('x', '2'), ('y', '3')])
+        query = datatest.Query(select, ['B'])
+        self.assertEqual(query.to_array('l'), array.array('l', [1, 2, 3]))
+
+        query = datatest.Query(select, {'A': 'B'})
+        expected = {'x': array.array('d', [1.0, 2.0]), 'y': array.array('d', [3.0])}
+        self.assertEqual(query.to_array(), expected)
+
+        query = datatest.Query(select, 'B').map(int).sum()
+        self.assertEqual(query.to_array(), 6)
+
+
+class TestExecutemanyBatched(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:')
+        self.connection.execute('CREATE TABLE test_table (a, b)')
+        self.cursor = self.connection.cursor()
+
+    def tearDown(self):
+        self.connection.close()
+
+    def get_rows(self):
+        cursor = self.connection.execute(
+            'SELECT a, b FROM test_table ORDER BY rowid')
+        return cursor.fetchall()
+
+    def test_partial_batch(self):
+        records = [(i, str(i)) for i in range(temptable.INSERT_BATCH_SIZE * 2 + 7)]
+        temptable._executemany_batched(
+            self.cursor, 'test_table', ['a', 'b'], iter(records))
+        self.assertEqual(self.get_rows(), records)
+
+    def test_wrong_length_row(self):
+        """Rows before the bad row should be inserted and the error
+        should match the one from a single-row executemany() call.
+        """
+        bad_index = temptable.INSERT_BATCH_SIZE + 10  # <- Inside 2nd batch.
+        records = [(i, str(i)) for i in range(temptable.INSERT_BATCH_SIZE * 3)]
+        records[bad_index] = (1, 2, 3)
+
+        with self.assertRaises(sqlite3.ProgrammingError) as cm:
+            temptable._executemany_batched(
+                self.cursor, 'test_table', ['a', 'b'], iter(records))
+        self.assertIn('incorrect number of bindings', str(cm.exception).lower())
+        self.assertEqual(self.get_rows(), records[:bad_index])
+
+    def test_max_parameters(self):
+        """Batches of wide rows should not use more parameters than
+        SQLite allows.
+        """
+        statements = []
+
+        class RecordingCursor(object):
+            def __init__(self, cursor):
+                self.cursor = cursor
+
+            def executemany(self, sql, params):
+                statements.append(sql)
+                return self.cursor.executemany(sql, params)
+
+        columns = ['c{0}'.format(i) for i in range(20)]
+        self.connection.execute('CREATE TABLE wide ({0})'.format(', '.join(columns)))
+        records = [tuple(range(i, i + 20)) for i in range(120)]
+        cursor = RecordingCursor(self.cursor)
+        temptable._executemany_batched(cursor, 'wide', columns, records)
+
+        max_params = max(sql.count('?') for sql in statements)
+        self.assertLessEqual(max_params, temptable._MAX_PARAMETERS)
+        self.assertEqual(max_params, (temptable._MAX_PARAMETERS // 20) * 20)
+
+        result = self.connection.execute('SELECT * FROM wide ORDER BY rowid')
+        self.assertEqual(result.fetchall(), records)
+
+
+class TestMmapCsvReader(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'test.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def write_file(self, text, encoding='utf-8'):
+        with io.open(self.path, 'w', encoding=encoding, newline='') as f:
+            f.write(text)
+
+    def test_is_newline_aligned(self):
+        self.assertTrue(_is_newline_aligned('utf-8'))
+        self.assertTrue(_is_newline_aligned('latin-1'))
+        self.assertFalse(_is_newline_aligned('utf-8-sig'))
+        self.assertFalse(_is_newline_aligned('utf-16'))
+        self.assertFalse(_is_newline_aligned('unknown-encoding'))
+        self.assertFalse(_is_newline_aligned(None))
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'memory-mapped reading requires Python 3')
+    def test_quoted_field_across_chunks(self):
+        text = (
+            u'A,B\r\n'
+            u'1,"multi\nline\r\nvalue"\r\n'
+            u'2,"\u00e9\u00e8\n\u00ea"\r\n'
+            u'3,end\r\n'
+        )
+        self.write_file(text)
+        expected = list(csv.reader(io.StringIO(text, newline='')))
+
+        for chunk_size in (1, 3, 7, 4096):
+            with io.open(self.path, 'rb') as f:
+                lines = _iter_mmap_lines(f, 'utf-8', chunk_size=chunk_size)
+                self.assertEqual(list(csv.reader(lines)), expected)
+
+    def test_empty_file(self):
+        self.write_file(u'')
+        with io.open(self.path, 'rb') as f:
+            self.assertEqual(list(_iter_mmap_lines(f, 'utf-8')), [])
+        self.assertEqual(list(get_reader.from_csv(self.path)), [])
+
+    def test_text_mode_encodings(self):
+        """Encodings that are not newline-aligned are read in text mode."""
+        text = u'A,B\r\nx,\u00e9\r\n'
+        encodings = ['utf-8-sig']
+        if sys.version_info[0] >= 3:
+            encodings.append('utf-16')  # <- Not supported by Python 2 reader.
+        for encoding in encodings:
+            self.write_file(text, encoding)
+            reader = get_reader.from_csv(self.path, encoding=encoding)
+            self.assertEqual(list(reader), [['A', 'B'], ['x', u'\u00e9']])
+
+
 class TestDataQuery(unittest.TestCase):
     def test_callable(self):
         """In 0.9, __call__() was changed to execute()."""
@@ -39,8 +39,8 @@ class TestTableExists(unittest.TestCase):
 
 class TestNewTableName(unittest.TestCase):
     def setUp(self):
-        # Rebuild internal generator.
-        temptable._table_names = ('tbl{0}'.format(x) for x in itertools.count())
+        # Rebuild internal counter.
+        temptable._table_numbers = itertools.count()
 
         connection = sqlite3.connect(':memory:')
         self.cursor = connection.cursor()
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
 import datetime
 import inspect
+import os
+import shutil
 import sys
+import tempfile
 from . import _unittest as unittest
 from datatest._compatibility.builtins import *
 from datatest._compatibility.collections import namedtuple
@@ -10,6 +13,7 @@ from datatest._compatibility import contextlib
 from datatest._compatibility import itertools
 from datatest._utils import nonstringiter
 from datatest.validation import ValidationError
+from datatest._baseline import write_baseline
 from datatest.differences import (
     BaseDifference,
     Missing,
@@ -28,6 +32,7 @@ from datatest.acceptances import (
     AcceptedTolerance,
     AcceptedPercent,
     AcceptedFuzzy,
+    AcceptedBaseline,
     AcceptedCount,
 )
 
@@ -126,6 +131,56 @@ class TestBaseAcceptance(unittest.TestCase):
         description = cm.exception.description
         self.assertEqual(description, 'acceptance message')
 
+    def test_nested_contexts(self):
+        """Nested acceptances should reuse the remaining items of an
+        enclosed acceptance rather than serializing differences again.
+        """
+        class accepted_letter(MinimalAcceptance):
+            def __init__(self, letter, msg=None):
+                super(accepted_letter, self).__init__(msg)
+                self.letter = letter
+
+            def call_predicate(self, item):
+                return item[1].args[0] == self.letter
+
+        serialized_items = BaseAcceptance._serialized_items
+        calls = []
+        def counting_serialized_items(iterable):
+            calls.append(iterable)
+            return serialized_items(iterable)
+
+        BaseAcceptance._serialized_items = staticmethod(counting_serialized_items)
+        try:
+            with self.assertRaises(ValidationError) as cm:
+                with accepted_letter('a', msg='outer'):
+                    with accepted_letter('b'):
+                        with accepted_letter('c', msg='inner'):
+                            raise ValidationError(
+                                {'x': [Missing('a'), Missing('d')], 'y': Extra('b')},
+                                'error description',
+                            )
+        finally:
+            BaseAcceptance._serialized_items = staticmethod(serialized_items)
+
+        self.assertEqual(len(calls), 1, msg='should serialize only once')
+        self.assertEqual(cm.exception.differences, {'x': Missing('d')})
+        self.assertEqual(cm.exception.description, 'outer: inner: error description')
+
+    def test_nested_contexts_evaluated_between(self):
+        """When the differences of an enclosed acceptance's error are
+        accessed, they are serialized again by the next acceptance.
+        """
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedDifferences(Missing('a')):
+                try:
+                    with AcceptedDifferences(Missing('b')):
+                        raise ValidationError([Missing('a'), Missing('b'), Missing('c')])
+                except ValidationError as err:
+                    self.assertEqual(err.differences, [Missing('a'), Missing('c')])
+                    err.differences.append(Missing('d'))
+                    raise
+        self.assertEqual(cm.exception.differences, [Missing('c'), Missing('d')])
+
 
 class TestAcceptanceProtocol(unittest.TestCase):
     def setUp(self):
@@ -502,6 +557,37 @@ class TestAcceptedDifferences(unittest.TestCase):
         actual = cm.exception.differences
         self.assertEqual(actual, {'baz': Extra('zzz')})
 
+    def test_whole_scope(self):
+        differences = {
+            'a': [Missing('X'), Missing('Y')],
+            'b': [Missing('X'), Missing('Y')],
+        }
+        accepted = [Missing('X'), Missing('Y'), Missing('Y')]
+        acceptance = AcceptedDifferences(accepted, scope='whole')
+        expected = {'b': Missing('X')}
+        self.assertAcceptance(differences, acceptance, expected)
+        self.assertEqual(len(accepted), 3, msg='should not modify original')
+
+        # Allowance is restored for each error.
+        self.assertAcceptance(differences, acceptance, expected)
+
+    def test_nan_and_unhashable_args(self):
+        nan = float('nan')
+        differences = [Invalid(nan), Invalid([1, 2]), Invalid(nan), Deviation(nan, 5)]
+        acceptance = AcceptedDifferences([Invalid(nan), Invalid([1, 2]), Deviation(nan, 5)])
+        with self.assertRaises(ValidationError) as cm:
+            with acceptance:
+                raise ValidationError(differences)
+        remaining = cm.exception.differences
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(remaining[0], Invalid(nan))
+
+    def test_equal_args_of_different_types(self):
+        differences = [Deviation(1, 10), Deviation(1.0, 10)]
+        acceptance = AcceptedDifferences([Deviation(1.0, 10.0)])
+        expected = [Deviation(1.0, 10)]
+        self.assertAcceptance(differences, acceptance, expected)
+
     def test_scope(self):
         acceptance = AcceptedDifferences(Extra)
         self.assertEqual(acceptance.scope, set(['element']))
@@ -1055,6 +1141,26 @@ class TestAcceptedFuzzy(unittest.TestCase):
         remaining = cm.exception.differences
         self.assertEqual(remaining, self.differences, msg='none accepted')
 
+    def test_similarity(self):
+        def first_char(a, b):
+            return 1.0 if a[0] == b[0] else 0.0
+
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedFuzzy(cutoff=1.0, similarity=first_char):
+                raise ValidationError([Invalid('abcd', 'axxx'), Invalid('b', 'a')])
+        remaining = cm.exception.differences
+        self.assertEqual(remaining, [Invalid('b', 'a')])
+
+    def test_repr(self):
+        acceptance = AcceptedFuzzy(cutoff=0.7)
+        self.assertEqual(repr(acceptance), 'AcceptedFuzzy(cutoff=0.7)')
+
+        def first_char(a, b):
+            return 1.0 if a[0] == b[0] else 0.0
+
+        acceptance = AcceptedFuzzy(cutoff=0.7, similarity=first_char)
+        self.assertEqual(repr(acceptance), 'AcceptedFuzzy(cutoff=0.7, similarity=first_char)')
+
     def test_incompatible_diffs(self):
         """Test differences that cannot be fuzzy matched."""
         incompatible_diffs = [
@@ -1140,6 +1246,10 @@ class TestUniversalComposability(unittest.TestCase):
     same type as well as all other acceptance types.
     """
     def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        baseline_path = os.path.join(self.tempdir, 'baseline.sqlite3')
+        write_baseline(baseline_path, [Invalid('A')])
+
         ntup = namedtuple('ntup', ('cls', 'args', 'scope'))
         self.acceptances = [
             ntup(cls=AcceptedDifferences, args=(Invalid('A'),),        scope=set(['element'])),
@@ -1152,8 +1262,12 @@ class TestUniversalComposability(unittest.TestCase):
             ntup(cls=AcceptedPercent,   args=(0.05,),                  scope=set(['element'])),
             ntup(cls=AcceptedFuzzy,     args=tuple(),                  scope=set(['element'])),
             ntup(cls=AcceptedCount,     args=(4,),                     scope=set(['whole'])),
+            ntup(cls=AcceptedBaseline,  args=(baseline_path,),         scope=set(['group'])),
         ]
 
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
     def test_completeness(self):
         """Check that self.acceptances contains all of the acceptances
         defined in datatest.
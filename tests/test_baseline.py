@@ -0,0 +1,192 @@
+"""Tests for baseline files of known differences."""
+import os
+import shutil
+import sqlite3
+import tempfile
+from . import _unittest as unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pathlib
+except ImportError:
+    pathlib = None
+from datatest.validation import ValidationError
+from datatest.differences import Missing
+from datatest.differences import Extra
+from datatest.differences import Deviation
+from datatest.acceptances import AcceptedBaseline
+from datatest.acceptances import accepted
+
+from datatest import _baseline
+from datatest._baseline import BaselineFile
+from datatest._baseline import key_fingerprint
+from datatest._baseline import difference_fingerprint
+from datatest._baseline import write_baseline
+
+
+class BaselineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tempdir, 'baseline.sqlite3')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+
+class TestFingerprints(unittest.TestCase):
+    def test_difference_fingerprint(self):
+        self.assertEqual(difference_fingerprint(Missing('A')),
+                         difference_fingerprint(Missing('A')))
+        self.assertNotEqual(difference_fingerprint(Missing('A')),
+                            difference_fingerprint(Extra('A')))
+
+    def test_nan_values(self):
+        nan = float('nan')
+        self.assertEqual(difference_fingerprint(Deviation(nan, 5)),
+                         difference_fingerprint(Deviation(float('nan'), 5)))
+
+    def test_equal_values(self):
+        """Values that compare as equal should have the same fingerprint."""
+        self.assertEqual(difference_fingerprint(Deviation(1, 5)),
+                         difference_fingerprint(Deviation(1.0, 5.0)))
+        self.assertNotEqual(difference_fingerprint(Deviation(1, 5)),
+                            difference_fingerprint(Deviation(1.5, 5)))
+        self.assertEqual(key_fingerprint(('a', 1)), key_fingerprint(('a', 1.0)))
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_values(self):
+        self.assertEqual(difference_fingerprint(Deviation(numpy.float64(1.0), 5)),
+                         difference_fingerprint(Deviation(1, 5)))
+        self.assertEqual(difference_fingerprint(Deviation(numpy.int64(3), 5)),
+                         difference_fingerprint(Deviation(3, 5)))
+
+    def test_unordered_values(self):
+        """Set and mapping fingerprints should not depend on order."""
+        values1 = frozenset(['a{0}'.format(i) for i in range(20)])
+        values2 = frozenset(sorted(values1, reverse=True))
+        self.assertEqual(key_fingerprint(values1), key_fingerprint(values2))
+        self.assertEqual(key_fingerprint({'a': 1, 'b': 2}),
+                         key_fingerprint({'b': 2, 'a': 1}))
+        self.assertNotEqual(key_fingerprint(frozenset()), key_fingerprint({}))
+
+    def test_key_fingerprint(self):
+        self.assertEqual(key_fingerprint(('a', 1)), key_fingerprint(('a', 1)))
+        self.assertNotEqual(key_fingerprint(None), key_fingerprint('None'))
+
+
+class TestBaselineFile(BaselineTestCase):
+    def test_write_and_count(self):
+        differences = {'a': [Missing('X'), Missing('X')], 'b': Extra('Y')}
+        write_baseline(self.path, differences)
+
+        baseline = BaselineFile(self.path)
+        a, b = key_fingerprint('a'), key_fingerprint('b')
+        self.assertEqual(baseline.count(a, difference_fingerprint(Missing('X'))), 2)
+        self.assertEqual(baseline.count(b, difference_fingerprint(Extra('Y'))), 1)
+        self.assertEqual(baseline.count(b, difference_fingerprint(Missing('X'))), 0)
+        baseline.close()
+
+    def test_replace_existing(self):
+        write_baseline(self.path, [Missing('X')])
+        write_baseline(self.path, [Missing('Y')])
+
+        baseline = BaselineFile(self.path)
+        key = key_fingerprint(None)
+        self.assertEqual(baseline.count(key, difference_fingerprint(Missing('X'))), 0)
+        self.assertEqual(baseline.count(key, difference_fingerprint(Missing('Y'))), 1)
+        baseline.close()
+
+    def test_path_object(self):
+        if not pathlib:
+            self.skipTest('requires pathlib')
+        path = pathlib.Path(self.path)
+        write_baseline(path, [Missing('X')])
+
+        baseline = BaselineFile(path)
+        key = key_fingerprint(None)
+        self.assertEqual(baseline.count(key, difference_fingerprint(Missing('X'))), 1)
+        baseline.close()
+
+    def test_missing_sqlite3(self):
+        original = _baseline.sqlite3
+        try:
+            _baseline.sqlite3 = None
+            with self.assertRaisesRegex(Exception, 'require SQLite'):
+                write_baseline(self.path, [Missing('X')])
+        finally:
+            _baseline.sqlite3 = original
+
+    def test_missing_file(self):
+        with self.assertRaises(IOError):
+            BaselineFile(self.path)
+
+    def test_unsupported_version(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute('CREATE TABLE other (a)')
+        connection.commit()
+        connection.close()
+
+        with self.assertRaises(ValueError):
+            BaselineFile(self.path).open()
+
+
+class TestAcceptedBaseline(BaselineTestCase):
+    def test_write_baseline(self):
+        error = ValidationError([Missing('X'), Extra('Y')], 'description')
+        error.write_baseline(self.path)
+
+        with accepted.baseline(self.path):
+            raise ValidationError([Extra('Y'), Missing('X')])
+
+    def test_group_scope(self):
+        write_baseline(self.path, {'a': [Missing('X')], 'b': [Missing('Y')]})
+
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedBaseline(self.path):
+                raise ValidationError({
+                    'a': [Missing('X'), Missing('X'), Missing('Y')],
+                    'b': Missing('Y'),
+                })
+        expected = {'a': [Missing('X'), Missing('Y')]}
+        self.assertEqual(cm.exception.differences, expected)
+
+    def test_element_scope(self):
+        write_baseline(self.path, [Missing('X')])
+
+        with self.assertRaises(ValidationError) as cm:
+            with AcceptedBaseline(self.path, scope='element'):
+                raise ValidationError([Missing('X'), Missing('X'), Missing('Y')])
+        self.assertEqual(cm.exception.differences, [Missing('Y')])
+
+    def test_whole_scope(self):
+        write_baseline(self.path, [Missing('X')])
+
+        acceptance = AcceptedBaseline(self.path, scope='whole')
+        with self.assertRaises(ValidationError) as cm:
+            with acceptance:
+                raise ValidationError([Missing('X'), Missing('X')])
+        self.assertEqual(cm.exception.differences, [Missing('X')])
+
+    def test_nan_values(self):
+        write_baseline(self.path, [Deviation(float('nan'), 5)])
+        with AcceptedBaseline(self.path):
+            raise ValidationError([Deviation(float('nan'), 5)])
+
+    def test_repr_and_scope(self):
+        write_baseline(self.path, [Missing('X')])
+
+        acceptance = AcceptedBaseline(self.path, msg='known issues')
+        expected = 'AcceptedBaseline({0!r}, msg=\'known issues\')'.format(self.path)
+        self.assertEqual(repr(acceptance), expected)
+        self.assertEqual(acceptance.scope, set(['group']))
+
+        with self.assertRaises(ValueError):
+            AcceptedBaseline(self.path, scope='bad scope')
+
+
+if __name__ == '__main__':
+    unittest.main()
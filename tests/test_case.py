@@ -217,6 +217,7 @@ class TestValidationWrappers(unittest.TestCase):
         ==========  ===================
         """
         methods = [x for x in dir(validate) if not x.startswith('_')]
+        methods.remove('compile')  # <- Returns a validator, not a validation.
 
         missing_methods = []
         for method in methods:
@@ -248,6 +249,7 @@ class TestValidationWrappers(unittest.TestCase):
         ]
         method_names = set(x[0] for x in method_calls)
         all_names = set(x for x in dir(validate) if not x.startswith('_'))
+        all_names.discard('compile')  # <- Returns a validator, not a validation.
         self.assertSetEqual(method_names, all_names)
 
         for orig_name, args, kwds in method_calls:
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import datetime
 import decimal
+import pickle
 import re
 import textwrap
 from . import _unittest as unittest
@@ -12,6 +13,7 @@ from datatest.differences import (
     Invalid,
     Deviation,
     _make_difference,
+    _get_difference_factory,
     NOVALUE,
 )
 
@@ -27,6 +29,16 @@ class MinimalDifference(BaseDifference):
         return self._args
 
 
+class KeywordDifference(BaseDifference):
+    """Difference whose constructor does not accept its args."""
+    def __init__(self, **kwds):
+        self._kwds = kwds
+
+    @property
+    def args(self):
+        return tuple(sorted(self._kwds.items()))
+
+
 class TestBaseDifference(unittest.TestCase):
     def test_instantiation(self):
         """BaseDifference should not be instantiated directly.
@@ -314,6 +326,38 @@ class TestHashability(unittest.TestCase):
             hash(Invalid('baz', ['qux']))
 
 
+class TestPickling(unittest.TestCase):
+    def test_roundtrip(self):
+        differences = [
+            Missing('foo'),
+            Extra(1.5),
+            Invalid('bar'),
+            Invalid('baz', 'qux'),
+            Deviation(-1, 10),
+            Deviation(+0.5, 2.0),
+            MinimalDifference('A', 'B', 'C'),
+        ]
+        for diff in differences:
+            unpickled = pickle.loads(pickle.dumps(diff))
+            self.assertEqual(unpickled, diff)
+            self.assertEqual(type(unpickled), type(diff))
+
+    def test_custom_subclass(self):
+        """Subclasses with other constructor signatures should
+        use the default pickling behavior.
+        """
+        diff = KeywordDifference(a=1, b=2)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            unpickled = pickle.loads(pickle.dumps(diff, protocol))
+            self.assertEqual(unpickled, diff)
+            self.assertEqual(type(unpickled), KeywordDifference)
+
+    def test_invalid_without_expected(self):
+        unpickled = pickle.loads(pickle.dumps(Invalid('bar')))
+        self.assertEqual(unpickled.args, ('bar',))
+        self.assertIs(unpickled.expected, NOVALUE)
+
+
 class TestMakeDifference(unittest.TestCase):
     def test_numeric_vs_numeric(self):
         diff = _make_difference(5, 6)
@@ -464,3 +508,41 @@ class TestMakeDifference(unittest.TestCase):
 
         # NaN should work though.
         _make_difference(float('nan'), float('nan'))
+
+
+class TestGetDifferenceFactory(unittest.TestCase):
+    def assertSameAsMakeDifference(self, actual, expected, show_expected=True):
+        make_difference = _get_difference_factory(expected, show_expected)
+        diff = make_difference(actual)
+        self.assertEqual(diff, _make_difference(actual, expected, show_expected))
+        self.assertIs(type(diff), type(_make_difference(actual, expected, show_expected)))
+
+    def test_numeric_expected(self):
+        for actual in [5, 5.5, 1 + 2j, float('nan'), 'a', b'a', None,
+                       True, NOVALUE, decimal.Decimal('5'), (1, 2)]:
+            self.assertSameAsMakeDifference(actual, 6)
+            self.assertSameAsMakeDifference(actual, 6.0, show_expected=False)
+
+    def test_non_numeric_expected(self):
+        regex = re.compile('^test$')
+        function = lambda x: False
+        for expected in ['b', None, (1, 2), regex, function, int]:
+            for actual in [5, 'a', 0.5, True, NOVALUE, (3, 4)]:
+                self.assertSameAsMakeDifference(actual, expected)
+                self.assertSameAsMakeDifference(actual, expected, False)
+
+    def test_boolean_expected(self):
+        for actual in [False, 0, 2, 'a', NOVALUE]:
+            self.assertSameAsMakeDifference(actual, True)
+            self.assertSameAsMakeDifference(actual, True, show_expected=False)
+
+    def test_novalue_expected(self):
+        self.assertSameAsMakeDifference('a', NOVALUE)
+        self.assertSameAsMakeDifference(0, NOVALUE)
+
+    def test_rsub_expected(self):
+        expected = datetime.datetime(1989, 2, 24, hour=11, minute=30)
+        actual = datetime.datetime(1989, 2, 24, hour=10, minute=30)
+        self.assertSameAsMakeDifference(actual, expected)
+        self.assertSameAsMakeDifference('a', expected)
+        self.assertSameAsMakeDifference(decimal.Decimal('5'), decimal.Decimal('6'))
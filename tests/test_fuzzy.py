@@ -0,0 +1,49 @@
+"""Tests for fuzzy matching functions."""
+import difflib
+from . import _unittest as unittest
+from datatest._fuzzy import FuzzyMatcher
+
+
+class TestFuzzyMatcher(unittest.TestCase):
+    def test_same_as_sequencematcher(self):
+        values = ['', 'a', 'abc', 'abx', 'xbc', 'aaaaa', 'aaaax', 'St. Louis',
+                  'Saint Louis', 'New York', 'New York City', 'xyzxyzxyz']
+        for cutoff in (0.0, 0.3, 0.6, 0.8, 1.0):
+            fuzzy_match = FuzzyMatcher(cutoff)
+            for a in values:
+                for b in values:
+                    ratio = difflib.SequenceMatcher(a=a, b=b).ratio()
+                    msg = 'cutoff={0!r}, a={1!r}, b={2!r}'.format(cutoff, a, b)
+                    self.assertEqual(fuzzy_match(a, b), ratio >= cutoff, msg=msg)
+
+    def test_incompatible_values(self):
+        fuzzy_match = FuzzyMatcher(0.6)
+        self.assertFalse(fuzzy_match('abc', 123))
+        self.assertFalse(fuzzy_match('abc', None))
+
+    def test_unhashable_values(self):
+        fuzzy_match = FuzzyMatcher(0.6)
+        self.assertTrue(fuzzy_match('abc', ['a', 'b', 'c']))
+        self.assertFalse(fuzzy_match('abc', ['x', 'y', 'z']))
+        self.assertEqual(fuzzy_match._cache, {})
+
+    def test_similarity(self):
+        calls = []
+        def similarity(a, b):
+            calls.append((a, b))
+            return 0.75
+
+        fuzzy_match = FuzzyMatcher(0.7, similarity=similarity)
+        self.assertTrue(fuzzy_match('abc', 'xyz'))
+        self.assertTrue(fuzzy_match('abc', 'xyz'))
+        self.assertEqual(calls, [('abc', 'xyz')], msg='second result is cached')
+
+        fuzzy_match = FuzzyMatcher(0.8, similarity=similarity)
+        self.assertFalse(fuzzy_match('abc', 'xyz'))
+
+    def test_cache_maxsize(self):
+        fuzzy_match = FuzzyMatcher(0.6, maxsize=2)
+        fuzzy_match('a', 'a')
+        fuzzy_match('a', 'b')
+        fuzzy_match('a', 'c')
+        self.assertEqual(len(fuzzy_match._cache), 1)
@@ -1,13 +1,16 @@
 """Tests for normalization functions."""
 import sqlite3
+import sys
 from . import _unittest as unittest
 from datatest.requirements import BaseRequirement
 from datatest._utils import IterItems
 
+from datatest import _normalize
 from datatest._normalize import TypedIterator
 from datatest._normalize import _normalize_lazy
 from datatest._normalize import _normalize_eager
 from datatest._normalize import normalize
+from datatest._normalize import register_normalizer
 
 try:
     import squint
@@ -42,6 +45,17 @@ class TestNormalizeLazyUnchanged(unittest.TestCase):
         data = TypedIterator(iter([1, 2, 3]), evaltype=tuple)
         self.assertIs(_normalize_lazy(data), data)
 
+    def test_typediterator_shared_state(self):
+        """Iterating and calling next() should advance the same values."""
+        data = TypedIterator([1, 2, 3, 4], evaltype=tuple)
+        self.assertIs(iter(data), iter(data), msg='should be exhaustible')
+        self.assertEqual(next(data), 1)
+        for value in data:
+            self.assertEqual(value, 2)
+            break
+        self.assertEqual(next(data), 3)
+        self.assertEqual(data.fetch(), (4,))
+
 
 @unittest.skipUnless(squint, 'requires squint')
 class TestNormalizeLazySquint(unittest.TestCase):
@@ -229,6 +243,53 @@ class TestNormalizeLazyNumpy(unittest.TestCase):
         self.assertIsInstance(lazy, TypedIterator)
         self.assertEqual(lazy.fetch(), ['x', 'y', 'z'])
 
+    def test_numpy_scalars_unchanged(self):
+        """Numeric and string values should remain NumPy scalars."""
+        arr = numpy.array([[1.5, 2.0], [3.0, 4.5]])
+        values = _normalize_lazy(arr).fetch()
+        self.assertEqual(values, [(1.5, 2.0), (3.0, 4.5)])
+        self.assertIsInstance(values[0][0], numpy.float64)
+
+        arr = numpy.array([(1, 2.5)], dtype=[('one', 'i4'), ('two', 'f8')])
+        values = _normalize_lazy(arr).fetch()
+        self.assertIsInstance(values[0][0], numpy.integer)
+        self.assertIsInstance(values[0][1], numpy.floating)
+
+        arr = numpy.array([True, False])
+        values = _normalize_lazy(arr).fetch()
+        self.assertEqual([type(x) for x in values], [numpy.bool_, numpy.bool_])
+
+        arr = numpy.array(['x', 'y'])
+        values = _normalize_lazy(arr).fetch()
+        self.assertIsInstance(values[0], numpy.character)
+
+    def test_chunked_conversion(self):
+        """Object arrays are retrieved in chunks with tolist()."""
+        arr = numpy.array([[x, x + 1] for x in range(0, 20, 2)], dtype=object)
+        original = _normalize.ARRAY_CHUNK_SIZE
+        try:
+            _normalize.ARRAY_CHUNK_SIZE = 3
+            values = _normalize_lazy(arr).fetch()
+        finally:
+            _normalize.ARRAY_CHUNK_SIZE = original
+        self.assertEqual(values, [(x, x + 1) for x in range(0, 20, 2)])
+
+    def test_datetime_values_unchanged(self):
+        """Datetime values should not be converted with tolist()."""
+        arr = numpy.array([['2020-01-01T00:00:00.000000001']], dtype='datetime64[ns]')
+        values = _normalize_lazy(arr).fetch()
+        self.assertIsInstance(values[0][0], numpy.datetime64)
+
+    def test_masked_array_values_unchanged(self):
+        """Masked elements should not be converted to None."""
+        arr = numpy.ma.array([1.0, 2.0, 3.0], mask=[0, 1, 0])
+        values = _normalize_lazy(arr).fetch()
+        self.assertIs(values[1], numpy.ma.masked)
+
+        arr = numpy.ma.array([[1.0, 2.0], [3.0, 4.0]], mask=[[0, 1], [0, 0]])
+        values = _normalize_lazy(arr).fetch()
+        self.assertIs(values[0][1], numpy.ma.masked)
+
     def test_three_dimentional_array(self):
         """Three-dimentional array normalization is not supported."""
         arr = numpy.array([[[1, 3], ['a', 'x']], [[2, 4], ['b', 'y']]])
@@ -266,6 +327,52 @@ class TestNormalizeLazyDBAPI2Cursor(unittest.TestCase):
         self.assertEqual(list(result), [20, 30, 10, 20, 10, 10])
 
 
+class TestRegisterNormalizer(unittest.TestCase):
+    def setUp(self):
+        class Reader(object):
+            def __init__(self, rows):
+                self.rows = rows
+
+        class SubReader(Reader):
+            pass
+
+        self.Reader = Reader
+        self.SubReader = SubReader
+
+    def tearDown(self):
+        _normalize._normalizers.pop(self.Reader, None)
+        _normalize._normalizers_by_name.pop('tests.test_normalize.Reader', None)
+        _normalize._dispatch_cache.clear()
+
+    def test_register_type(self):
+        reader = self.Reader([('a', 1), ('b', 2)])
+        self.assertIs(_normalize_lazy(reader), reader)  # <- Cached as None.
+
+        register_normalizer(self.Reader, lambda obj: iter(obj.rows))
+        self.assertEqual(list(_normalize_lazy(reader)), [('a', 1), ('b', 2)])
+
+        subreader = self.SubReader([('c', 3)])  # <- Found using the MRO.
+        self.assertEqual(list(_normalize_lazy(subreader)), [('c', 3)])
+
+    def test_register_mapping(self):
+        register_normalizer(self.Reader, lambda obj: IterItems(obj.rows))
+        reader = self.Reader([('a', 1), ('b', 2)])
+        self.assertEqual(normalize(reader), {'a': 1, 'b': 2})
+
+    def test_register_by_name(self):
+        sys.modules[__name__].Reader = self.Reader
+        try:
+            register_normalizer(__name__ + '.Reader', lambda obj: iter(obj.rows))
+            reader = self.Reader([('a', 1)])
+            self.assertEqual(list(_normalize_lazy(reader)), [('a', 1)])
+        finally:
+            del sys.modules[__name__].Reader
+
+    def test_bad_type(self):
+        with self.assertRaises(TypeError):
+            register_normalizer(self.Reader([]), lambda obj: obj)
+
+
 class TestNormalizeEager(unittest.TestCase):
     def test_unchanged(self):
         """For given instances, should return original object."""
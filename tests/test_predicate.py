@@ -11,6 +11,7 @@ try:
 except ImportError:
     numpy = False
 
+from datatest._vendor import predicate as _predicate
 from datatest._vendor.predicate import (
     _check_type,
     _check_callable,
@@ -22,6 +23,7 @@ from datatest._vendor.predicate import (
     _check_set,
     _get_matcher_parts,
     get_matcher,
+    compile_matcher,
     MatcherBase,
     MatcherObject,
     MatcherTuple,
@@ -306,6 +308,105 @@ class TestGetMatcher(unittest.TestCase):
         self.assertEqual(repr(matcher), expected)
 
 
+class TestCompileMatcher(unittest.TestCase):
+    def assertSameAsMatcher(self, obj, values):
+        matcher = get_matcher(obj)
+        function = compile_matcher(matcher)
+        for value in values:
+            msg = 'obj={0!r}, value={1!r}'.format(obj, value)
+            self.assertEqual(function(value), matcher == value, msg=msg)
+
+    def test_single_value(self):
+        values = ['_', 'X', 1, 1.0, None, ('_',)]
+        self.assertSameAsMatcher('_', values)
+        self.assertSameAsMatcher(1, values)
+        self.assertSameAsMatcher(int, values)
+        self.assertSameAsMatcher(re.compile('_'), values)
+        self.assertSameAsMatcher(set(['_', 1]), values)
+        self.assertSameAsMatcher(Ellipsis, values)
+
+    def test_passthrough(self):
+        TOKEN = object()
+        function = compile_matcher(get_matcher(lambda x: TOKEN))
+        self.assertIs(function('abc'), TOKEN)
+
+    def test_tuple_of_values(self):
+        def mycallable(x):  # <- Helper function.
+            return x == '_'
+
+        obj = (mycallable, re.compile('_'), set(['_']), '_', Ellipsis, str)
+        values = [
+            ('_', '_', '_', '_', '_', '_'),
+            ('X', '_', '_', '_', '_', '_'),
+            ('_', 'X', '_', '_', '_', '_'),
+            ('_', '_', 'X', '_', '_', '_'),
+            ('_', '_', '_', 'X', '_', '_'),
+            ('_', '_', '_', '_', 'X', '_'),
+            ('_', '_', '_', '_', '_', 1),
+            ('_', '_', '_', '_', '_'),    # <- Too short.
+            ['_', '_', '_', '_', '_', '_'],  # <- Not a tuple.
+            '______',
+            None,
+        ]
+        self.assertSameAsMatcher(obj, values)
+
+    def test_literal_fields_checked_first(self):
+        calls = []
+        def mycallable(x):  # <- Helper function.
+            calls.append(x)
+            return True
+
+        function = compile_matcher(get_matcher((int, 'A', 'B', mycallable)))
+        self.assertFalse(function((1, 'A', 'X', 'x')))
+        self.assertFalse(function(('y', 'A', 'B', 'y')))
+        self.assertEqual(calls, [], msg='cheaper checks should reject first')
+
+        self.assertTrue(function((1, 'A', 'B', 'z')))
+        self.assertEqual(calls, ['z'])
+
+    def test_callables_keep_order(self):
+        """Checks should not be moved across user-defined callables."""
+        calls = []
+        def mycallable(x):  # <- Helper function.
+            calls.append(x)
+            return True
+
+        function = compile_matcher(get_matcher((mycallable, 'A', 'B')))
+        self.assertFalse(function(('x', 'A', 'X')))
+        self.assertEqual(calls, ['x'])
+
+        def error(x):  # <- Helper function.
+            raise ValueError(x)
+
+        function = compile_matcher(get_matcher((error, 'A')))
+        with self.assertRaises(ValueError):
+            function(('x', 'X'))
+        with self.assertRaises(ValueError):
+            function(('x',))  # <- Different length, same as tuple comparison.
+
+    def test_shared_factories(self):
+        """Tuple matchers with the same shape should share a factory."""
+        function1 = compile_matcher(get_matcher(('a', int, Ellipsis)))
+        count = len(_predicate._tuple_factories)
+        function2 = compile_matcher(get_matcher(('b', float, Ellipsis)))
+        self.assertEqual(len(_predicate._tuple_factories), count)
+
+        self.assertTrue(function1(('a', 1, 'x')))
+        self.assertFalse(function1(('b', 1.5, 'x')))
+        self.assertTrue(function2(('b', 1.5, 'x')))
+        self.assertFalse(function2(('a', 1, 'x')))
+
+    def test_single_item_tuple(self):
+        self.assertSameAsMatcher((int,), [(1,), ('a',), (), (1, 2), 1])
+
+    def test_identity(self):
+        class NeverEqual(object):
+            def __eq__(self, other):
+                return False
+        never_equal = NeverEqual()
+        self.assertSameAsMatcher((never_equal, int), [(never_equal, 1), (NeverEqual(), 1)])
+
+
 class TestPredicate(unittest.TestCase):
     def test_predicate_function(self):
         pred = Predicate('abc')
@@ -367,6 +468,17 @@ class TestPredicate(unittest.TestCase):
         pred = Predicate(1)
         self.assertFalse(pred(numpy.dtype(float)))
 
+    def test_lazy_tuple_compile(self):
+        """Tuple matchers should be compiled only after several calls."""
+        pred = Predicate(('a', int))
+        self.assertIsNone(pred._func)
+        for _ in range(_predicate._COMPILE_AFTER_CALLS - 1):
+            self.assertTrue(pred(('a', 1)))
+            self.assertFalse(pred(('b', 1)))
+        self.assertIsNotNone(pred._func)
+        self.assertTrue(pred(('a', 1)))
+        self.assertFalse(pred('a'))
+
     def test_inverted_logic(self):
         pred = ~Predicate('abc')
         self.assertFalse(pred('abc'))
@@ -38,6 +38,7 @@ from datatest.requirements import (
     RequiredOrder,
     RequiredSequence,
     RequiredMapping,
+    RequiredSortedMapping,
 
     get_requirement,
     adapts_mapping,
@@ -346,6 +347,18 @@ class TestGroupRequirement(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.requirement.check_items(data, autowrap=False)
 
+    def test_check_element(self):
+        """Default method should check element as a group."""
+        diff, desc = self.requirement.check_element(1)
+        self.assertEqual(diff, Invalid(1))  # <- Unwrapped difference.
+        self.assertEqual(desc, 'requires 3 or more elements')
+
+        class RequiredNotOne(GroupRequirement):
+            def check_group(self, group):
+                return [Invalid(x) for x in group if x != 1], 'not one'
+
+        self.assertIsNone(RequiredNotOne().check_element(1))
+
     def test_check_data(self):
         # Test mapping or key/value items.
         data = {'A': [1, 2, 3], 'B': [4, 5], 'C': 6}
@@ -387,6 +400,34 @@ class TestRequiredPredicate2(unittest.TestCase):
         self.assertEqual(list(diff), [Invalid('XX')])
         self.assertEqual(desc, 'does not satisfy isdigit()')
 
+    def test_check_element(self):
+        self.assertIsNone(self.requirement.check_element('10'))
+
+        diff, desc = self.requirement.check_element('XX')
+        self.assertEqual(diff, Invalid('XX'))
+        self.assertEqual(desc, 'does not satisfy isdigit()')
+
+        requirement = RequiredPredicate(5, show_expected=True)
+        self.assertEqual(requirement.check_element(7)[0], Deviation(+2, 5))
+        self.assertEqual(requirement.check_element('a')[0], Invalid('a', 5))
+
+    def test_check_element_overridden_check_group(self):
+        """Subclasses that override check_group() must still be used
+        when checking a single element.
+        """
+        class MyRequirement(RequiredPredicate):
+            def check_group(self, group):
+                differences, _ = super(MyRequirement, self).check_group(group)
+                return differences, 'my message'
+
+        requirement = MyRequirement('x')
+        self.assertIsNone(requirement.check_element('x'))
+        self.assertEqual(requirement.check_element('y'), (Invalid('y'), 'my message'))
+
+        diff, desc = requirement.check_items([('a', 'x'), ('b', 'y')])
+        self.assertEqual(evaluate_items(diff), [('b', Invalid('y'))])
+        self.assertEqual(desc, 'my message')
+
     def test_show_expected(self):
         data = ['XX', 'YY']
         requirement = RequiredPredicate('YY', show_expected=True)
@@ -481,6 +522,13 @@ class TestRequiredPredicate2(unittest.TestCase):
 
 
 class TestRequiredRegex(unittest.TestCase):
+    def test_compiled_regex(self):
+        regex = re.compile('[a-z][0-9]+')
+        data = ['a1', 'b2', 'c', 3, regex]
+        requirement = RequiredRegex(regex)
+        diff, desc = requirement(data)
+        self.assertEqual(list(diff), [Invalid('c'), Invalid(3)])
+
     def test_all_true(self):
         data = iter(['abx', 'aby', 'abz'])
         requirement = RequiredRegex(r'^a\w\w$')
@@ -709,6 +757,15 @@ class TestRequiredFuzzy(unittest.TestCase):
         self.assertEqual(list(diff), [Invalid('aaaxx'), Invalid('xxxxx')])
         self.assertEqual(desc, "does not satisfy 'aaaaa', fuzzy matching at ratio 0.8 or greater")
 
+    def test_similarity(self):
+        def same_length(a, b):
+            return 1.0 if len(a) == len(b) else 0.0
+
+        data = ['xxxxx', 'aaaa']
+        requirement = RequiredFuzzy('aaaaa', similarity=same_length)
+        diff, desc = requirement(data)
+        self.assertEqual(list(diff), [Invalid('aaaa')])
+
     def test_tuple_comparison(self):
         """Should work on string elements within tuples."""
         data = [(1, 'abx'), (2, 'abx'), (1, 'xyz')]
@@ -936,6 +993,18 @@ class TestRequiredSet2(unittest.TestCase):
         differences, description = requirement([])
         self.assertEqual(list(differences), [Missing(1)])
 
+    def test_check_element(self):
+        """Should match the result of checking a single-element group."""
+        for element in [1, 4]:
+            diff, desc = self.requirement.check_group([element])
+            expected = (list(diff), desc)
+            diff, desc = self.requirement.check_element(element)
+            self.assertEqual((list(diff), desc), expected)
+
+        requirement = RequiredSet(set([1, 2]))
+        self.assertEqual(requirement.check_element(1)[0], Missing(2))
+        self.assertIsNone(RequiredSet(set([1])).check_element(1))
+
 
 class TestRequiredSuperset(unittest.TestCase):
     def test_element_group(self):
@@ -973,6 +1042,11 @@ class TestRequiredSuperset(unittest.TestCase):
         diff = sorted(diff, key=lambda x: x.args)
         self.assertEqual(diff, [Missing(1), Missing(2)])
 
+    def test_check_element(self):
+        requirement = RequiredSuperset(set([1, 2]))
+        self.assertEqual(requirement.check_element(1)[0], Missing(2))
+        self.assertIsNone(RequiredSuperset(set([1])).check_element(1))
+
 
 class TestRequiredSubset(unittest.TestCase):
     def test_element_group(self):
@@ -1227,6 +1301,32 @@ class TestRequiredSequence(unittest.TestCase):
         ]
         self.assertEqual(list(diff), expected)
 
+    def test_reused_matchers(self):
+        """Matchers should be created once and reused between checks."""
+        calls = []
+        def factory(val):
+            calls.append(val)
+            return RequiredPredicate(val)
+
+        requirement = RequiredSequence(['a', 'b'], factory=factory)
+        self.assertIsNone(requirement(['a', 'b']))
+        diff, desc = requirement(['a', 'x', 'y'])
+        self.assertEqual(list(diff), [Invalid('x', expected='b'), Extra('y')])
+        self.assertEqual(calls, ['a', 'b', NOVALUE])
+
+        requirement.iterable = ['x']  # <- Replaced iterable is used.
+        self.assertIsNone(requirement(['x']))
+
+        requirement.iterable.append('y')  # <- Changed in place.
+        self.assertIsNone(requirement(['x', 'y']))
+        requirement.iterable[0] = 'z'
+        self.assertIsNone(requirement(['z', 'y']))
+
+    def test_multiple_differences_error(self):
+        requirement = RequiredSequence([set(['a', 'b'])], factory=RequiredSet)
+        with self.assertRaises(ValueError):
+            list(requirement(['c'])[0])
+
 
 class TestRequiredMapping(unittest.TestCase):
     def test_instantiation(self):
@@ -1385,6 +1485,39 @@ class TestRequiredMapping(unittest.TestCase):
         self.assertEqual(evaluate_items(diff), expected)
         self.assertEqual(desc, 'my message')
 
+    def test_check_element_used(self):
+        """Single-element values should be checked with check_element()."""
+        class MyRequirement(GroupRequirement):
+            def check_group(self, group):
+                raise AssertionError('should not be called')
+
+            def check_element(self, element):
+                if element == 1:
+                    return None
+                return Invalid(element), 'my message'
+
+        requirement = RequiredMapping({'a': MyRequirement(), 'b': MyRequirement()})
+        diff, desc = requirement({'a': 1, 'b': 2})
+        self.assertEqual(evaluate_items(diff), [('b', Invalid(2))])
+        self.assertEqual(desc, 'my message')
+
+    def test_check_group_override_respected(self):
+        """Requirements that override check_group() should not be
+        bypassed by the single-element fast path.
+        """
+        class MyRequirement(RequiredPredicate):
+            def check_group(self, group):
+                differences, _ = super(MyRequirement, self).check_group(group)
+                return differences, 'my message'
+
+        def factory(value):
+            return MyRequirement(value)
+
+        requirement = RequiredMapping({'a': 'x', 'b': 'x'}, factory)
+        diff, desc = requirement({'a': 'x', 'b': 'y'})
+        self.assertEqual(evaluate_items(diff), [('b', Invalid('y', expected='x'))])
+        self.assertEqual(desc, 'my message')
+
     def test_abstract_factory(self):
         """Test *abstract_factory* argument and method."""
         def custom_factory(value):
@@ -1477,6 +1610,80 @@ class TestRequiredMapping(unittest.TestCase):
         self.assertEqual(desc, 'does not satisfy mapping requirements')
 
 
+class TestRequiredSortedMapping(unittest.TestCase):
+    def test_no_differences(self):
+        requirement = RequiredSortedMapping([('a', 'x'), ('b', 1), ('c', set(['y']))])
+        data = iter([('a', 'x'), ('b', 1), ('c', ['y', 'y'])])
+        self.assertIsNone(requirement(data))
+
+    def test_merged_differences(self):
+        requirement = RequiredSortedMapping(iter([
+            ('a', 'x'),
+            ('c', 3),
+            ('d', set(['y'])),
+            ('f', 6),
+        ]))
+        data = iter([
+            ('b', 2),           # <- Extra key.
+            ('c', 4),
+            ('d', ['y', 'z']),
+            ('e', 'q'),         # <- Extra key.
+        ])
+        diff, desc = requirement(data)
+        expected = [
+            ('a', Missing('x')),
+            ('b', Extra(2)),
+            ('c', Deviation(+1, 3)),
+            ('d', [Extra('z')]),
+            ('e', Extra('q')),
+            ('f', Missing(6)),
+        ]
+        self.assertEqual(evaluate_items(diff), expected)
+        self.assertEqual(desc, 'does not satisfy mapping requirements')
+
+    def test_same_as_unsorted(self):
+        required = {'a': 'j', 'b': 9, 'c': 'x', 'd': set(['y'])}
+        data = {'a': 'k', 'b': [9, 10], 'e': 'z'}
+
+        diff, desc = RequiredSortedMapping(required)(sorted(data.items()))
+        unsorted_diff, unsorted_desc = RequiredMapping(required)(data)
+        self.assertEqual(dict(evaluate_items(diff)),
+                         dict(evaluate_items(unsorted_diff)))
+        self.assertEqual(desc, unsorted_desc)
+
+    def test_factory(self):
+        requirement = RequiredSortedMapping({'a': 'xy', 'b': 'z'}, factory=RequiredSet)
+        self.assertIsInstance(requirement, RequiredMapping)
+        self.assertEqual(requirement.mapping, [('a', 'xy'), ('b', 'z')])
+
+        diff, desc = requirement(iter([('a', ['x', 'y', 'q']), ('b', ['z'])]))
+        self.assertEqual(evaluate_items(diff), [('a', [Extra('q')])])
+
+    def test_unsorted_keys(self):
+        requirement = RequiredSortedMapping([('a', 1), ('b', 2)])
+        with self.assertRaises(ValueError):
+            requirement([('b', 2), ('a', 1)])
+
+        requirement = RequiredSortedMapping([('b', 2), ('a', 1)])
+        with self.assertRaises(ValueError):
+            requirement([('a', 1), ('b', 2)])
+
+    def test_duplicate_keys(self):
+        requirement = RequiredSortedMapping([('a', 1), ('b', 2)])
+        with self.assertRaises(ValueError):
+            requirement([('a', 1), ('a', 1), ('b', 2)])
+
+    def test_exhausted_iterator(self):
+        requirement = RequiredSortedMapping(iter([('a', 1), ('b', 2)]))
+        self.assertIsNone(requirement([('a', 1), ('b', 2)]))
+        with self.assertRaises(ValueError):
+            requirement([('a', 1), ('b', 2)])  # <- Checked a second time.
+
+        requirement = RequiredSortedMapping([('a', 1), ('b', 2)])
+        self.assertIsNone(requirement([('a', 1), ('b', 2)]))
+        self.assertIsNone(requirement([('a', 1), ('b', 2)]))  # <- Lists can be reused.
+
+
 class TestGetRequirement(unittest.TestCase):
     def test_set(self):
         requirement = get_requirement(set(['foo', 'bar', 'baz']))
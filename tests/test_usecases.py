@@ -370,6 +370,23 @@ class TestNanHandling(unittest.TestCase):
         datatest.validate.superset(data, set([1, 2, nantoken]))
 
 
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestNumpyTypes(unittest.TestCase):
+    def test_generic_types(self):
+        """Array elements should be checked as NumPy scalars."""
+        datatest.validate(numpy.array([1, 2, 3]), numpy.integer)
+        datatest.validate(numpy.array([1.0, 2.0]), numpy.float64)
+
+        data = numpy.array([(1, 12.25), (2, 33.75), (3, 101.5)],
+                           dtype='int32, float32')
+        datatest.validate(data, (numpy.integer, numpy.floating))
+
+    def test_bool_deviation(self):
+        with self.assertRaises(datatest.ValidationError) as cm:
+            datatest.validate(numpy.array([True, False]), 1)
+        self.assertEqual(cm.exception.differences, [datatest.Deviation(-1, 1)])
+
+
 class TestDateHandling(unittest.TestCase):
     def test_timedelta_tolerance(self):
         data = datetime.datetime(1989, 2, 24, hour=10, minute=30)
@@ -29,6 +29,16 @@ class TestIterItems(unittest.TestCase):
         self.assertEqual(list(items), [('a', 1), ('b', 2)])
         self.assertEqual(list(items), [], msg='already exhausted')
 
+    def test_shared_iterator_state(self):
+        """Iterating and calling next() should advance the same items."""
+        items = IterItems(iter([('a', 1), ('b', 2), ('c', 3)]))
+        self.assertEqual(next(items), ('a', 1))
+        for item in items:
+            self.assertEqual(item, ('b', 2))
+            break
+        self.assertEqual(next(items), ('c', 3))
+        self.assertEqual(list(items), [])
+
     def test_dict(self):
         mapping = {'a': 1, 'b': 2}
 
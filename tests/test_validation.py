@@ -1,4 +1,5 @@
 """Tests for validation and comparison functions."""
+import pickle
 import re
 import sys
 import textwrap
@@ -34,6 +35,16 @@ class MinimalDifference(BaseDifference):
         return self._args
 
 
+class KeywordDifference(BaseDifference):
+    """Difference whose constructor does not accept its args."""
+    def __init__(self, **kwds):
+        self._kwds = kwds
+
+    @property
+    def args(self):
+        return tuple(sorted(self._kwds.items()))
+
+
 def dedent_and_strip(text):
     """A helper function to dedent and strip strings."""
     return textwrap.dedent(text).strip()
@@ -346,6 +357,78 @@ class TestValidationError(unittest.TestCase):
         err = ValidationError([MinimalDifference('A')])
         self.assertEqual(err.args, ([MinimalDifference('A')], None))
 
+    def test_pickle_list(self):
+        differences = [
+            Deviation(+0.5, 2.0),
+            Deviation(-1, 3),
+            Deviation(+1, 2**70),
+            Invalid('x'),
+            Invalid('a', 'b'),
+            Missing(1),
+            Extra(float('nan')),
+            MinimalDifference('A', 'B'),
+            KeywordDifference(a=1),
+            KeywordDifference(b=2),
+            Deviation(+0.25, 4.0),
+        ]
+        err = ValidationError(differences, 'some differences')
+        unpickled = pickle.loads(pickle.dumps(err))
+
+        self.assertIsInstance(unpickled, ValidationError)
+        self.assertEqual(unpickled.description, 'some differences')
+        self.assertEqual(repr(unpickled), repr(err))
+        self.assertEqual(
+            [type(x) for x in unpickled.differences],
+            [type(x) for x in differences],
+        )
+
+    def test_pickle_mapping(self):
+        differences = {
+            'a': Invalid('x'),
+            'b': [Missing(1), Extra(2.5)],
+            ('c', 1): Deviation(+1, 2),
+            'd': [],
+        }
+        err = ValidationError(differences)
+        unpickled = pickle.loads(pickle.dumps(err))
+        self.assertEqual(unpickled.differences, differences)
+        self.assertIsNone(unpickled.description)
+
+    def test_merge_lists(self):
+        err1 = ValidationError([Missing('A')], 'desc')
+        err2 = ValidationError([Extra('B'), Extra('C')], 'desc')
+        merged = err1.merge(err2)
+        self.assertEqual(merged.differences, [Missing('A'), Extra('B'), Extra('C')])
+        self.assertEqual(merged.description, 'desc')
+        self.assertEqual(err1.differences, [Missing('A')], 'should not change original')
+
+    def test_merge_mappings(self):
+        err1 = ValidationError({'a': Missing(1), 'b': [Extra(2)]})
+        err2 = ValidationError({'a': Extra(3), 'c': Missing(4)})
+        err3 = ValidationError({'a': Invalid(5)})
+        merged = err1.merge(err2, err3)
+        expected = {
+            'a': [Missing(1), Extra(3), Invalid(5)],
+            'b': [Extra(2)],
+            'c': Missing(4),
+        }
+        self.assertEqual(merged.differences, expected)
+        self.assertEqual(err1.differences, {'a': Missing(1), 'b': [Extra(2)]})
+
+    def test_merge_description(self):
+        err1 = ValidationError([Missing('A')], 'desc 1')
+        err2 = ValidationError([Missing('B')], 'desc 2')
+        self.assertIsNone(err1.merge(err2).description)
+
+    def test_merge_bad_values(self):
+        err1 = ValidationError([Missing('A')])
+        err2 = ValidationError({'a': Missing('B')})
+        with self.assertRaises(ValueError):
+            err1.merge(err2)
+
+        with self.assertRaises(TypeError):
+            err1.merge([Missing('C')])
+
 
 class TestRenderTraceback(unittest.TestCase):
     """The ValidationError._render_traceback_() method returns a list
@@ -709,3 +792,88 @@ class TestValidate(unittest.TestCase):
         actual = cm.exception.differences
         expected = {'x': [Missing((1, 'B'))], 'y': [Extra((0, 'B'))]}
         self.assertEqual(actual, expected)
+
+
+class TestValidateCompile(unittest.TestCase):
+    def test_default_kind(self):
+        validator = validate.compile(set(['a', 'b']))
+        self.assertIsNone(validator(['a', 'b', 'a']))
+        self.assertTrue(validator.is_valid(['a', 'b']))
+        self.assertFalse(validator.is_valid(['a', 'c']))
+
+        with self.assertRaises(ValidationError) as cm:
+            validator(['a', 'c'])
+        self.assertEqual(cm.exception.differences, [Missing('b'), Extra('c')])
+
+    def test_msg(self):
+        validator = validate.compile(int, msg='must be int')
+        with self.assertRaises(ValidationError) as cm:
+            validator([1, 'x'])
+        self.assertEqual(cm.exception.description, 'must be int')
+
+    def test_kinds(self):
+        validator = validate.compile(r'^\d{5}$', kind='regex')
+        self.assertTrue(validator.is_valid(['46532', '43206']))
+        self.assertFalse(validator.is_valid(['4653']))
+
+        validator = validate.compile('^A', kind='regex', flags=re.IGNORECASE)
+        self.assertTrue(validator.is_valid(['abc', 'ABC']))
+
+        validator = validate.compile(kind='interval', min=5, max=15)
+        self.assertTrue(validator.is_valid([5, 10, 15]))
+        self.assertFalse(validator.is_valid([5, 10, 20]))
+
+        validator = validate.compile(kind='unique')
+        self.assertTrue(validator.is_valid([1, 2, 3]))
+        self.assertFalse(validator.is_valid([1, 2, 2]))
+
+        validator = validate.compile(1.5, kind='approx', places=1)
+        self.assertTrue(validator.is_valid([1.51, 1.49]))
+
+        validator = validate.compile(['x', 'y'], kind='order')
+        with self.assertRaises(ValidationError) as cm:
+            validator(['y', 'x'])
+        self.assertFalse(cm.exception._sorted_str)
+
+    def test_same_as_validate(self):
+        data = {'a': 1, 'b': [2, 3], 'c': 'x'}
+        requirement = {'a': 2, 'b': set([2]), 'c': 'x', 'd': 4}
+
+        with self.assertRaises(ValidationError) as cm:
+            validate(data, requirement)
+        expected = cm.exception.differences
+
+        validator = validate.compile(requirement)
+        for _ in range(2):  # <- Prepared checkers are reused.
+            with self.assertRaises(ValidationError) as cm:
+                validator(data)
+            self.assertEqual(cm.exception.differences, expected)
+
+        validator = validate.compile({'a': 1, 'b': [2, 3]}, kind='predicate')
+        self.assertTrue(validator.is_valid({'a': 1, 'b': [2, 3]}))
+        self.assertFalse(validator.is_valid({'a': 1, 'b': [2, 4]}))
+
+    def test_subset_superset_warning_location(self):
+        """Deprecation warnings should point at the caller's code."""
+        calls = [
+            lambda: validate.subset(['a'], set(['a', 'b'])),
+            lambda: validate.superset(['a', 'b'], set(['a'])),
+            lambda: validate.compile(set(['a']), kind='subset'),
+            lambda: validate.compile(set(['a']), kind='superset'),
+        ]
+        for call in calls:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter('always')
+                call()
+            self.assertEqual(len(caught), 1)
+            self.assertEqual(caught[0].filename, __file__.replace('.pyc', '.py'))
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            validate.compile('abc', kind='bad kind')
+
+        with self.assertRaises(TypeError):
+            validate.compile()  # <- Requirement is required.
+
+        with self.assertRaises(TypeError):
+            validate.compile('abc', flags=0)  # <- Needs kind.
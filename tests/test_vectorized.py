@@ -0,0 +1,211 @@
+"""Tests for vectorized fast paths."""
+import re
+from . import _unittest as unittest
+from datatest.validation import validate
+from datatest.validation import ValidationError
+from datatest.differences import Deviation
+from datatest.differences import Extra
+from datatest.differences import Invalid
+
+from datatest._vectorized import approx_candidates
+from datatest._vectorized import regex_candidates
+from datatest._vectorized import unique_candidates
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestApproxCandidates(unittest.TestCase):
+    def test_unsupported_objects(self):
+        self.assertIsNone(approx_candidates([1.0, 2.0], [1.0, 2.0]))
+
+        data = numpy.array([1.0, 2.0])
+        self.assertIsNone(approx_candidates(data, [1.0, 2.0]))
+
+        mismatched_shape = numpy.array([1.0, 2.0, 3.0])
+        self.assertIsNone(approx_candidates(data, mismatched_shape))
+
+        strings = numpy.array(['a', 'b'])
+        self.assertIsNone(approx_candidates(strings, strings))
+
+    def test_places(self):
+        data = numpy.array([1.0, 2.00000001, 3.5, 4.0])
+        requirement = numpy.array([1.0, 2.0, 3.0, 4.0])
+        actual, expected = approx_candidates(data, requirement)
+        self.assertEqual(actual.tolist(), [3.5])
+        self.assertEqual(expected.tolist(), [3.0])
+
+        actual, expected = approx_candidates(data, requirement, places=9)
+        self.assertEqual(actual.tolist(), [2.00000001, 3.5])
+
+    def test_delta(self):
+        data = numpy.array([1.0, 2.25, 3.5])
+        requirement = numpy.array([1.0, 2.0, 3.0])
+        actual, expected = approx_candidates(data, requirement, delta=0.3)
+        self.assertEqual(actual.tolist(), [3.5])
+
+    def test_nan_values_are_kept(self):
+        data = numpy.array([1.0, float('nan')])
+        requirement = numpy.array([1.0, float('nan')])
+        actual, expected = approx_candidates(data, requirement)
+        self.assertEqual(len(actual), 1)
+
+    def test_integers(self):
+        data = numpy.array([1, 2, 3])
+        requirement = numpy.array([1, 5, 3])
+        actual, expected = approx_candidates(data, requirement)
+        self.assertEqual(actual.tolist(), [2])
+        self.assertEqual(expected.tolist(), [5])
+
+    def test_two_dimensional(self):
+        data = numpy.array([[1.0, 2.0], [3.0, 4.5]])
+        requirement = numpy.array([[1.0, 2.0], [3.0, 4.0]])
+        actual, expected = approx_candidates(data, requirement)
+        self.assertEqual(actual.tolist(), [[3.0, 4.5]])
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_series_rangeindex(self):
+        data = pandas.Series([1.0, 2.5, 3.0])
+        requirement = pandas.Series([1.0, 2.0, 3.0])
+        actual, expected = approx_candidates(data, requirement)
+        self.assertIsInstance(actual, numpy.ndarray)
+        self.assertEqual(actual.tolist(), [2.5])
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_series_otherindex(self):
+        data = pandas.Series([1.0, 2.5, 3.0], index=['a', 'b', 'c'])
+        requirement = pandas.Series([1.0, 2.0, 3.0], index=['a', 'b', 'c'])
+        actual, expected = approx_candidates(data, requirement)
+        self.assertIsInstance(actual, pandas.Series)
+        self.assertEqual(list(actual.index), ['b'])
+
+        mismatched_index = pandas.Series([1.0, 2.0, 3.0], index=['a', 'b', 'x'])
+        self.assertIsNone(approx_candidates(data, mismatched_index))
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_dataframe_single_column(self):
+        data = pandas.DataFrame({'A': [1.0, 2.5, 3.0]})
+        requirement = pandas.DataFrame({'A': [1.0, 2.0, 3.0]})
+        actual, expected = approx_candidates(data, requirement)
+        self.assertEqual(actual.tolist(), [2.5])  # <- Unwrapped values.
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestValidateApproxVectorized(unittest.TestCase):
+    def test_passing(self):
+        data = numpy.array([1.00000001, 2.0, 3.0])
+        requirement = numpy.array([1.0, 2.0, 3.0])
+        validate.approx(data, requirement)
+
+    def test_failing(self):
+        data = numpy.array([1.0, 2.5, 3.0, 4.25])
+        requirement = numpy.array([1.0, 2.0, 3.0, 4.0])
+        with self.assertRaises(ValidationError) as cm:
+            validate.approx(data, requirement)
+
+        expected = [Deviation(+0.5, 2.0), Deviation(+0.25, 4.0)]
+        self.assertEqual(cm.exception.differences, expected)
+        self.assertEqual(cm.exception.description, 'does not match required sequence')
+
+    def test_same_as_unvectorized(self):
+        data = [1.0, 2.5, 3.00000001, 4.000000051, float('nan')]
+        requirement = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.approx(data, requirement)
+        unvectorized = cm.exception.differences
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.approx(numpy.array(data), numpy.array(requirement))
+        self.assertEqual(cm.exception.differences, unvectorized)
+
+
+@unittest.skipUnless(pandas, 'requires pandas')
+class TestRegexCandidates(unittest.TestCase):
+    def test_unsupported_objects(self):
+        regex = re.compile('^a')
+        self.assertIsNone(regex_candidates(['a', 'b'], regex))
+        self.assertIsNone(regex_candidates(pandas.Series([1, 2]), regex))
+
+    def test_series_rangeindex(self):
+        data = pandas.Series(['abc', 'xyz', 123, 'aaa'])
+        candidates = regex_candidates(data, re.compile('^a'))
+        self.assertEqual(list(candidates), ['xyz', 123])
+
+    def test_series_otherindex(self):
+        data = pandas.Series(['abc', 'xyz'], index=['x', 'y'])
+        candidates = regex_candidates(data, re.compile('^a'))
+        self.assertEqual(candidates.to_dict(), {'y': 'xyz'})
+
+    def test_validate_regex(self):
+        data = pandas.Series(['46532', '4320', '60632', 123])
+        with self.assertRaises(ValidationError) as cm:
+            validate.regex(data, r'^\d{5}$')
+        expected = [Invalid('4320'), Invalid(123)]
+        self.assertEqual(cm.exception.differences, expected)
+
+
+
+@unittest.skipUnless(numpy, 'requires numpy')
+class TestUniqueCandidates(unittest.TestCase):
+    def test_unsupported_objects(self):
+        self.assertIsNone(unique_candidates([1, 2, 2]))
+        self.assertIsNone(unique_candidates(numpy.array([[1, 2], [1, 2]])))
+        self.assertIsNone(unique_candidates(numpy.array([1, 'a'], dtype=object)))
+
+    def test_array(self):
+        data = numpy.array([3, 1, 2, 1, 3, 3])
+        candidates = unique_candidates(data)
+        self.assertEqual(candidates.tolist(), [3, 1, 1, 3, 3])
+
+        data = numpy.array(['a', 'b', 'c'])
+        self.assertEqual(unique_candidates(data).tolist(), [])
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_series(self):
+        data = pandas.Series(['a', 'b', 'a', 'c'])
+        self.assertEqual(list(unique_candidates(data)), ['a', 'a'])
+
+        data = pandas.Series(['a', 'a'], index=['x', 'y'])
+        self.assertIsNone(unique_candidates(data))  # <- Normalized as mapping.
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_dataframe(self):
+        data = pandas.DataFrame({'A': ['x', 'x', 'y'], 'B': [1, 1, 1]})
+        candidates = unique_candidates(data)
+        self.assertEqual([tuple(x) for x in candidates], [('x', 1), ('x', 1)])
+
+    def test_validate_unique(self):
+        data = [1.0, 2.0, 1.0, float('nan'), 1.0, float('nan'), 3.0, 2.0]
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.unique(data)
+        unvectorized = cm.exception.differences
+        self.assertEqual(unvectorized, [Extra(1.0), Extra(1.0), Extra(2.0)])
+
+        with self.assertRaises(ValidationError) as cm:
+            validate.unique(numpy.array(data))
+        self.assertEqual(cm.exception.differences, unvectorized)
+
+        validator = validate.compile(kind='unique')
+        self.assertFalse(validator.is_valid(numpy.array(data)))
+        self.assertTrue(validator.is_valid(numpy.arange(100)))
+
+    @unittest.skipUnless(pandas, 'requires pandas')
+    def test_validate_unique_series(self):
+        data = pandas.Series(['a', 'b', 'a', 'c', 'a'])
+        with self.assertRaises(ValidationError) as cm:
+            validate.unique(data)
+        self.assertEqual(cm.exception.differences, [Extra('a'), Extra('a')])
+
+
+if __name__ == '__main__':
+    unittest.main()